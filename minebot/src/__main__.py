@@ -10,6 +10,7 @@ import lightbulb
 
 from core import GlobalState
 from database import close_database, initialize_database
+from database.services import PunishmentLogService
 from debug import get_logger, setup_logging
 from exceptions.command import CommandExecutionError
 from exceptions.utility import EmptyException
@@ -42,6 +43,14 @@ if __name__ == "__main__":
             intents=hikari.Intents.ALL,
             suppress_optimization_warning=True,
             banner=None,
+            # hikari's REST client keeps a limiter per Discord rate limit bucket, learned from the
+            # X-RateLimit-Bucket headers, and holds requests back while a bucket is exhausted, so
+            # REST calls are neither gated nor wrapped in retries of their own. Any 429 that still
+            # happens is waited out using Discord's retry_after, server errors are retried with
+            # backoff, and rate limits longer than max_rate_limit seconds raise
+            # RateLimitTooLongError instead
+            max_rate_limit=300,
+            max_retries=3,
         )
 
         client = lightbulb.client_from_app(
@@ -75,7 +84,7 @@ if __name__ == "__main__":
                     MessageHelper(
                         key=MessageKeys.error.COMMAND_ON_COOLDOWN,
                         locale=exc.context.interaction.locale,
-                        remaining_cooldown=TimeHelper(
+                        remaining_cooldown=TimeHelper.for_locale(
                             exc.context.interaction.locale
                         ).from_timedelta(timedelta(seconds=exc.causes[0].remaining)),
                     ).decode(),
@@ -108,7 +117,7 @@ if __name__ == "__main__":
             WikiHelper.load_wiki_data()
 
             # Import menu for suggest command
-            if CommandHelper(CommandsKeys.SUGGEST).command_enabled:
+            if CommandHelper.get(CommandsKeys.SUGGEST).command_enabled:
                 from components.menus.suggest import SuggestConfirmMenu
 
                 menu = SuggestConfirmMenu()
@@ -130,7 +139,15 @@ if __name__ == "__main__":
         async def on_stopping(_: hikari.StoppingEvent) -> None:
             logger.info("Stopping bot")
             await websocket.stop()
+            from helper import MessageHelper
+
+            await MessageHelper.drain_background_sends()
             await client.stop()
+            from helper import UnbanScheduler
+
+            await UnbanScheduler.stop()
+            GlobalState.tasks.cancel_all()
+            await PunishmentLogService.flush_punishment_log_writes()
             await close_database()
 
         # Prepare status
@@ -1,7 +1,14 @@
+import asyncio
+from logging import Logger
+from typing import Awaitable, Callable
+
 import hikari
 import lightbulb
 
 from data_types import TimedDict, TimedSet
+from debug import get_logger
+
+logger: Logger = get_logger(__name__)
 
 
 class BotState:
@@ -50,7 +57,7 @@ class BotState:
 
 class GuildState:
     _locale: hikari.Locale | None = None
-    _booster_role: hikari.Role | None = None
+    _booster_role_id: hikari.Snowflake | None = None
 
     @staticmethod
     def set_locale(locale: hikari.Locale) -> None:
@@ -65,14 +72,14 @@ class GuildState:
         return GuildState._locale
 
     @staticmethod
-    def set_booster_role(role: hikari.Role | None) -> None:
-        """Set the booster role for the guild."""
-        GuildState._booster_role = role
+    def set_booster_role_id(role_id: hikari.Snowflake | None) -> None:
+        """Set the booster role ID for the guild."""
+        GuildState._booster_role_id = role_id
 
     @staticmethod
-    def get_booster_role() -> hikari.Role | None:
-        """Get the booster role for the guild."""
-        return GuildState._booster_role
+    def get_booster_role_id() -> hikari.Snowflake | None:
+        """Get the booster role ID for the guild."""
+        return GuildState._booster_role_id
 
 
 class CommandState:
@@ -110,6 +117,7 @@ class MinecraftState:
     """Manages Minecraft-related state data."""
 
     _minecraft_servers: list[str] = []
+    _server_set: frozenset[str] | None = None  # Built lazily, reset whenever the list changes
     _online_players: TimedSet[str] = TimedSet[str](10)
     _player_uuids: TimedDict[str, str] = TimedDict[str, str](10)
     _player_servers: TimedDict[str, str] = TimedDict[str, str](10)
@@ -121,6 +129,7 @@ class MinecraftState:
             MinecraftState._minecraft_servers.append(servers)
         else:
             MinecraftState._minecraft_servers.extend(servers)
+        MinecraftState._server_set = None
 
     @staticmethod
     def get_servers() -> list[str]:
@@ -129,6 +138,13 @@ class MinecraftState:
             MinecraftState._minecraft_servers.copy()
         )  # Return a copy to prevent external modification
 
+    @staticmethod
+    def get_server_set() -> frozenset[str]:
+        """Get the Minecraft servers as a frozenset, cached until the list changes."""
+        if MinecraftState._server_set is None:
+            MinecraftState._server_set = frozenset(MinecraftState._minecraft_servers)
+        return MinecraftState._server_set
+
     @staticmethod
     def contains_server(server: str) -> bool:
         """Check if a Minecraft server is in the list."""
@@ -138,6 +154,7 @@ class MinecraftState:
     def clear_servers() -> None:
         """Clear the list of Minecraft servers."""
         MinecraftState._minecraft_servers.clear()
+        MinecraftState._server_set = None
 
     @staticmethod
     def add_online_player(player: str) -> None:
@@ -173,7 +190,7 @@ class MinecraftState:
 class TasksState:
     """Manages scheduled tasks for the bot."""
 
-    _tasks: dict[tuple[int, str], lightbulb.Task] = {}
+    _tasks: dict[tuple[int, str], asyncio.Task[None]] = {}
 
     @staticmethod
     def _get_key(user: hikari.User | int, punishment_type: str) -> tuple[int, str]:
@@ -181,19 +198,62 @@ class TasksState:
         user_id = user.id if isinstance(user, hikari.User) else user
         return (user_id, punishment_type)
 
+    @staticmethod
+    async def _run_after(delay: float, callback: Callable[[], Awaitable[None]]) -> None:
+        """Wait for the delay, then run the callback, logging any error it raises."""
+        await asyncio.sleep(delay)
+        try:
+            await callback()
+        except Exception:
+            logger.exception("Scheduled task failed")
+
+    @staticmethod
+    def schedule(
+        user: hikari.User | int,
+        punishment_type: str,
+        delay: float,
+        callback: Callable[[], Awaitable[None]],
+    ) -> asyncio.Task[None]:
+        """
+        Run a callback once after a delay, replacing any task of the user and punishment type.
+
+        The task only keeps the callback alive until it runs, so nothing else a caller had in
+        scope is retained for the length of the delay.
+
+        Args:
+            user: User object or user ID
+            punishment_type: Type of punishment associated with the task
+            delay: Seconds to wait before running the callback
+            callback: Creates the coroutine to run
+
+        Returns:
+            asyncio.Task: The scheduled task
+        """
+        key = TasksState._get_key(user, punishment_type)
+        task = asyncio.create_task(TasksState._run_after(delay, callback))
+        TasksState.add_or_refresh_task(user, punishment_type, task)
+
+        def forget(finished: asyncio.Task[None]) -> None:
+            # The callback may have scheduled a successor under the same key
+            if TasksState._tasks.get(key) is finished:
+                del TasksState._tasks[key]
+
+        task.add_done_callback(forget)
+        return task
+
     @staticmethod
     def has_task(user: hikari.User | int, punishment_type: str) -> bool:
         """Check if a task exists for the given user and punishment type."""
         return TasksState._get_key(user, punishment_type) in TasksState._tasks
 
     @staticmethod
-    def get_task(user: hikari.User | int, punishment_type: str) -> lightbulb.Task | None:
+    def get_task(user: hikari.User | int, punishment_type: str) -> asyncio.Task[None] | None:
         """Get a task for a user and punishment type if it exists."""
         key = TasksState._get_key(user, punishment_type)
         return TasksState._tasks.get(key)
 
     @staticmethod
-    def add_task(user: hikari.User | int, punishment_type: str, task: lightbulb.Task) -> bool:
+    def add_task(user: hikari.User | int, punishment_type: str, task: asyncio.Task[None]) -> bool:
         """
         Add a task to the state.
 
@@ -213,19 +273,25 @@ class TasksState:
 
     @staticmethod
     def add_or_refresh_task(
-        user: hikari.User | int, punishment_type: str, task: lightbulb.Task
+        user: hikari.User | int, punishment_type: str, task: asyncio.Task[None]
     ) -> None:
         """Add a new task or refresh an existing one without raising errors."""
         key = TasksState._get_key(user, punishment_type)
-        # Cancel existing task if present
+        # Cancel existing task if present, unless it is the one scheduling its successor
         existing_task = TasksState._tasks.get(key)
-        if existing_task and not existing_task.cancelled:
+        if (
+            existing_task
+            and not existing_task.done()
+            and existing_task is not asyncio.current_task()
+        ):
             existing_task.cancel()
         # Add new task
         TasksState._tasks[key] = task
 
     @staticmethod
-    def refresh_task(user: hikari.User | int, punishment_type: str, task: lightbulb.Task) -> bool:
+    def refresh_task(
+        user: hikari.User | int, punishment_type: str, task: asyncio.Task[None]
+    ) -> bool:
         """
         Refresh an existing task for a user and punishment type.
 
@@ -251,11 +317,19 @@ class TasksState:
             return False
 
         task = TasksState._tasks[key]
-        if not task.cancelled:
+        if not task.done():
             task.cancel()
         del TasksState._tasks[key]
         return True
 
+    @staticmethod
+    def cancel_all() -> None:
+        """Cancel every scheduled task, e.g. when the bot stops."""
+        for task in TasksState._tasks.values():
+            if not task.done():
+                task.cancel()
+        TasksState._tasks.clear()
+
     @staticmethod
     def remove_task(user: hikari.User | int, punishment_type: str) -> bool:
         """
@@ -278,7 +352,7 @@ class TasksState:
         return True
 
     @staticmethod
-    def get_all_tasks_for_user(user: hikari.User | int) -> dict[str, lightbulb.Task]:
+    def get_all_tasks_for_user(user: hikari.User | int) -> dict[str, asyncio.Task[None]]:
         """Get all tasks associated with a specific user."""
         user_id = user.id if isinstance(user, hikari.User) else user
         return {
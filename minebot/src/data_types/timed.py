@@ -103,8 +103,10 @@ class TimedSet(Generic[T]):
             self._worker_thread.start()
 
         logger.debug(
-            f"TimedSet initialized: expiration={expiration_time}s, "
-            f"type={item_type.__name__}, lazy={lazy_expiration}"
+            "TimedSet initialized: expiration=%ss, type=%s, lazy=%s",
+            expiration_time,
+            item_type.__name__,
+            lazy_expiration,
         )
 
     def _expire_items_periodically(self) -> None:
@@ -156,7 +158,7 @@ class TimedSet(Generic[T]):
                 self._rebuild_expiration_heap()
 
             if removed_count > 0:
-                logger.debug(f"TimedSet: removed {removed_count} expired items")
+                logger.debug("TimedSet: removed %s expired items", removed_count)
 
     def _rebuild_expiration_heap(self) -> None:
         """Rebuild the expiration heap to remove stale entries."""
@@ -228,7 +230,7 @@ class TimedSet(Generic[T]):
             )
         else:
             logger.debug(
-                f"TimedSet: rebuilt expiration heap with {len(self._expiration_heap)} items"
+                "TimedSet: rebuilt expiration heap with %s items", len(self._expiration_heap)
             )
 
     def _check_expiration_if_lazy(self) -> None:
@@ -299,10 +301,10 @@ class TimedSet(Generic[T]):
 
             if batch_size == 1:
                 logger.debug(
-                    f"TimedSet: added item '{items[0]}', expires in {self.expiration_time}s"
+                    "TimedSet: added item '%s', expires in %ss", items[0], self.expiration_time
                 )
             else:
-                logger.debug(f"TimedSet: added {batch_size} items")
+                logger.debug("TimedSet: added %s items", batch_size)
 
     def remove(self, item_or_items: T | Iterable[T]) -> int:
         """
@@ -349,9 +351,9 @@ class TimedSet(Generic[T]):
 
             if removed_count > 0:
                 if len(items) == 1:
-                    logger.debug(f"TimedSet: removed item '{items[0]}'")
+                    logger.debug("TimedSet: removed item '%s'", items[0])
                 else:
-                    logger.debug(f"TimedSet: removed {removed_count} of {len(items)} items")
+                    logger.debug("TimedSet: removed %s of %s items", removed_count, len(items))
 
             return removed_count
 
@@ -363,7 +365,7 @@ class TimedSet(Generic[T]):
             self._expiration_heap.clear()
             self._expired_items_count = 0
             self._sequence_counter = 0
-            logger.debug(f"TimedSet: cleared {item_count} items")
+            logger.debug("TimedSet: cleared %s items", item_count)
 
     def contains(self, item: T) -> bool:
         """
@@ -432,7 +434,7 @@ class TimedSet(Generic[T]):
             if self._expired_items_count > self._cleanup_threshold:
                 self._rebuild_expiration_heap()
 
-            logger.debug(f"TimedSet: extended item '{item}' expiration by {extra_time}s")
+            logger.debug("TimedSet: extended item '%s' expiration by %ss", item, extra_time)
             return True
 
     def items_with_expiry(self) -> dict[T, float]:
@@ -592,8 +594,10 @@ class TimedDict(Generic[K, V]):
             self._worker_thread.start()
 
         logger.debug(
-            f"TimedDict initialized: expiration={expiration_time}s, "
-            f"key_type={key_type.__name__}, lazy={lazy_expiration}"
+            "TimedDict initialized: expiration=%ss, key_type=%s, lazy=%s",
+            expiration_time,
+            key_type.__name__,
+            lazy_expiration,
         )
 
     def _expire_entries_periodically(self) -> None:
@@ -648,7 +652,7 @@ class TimedDict(Generic[K, V]):
                 self._rebuild_expiration_heap()
 
             if removed_count > 0:
-                logger.debug(f"TimedDict: removed {removed_count} expired entries")
+                logger.debug("TimedDict: removed %s expired entries", removed_count)
 
     def _rebuild_expiration_heap(self) -> None:
         """Rebuild the expiration heap to remove stale entries."""
@@ -719,7 +723,7 @@ class TimedDict(Generic[K, V]):
             )
         else:
             logger.debug(
-                f"TimedDict: rebuilt expiration heap with {len(self._expiration_heap)} entries"
+                "TimedDict: rebuilt expiration heap with %s entries", len(self._expiration_heap)
             )
 
     def _check_expiration_if_lazy(self) -> None:
@@ -761,7 +765,7 @@ class TimedDict(Generic[K, V]):
             if self._condition is not None:
                 self._condition.notify()
 
-            logger.debug(f"TimedDict: set key '{key}', expires in {self.expiration_time}s")
+            logger.debug("TimedDict: set key '%s', expires in %ss", key, self.expiration_time)
 
     def __getitem__(self, key: K) -> V:
         """
@@ -819,7 +823,7 @@ class TimedDict(Generic[K, V]):
             self._check_expiration_if_lazy()
             if key in self._entries:
                 value, _ = self._entries.pop(key)
-                logger.debug(f"TimedDict: popped key '{key}'")
+                logger.debug("TimedDict: popped key '%s'", key)
                 return value
             if default is ...:
                 raise KeyError(key)
@@ -878,7 +882,7 @@ class TimedDict(Generic[K, V]):
             if self._expired_entries_count > self._cleanup_threshold:
                 self._rebuild_expiration_heap()
 
-            logger.debug(f"TimedDict: extended key '{key}' expiration by {extra_time}s")
+            logger.debug("TimedDict: extended key '%s' expiration by %ss", key, extra_time)
             return True
 
     def clear(self) -> None:
@@ -889,7 +893,7 @@ class TimedDict(Generic[K, V]):
             self._expiration_heap.clear()
             self._expired_entries_count = 0
             self._sequence_counter = 0
-            logger.debug(f"TimedDict: cleared {entry_count} entries")
+            logger.debug("TimedDict: cleared %s entries", entry_count)
 
     def contains(self, key: K) -> bool:
         """
@@ -916,7 +920,7 @@ class TimedDict(Generic[K, V]):
         with self._lock:
             if key in self._entries:
                 del self._entries[key]
-                logger.debug(f"TimedDict: deleted key '{key}'")
+                logger.debug("TimedDict: deleted key '%s'", key)
             else:
                 raise KeyError(key)
 
@@ -1035,7 +1039,7 @@ class TimedDict(Generic[K, V]):
                 heapq.heapify(self._expiration_heap)
 
             if new_heap_entries:
-                logger.debug(f"TimedDict: updated {len(new_heap_entries)} entries")
+                logger.debug("TimedDict: updated %s entries", len(new_heap_entries))
 
     def __str__(self) -> str:
         """Return a string representation of the dictionary."""
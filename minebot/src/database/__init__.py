@@ -1,12 +1,28 @@
 from .base import Base, create_engine, engine
-from .session import AsyncSessionLocal, close_database, get_db_session, initialize_database
+from . import models  # noqa: F401  # registers every table on Base.metadata
+from .session import (
+    AsyncSessionLocal,
+    call_after_commit,
+    close_database,
+    get_current_session,
+    get_db_session,
+    initialize_database,
+    use_db_session,
+)
+from .upsert import execute_insert_many, execute_update_returning, execute_upsert
 
 __all__: list[str] = [
     "Base",
     "create_engine",
     "engine",
     "AsyncSessionLocal",
+    "call_after_commit",
     "close_database",
+    "get_current_session",
     "get_db_session",
     "initialize_database",
+    "use_db_session",
+    "execute_insert_many",
+    "execute_update_returning",
+    "execute_upsert",
 ]
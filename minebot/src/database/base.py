@@ -4,6 +4,7 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import create_async_engine
 from sqlalchemy.ext.asyncio.engine import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlalchemy.orm import declarative_base
 
 from debug import get_logger
@@ -43,11 +44,16 @@ def create_engine() -> AsyncEngine:
     ensure_sqlite_folder_exists(db_url)
 
     logger.info("Creating database engine")
+    # Pool connections explicitly for every supported driver so bursts of Discord events reuse
+    # open connections instead of paying the connect and auth handshake on each session.
+    # Recycling below common server idle timeouts avoids handing out connections the server
+    # has already dropped.
     engine = create_async_engine(
         db_url,
         echo=False,
+        poolclass=AsyncAdaptedQueuePool,
         pool_pre_ping=True,
-        pool_recycle=3600,
+        pool_recycle=1800,
         pool_size=10,
         max_overflow=20,
     )
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import BigInteger, DateTime, String, Text
+from sqlalchemy import BigInteger, DateTime, Index, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.base import Base
@@ -8,6 +8,11 @@ from database.base import Base
 
 class PunishmentLog(Base):
     __tablename__: str = "punishment_logs"
+    # Latest-entry lookups filter on user and type and take the highest ID, so they become a
+    # single backward index seek instead of a filtered sort
+    __table_args__: tuple[Index, ...] = (
+        Index("ix_punishment_logs_user_id_punishment_type_id", "user_id", "punishment_type", "id"),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from sqlalchemy import BigInteger, DateTime, String
+from sqlalchemy import BigInteger, DateTime, Index, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from database.base import Base
@@ -8,6 +8,13 @@ from database.base import Base
 
 class TemporaryAction(Base):
     __tablename__: str = "temporary_actions"
+    # Latest-entry lookups filter on user and type and take the highest ID, so they become a
+    # single backward index seek instead of a filtered sort
+    __table_args__: tuple[Index, ...] = (
+        Index(
+            "ix_temporary_actions_user_id_punishment_type_id", "user_id", "punishment_type", "id"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
@@ -1,8 +1,12 @@
-from logging import Logger
+from datetime import datetime
+from functools import lru_cache
+from logging import DEBUG, Logger
+from typing import Any
 
-from sqlalchemy import Result, select
+from sqlalchemy import Result, Select, bindparam, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from database import execute_insert_many, execute_update_returning, execute_upsert
 from database.models import PunishmentLog
 from database.schemas import PunishmentLogSchema
 from debug import get_logger
@@ -10,6 +14,50 @@ from debug import get_logger
 logger: Logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _filtered_query(
+    by_user_id: bool, by_staff_id: bool, by_punishment_type: bool, limited: bool, offset: bool
+) -> Select[tuple[PunishmentLog]]:
+    """
+    Build the filtered query for one combination of filters, newest first.
+
+    Filter values are bind parameters, so a single statement object is reused for every call
+    with the same filter signature and SQLAlchemy's compiled cache hits on each execution.
+    """
+    query = select(PunishmentLog)
+
+    if by_user_id:
+        query = query.where(PunishmentLog.user_id == bindparam("user_id"))
+
+    if by_staff_id:
+        query = query.where(PunishmentLog.staff_id == bindparam("staff_id"))
+
+    if by_punishment_type:
+        query = query.where(PunishmentLog.punishment_type == bindparam("punishment_type"))
+
+    query = query.order_by(desc(PunishmentLog.id))
+
+    if limited:
+        query = query.limit(bindparam("limit"))
+
+    if offset:
+        query = query.offset(bindparam("offset"))
+
+    return query
+
+
+# Only the timestamp of the newest log is selected, so duplicate checks skip building a row
+_LATEST_CREATED_AT: Select[tuple[datetime]] = (
+    select(PunishmentLog.created_at)
+    .where(
+        PunishmentLog.user_id == bindparam("user_id"),
+        PunishmentLog.punishment_type == bindparam("punishment_type"),
+    )
+    .order_by(desc(PunishmentLog.id))
+    .limit(1)
+)
+
+
 class PunishmentLogRepository:
     """
     Repository for handling PunishmentLog database operations.
@@ -22,48 +70,60 @@ class PunishmentLogRepository:
 
     async def get_by_id(self, log_id: int) -> PunishmentLog | None:
         """Get a punishment log by ID."""
-        logger.debug(f"Fetching punishment log with ID: {log_id}")
+        logger.debug("Fetching punishment log with ID: %s", log_id)
         result: Result[tuple[PunishmentLog]] = await self.session.execute(
             select(PunishmentLog).where(PunishmentLog.id == log_id)
         )
         log = result.scalars().first()
-        logger.debug(f"Punishment log with ID {log_id} found: {log is not None}")
+        logger.debug("Punishment log with ID %s found: %s", log_id, log is not None)
         return log
 
+    async def get_latest_created_at(self, user_id: int, punishment_type: str) -> datetime | None:
+        """Get the creation time of the latest punishment log of a type for a user."""
+        logger.debug(
+            "Fetching latest %s log creation time for user ID: %s", punishment_type, user_id
+        )
+        result = await self.session.execute(
+            _LATEST_CREATED_AT, {"user_id": user_id, "punishment_type": punishment_type}
+        )
+        return result.scalar()
+
     async def get_by_user_id(self, user_id: int) -> list[PunishmentLog]:
         """Get all punishment logs for a specific user."""
-        logger.debug(f"Fetching punishment logs for user ID: {user_id}")
+        logger.debug("Fetching punishment logs for user ID: %s", user_id)
         result: Result[tuple[PunishmentLog]] = await self.session.execute(
             select(PunishmentLog).where(PunishmentLog.user_id == user_id)
         )
         logs = list(result.scalars().all())
-        logger.debug(f"Found {len(logs)} punishment logs for user ID: {user_id}")
+        logger.debug("Found %s punishment logs for user ID: %s", len(logs), user_id)
         return logs
 
     async def get_by_staff_id(self, staff_id: int) -> list[PunishmentLog]:
         """Get all punishment logs issued by a specific staff."""
-        logger.debug(f"Fetching punishment logs by staff ID: {staff_id}")
+        logger.debug("Fetching punishment logs by staff ID: %s", staff_id)
         result: Result[tuple[PunishmentLog]] = await self.session.execute(
             select(PunishmentLog).where(PunishmentLog.staff_id == staff_id)
         )
         logs = list(result.scalars().all())
-        logger.debug(f"Found {len(logs)} punishment logs by staff ID: {staff_id}")
+        logger.debug("Found %s punishment logs by staff ID: %s", len(logs), staff_id)
         return logs
 
     async def get_by_punishment_type(self, punishment_type: str) -> list[PunishmentLog]:
         """Get all punishment logs of a specific type."""
-        logger.debug(f"Fetching punishment logs of type: {punishment_type}")
+        logger.debug("Fetching punishment logs of type: %s", punishment_type)
         result: Result[tuple[PunishmentLog]] = await self.session.execute(
             select(PunishmentLog).where(PunishmentLog.punishment_type == punishment_type)
         )
         logs = list(result.scalars().all())
-        logger.debug(f"Found {len(logs)} punishment logs of type: {punishment_type}")
+        logger.debug("Found %s punishment logs of type: %s", len(logs), punishment_type)
         return logs
 
     async def create(self, log_schema: PunishmentLogSchema) -> PunishmentLog:
         """Create a new punishment log entry."""
         logger.debug(
-            f"Creating new punishment log for user ID: {log_schema.user_id}, type: {log_schema.punishment_type}"
+            "Creating new punishment log for user ID: %s, type: %s",
+            log_schema.user_id,
+            log_schema.punishment_type,
         )
         # Convert schema to model
         punishment_log = PunishmentLog(
@@ -80,37 +140,54 @@ class PunishmentLogRepository:
 
         self.session.add(punishment_log)
         await self.session.flush()
-        logger.debug(f"Created punishment log with details: {vars(punishment_log)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Created punishment log with details: %s", vars(punishment_log))
+        return punishment_log
+
+    async def create_many(self, log_schemas: list[PunishmentLogSchema]) -> list[PunishmentLog]:
+        """Create several punishment log entries with one statement, in the order given."""
+        logger.debug("Creating %s punishment logs", len(log_schemas))
+        punishment_logs: list[PunishmentLog] = await execute_insert_many(
+            self.session,
+            PunishmentLog,
+            [
+                log_schema.to_db_dict(exclude={"id"} if log_schema.id is None else None)
+                for log_schema in log_schemas
+            ],
+        )
+        logger.debug("Created punishment logs with IDs: %s", [log.id for log in punishment_logs])
+        return punishment_logs
+
+    async def upsert(self, log_schema: PunishmentLogSchema) -> PunishmentLog:
+        """Create a new punishment log entry or update it in place if the ID already exists."""
+        logger.debug("Upserting punishment log with ID: %s", log_schema.id)
+        punishment_log: PunishmentLog = await execute_upsert(
+            self.session, PunishmentLog, log_schema.to_db_dict()
+        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Upserted punishment log with details: %s", vars(punishment_log))
         return punishment_log
 
     async def update(self, log_id: int, log_schema: PunishmentLogSchema) -> PunishmentLog | None:
-        """Update an existing punishment log entry."""
-        logger.debug(f"Attempting to update punishment log ID: {log_id}")
-        punishment_log: PunishmentLog | None = await self.get_by_id(log_id)
+        """Update an existing punishment log entry, returning None if it doesn't exist."""
+        logger.debug("Attempting to update punishment log ID: %s", log_id)
+        punishment_log: PunishmentLog | None = await execute_update_returning(
+            self.session, PunishmentLog, log_id, log_schema.to_db_dict(exclude={"id"})
+        )
         if not punishment_log:
-            logger.debug(f"Punishment log ID {log_id} not found for update")
+            logger.debug("Punishment log ID %s not found for update", log_id)
             return None
 
-        # Update fields
-        punishment_log.user_id = log_schema.user_id
-        punishment_log.punishment_type = log_schema.punishment_type
-        punishment_log.reason = log_schema.reason
-        punishment_log.staff_id = log_schema.staff_id
-        punishment_log.duration = log_schema.duration
-        punishment_log.created_at = log_schema.created_at
-        punishment_log.expires_at = log_schema.expires_at
-        punishment_log.source = log_schema.source
-
-        await self.session.flush()
-        logger.debug(f"Updated punishment log with details: {vars(punishment_log)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Updated punishment log with details: %s", vars(punishment_log))
         return punishment_log
 
     async def delete(self, log_id: int) -> bool:
         """Delete a punishment log entry by ID."""
-        logger.debug(f"Attempting to delete punishment log ID: {log_id}")
+        logger.debug("Attempting to delete punishment log ID: %s", log_id)
         punishment_log: PunishmentLog | None = await self.get_by_id(log_id)
         if not punishment_log:
-            logger.debug(f"Punishment log ID {log_id} not found for deletion")
+            logger.debug("Punishment log ID %s not found for deletion", log_id)
             return False
 
         await self.session.delete(punishment_log)
@@ -134,33 +211,30 @@ class PunishmentLogRepository:
         Returns:
             A single PunishmentLog object or None if no matching logs
         """
-        from sqlalchemy import desc, select
-
         logger.debug(
-            f"Getting latest punishment log with filters: user_id={user_id}, "
-            f"staff_id={staff_id}, punishment_type={punishment_type}"
+            "Getting latest punishment log with filters: user_id=%s, staff_id=%s, punishment_type=%s",
+            user_id,
+            staff_id,
+            punishment_type,
         )
 
-        query = select(PunishmentLog)
-
-        # Apply filters
-        if user_id is not None:
-            query = query.where(PunishmentLog.user_id == user_id)
-
-        if staff_id is not None:
-            query = query.where(PunishmentLog.staff_id == staff_id)
-
-        if punishment_type is not None:
-            query = query.where(PunishmentLog.punishment_type == punishment_type)
-
-        # Get the highest ID (most recent log)
-        query = query.order_by(desc(PunishmentLog.id)).limit(1)
+        params: dict[str, Any] = {
+            "user_id": user_id,
+            "staff_id": staff_id,
+            "punishment_type": punishment_type,
+            "limit": 1,
+        }
+        query = _filtered_query(
+            user_id is not None, staff_id is not None, punishment_type is not None, True, False
+        )
 
-        result = await self.session.execute(query)
+        result = await self.session.execute(
+            query, {key: value for key, value in params.items() if value is not None}
+        )
         log = result.scalars().first()
 
         if log:
-            logger.debug(f"Found latest log with ID: {log.id}")
+            logger.debug("Found latest log with ID: %s", log.id)
         else:
             logger.debug("No matching logs found")
 
@@ -187,38 +261,27 @@ class PunishmentLogRepository:
         Returns:
             List of PunishmentLog objects matching the criteria
         """
-        from sqlalchemy import desc, select
-
         logger.debug(
-            f"Building filtered query with parameters: user_id={user_id}, "
-            f"staff_id={staff_id}, punishment_type={punishment_type}"
+            "Building filtered query with parameters: user_id=%s, staff_id=%s, punishment_type=%s",
+            user_id,
+            staff_id,
+            punishment_type,
         )
 
-        query = select(PunishmentLog)
-
-        # Apply filters
-        if user_id is not None:
-            query = query.where(PunishmentLog.user_id == user_id)
-
-        if staff_id is not None:
-            query = query.where(PunishmentLog.staff_id == staff_id)
-
-        if punishment_type is not None:
-            query = query.where(PunishmentLog.punishment_type == punishment_type)
-
-        # Order by ID descending (newest first)
-        query = query.order_by(desc(PunishmentLog.id))
-
-        # Apply pagination
-        if limit is not None:
-            query = query.limit(limit)
-
-        if offset is not None:
-            query = query.offset(offset)
+        params: dict[str, Any] = {
+            "user_id": user_id,
+            "staff_id": staff_id,
+            "punishment_type": punishment_type,
+            "limit": limit,
+            "offset": offset,
+        }
+        query = _filtered_query(*(value is not None for value in params.values()))
 
         logger.debug("Executing filtered punishment logs query")
-        result = await self.session.execute(query)
+        result = await self.session.execute(
+            query, {key: value for key, value in params.items() if value is not None}
+        )
         logs = list(result.scalars().all())
-        logger.debug(f"Found {len(logs)} logs matching the filter criteria")
+        logger.debug("Found %s logs matching the filter criteria", len(logs))
 
         return logs
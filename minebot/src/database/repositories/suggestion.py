@@ -1,8 +1,9 @@
-from logging import Logger
+from logging import DEBUG, Logger
 
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from database import execute_update_returning, execute_upsert
 from database.models import Suggestion
 from database.schemas import SuggestionSchema
 from debug import get_logger
@@ -22,47 +23,47 @@ class SuggestionRepository:
 
     async def get_by_id(self, suggestion_id: int) -> Suggestion | None:
         """Get a suggestion by ID."""
-        logger.debug(f"Fetching suggestion with ID: {suggestion_id}")
+        logger.debug("Fetching suggestion with ID: %s", suggestion_id)
         result: Result[tuple[Suggestion]] = await self.session.execute(
             select(Suggestion).where(Suggestion.id == suggestion_id)
         )
         suggestion: Suggestion | None = result.scalars().first()
-        logger.debug(f"Suggestion with ID {suggestion_id} found: {suggestion is not None}")
+        logger.debug("Suggestion with ID %s found: %s", suggestion_id, suggestion is not None)
         return suggestion
 
     async def get_by_user_id(self, user_id: int) -> list[Suggestion]:
         """Get all suggestions from a specific user."""
-        logger.debug(f"Fetching suggestions for user ID: {user_id}")
+        logger.debug("Fetching suggestions for user ID: %s", user_id)
         result: Result[tuple[Suggestion]] = await self.session.execute(
             select(Suggestion).where(Suggestion.user_id == user_id)
         )
         suggestions = list(result.scalars().all())
-        logger.debug(f"Found {len(suggestions)} suggestions for user ID: {user_id}")
+        logger.debug("Found %s suggestions for user ID: %s", len(suggestions), user_id)
         return suggestions
 
     async def get_by_staff_id(self, staff_id: int) -> list[Suggestion]:
         """Get all suggestions handled by a specific staff member."""
-        logger.debug(f"Fetching suggestions handled by staff ID: {staff_id}")
+        logger.debug("Fetching suggestions handled by staff ID: %s", staff_id)
         result: Result[tuple[Suggestion]] = await self.session.execute(
             select(Suggestion).where(Suggestion.staff_id == staff_id)
         )
         suggestions = list(result.scalars().all())
-        logger.debug(f"Found {len(suggestions)} suggestions handled by staff ID: {staff_id}")
+        logger.debug("Found %s suggestions handled by staff ID: %s", len(suggestions), staff_id)
         return suggestions
 
     async def get_by_status(self, status: str) -> list[Suggestion]:
         """Get all suggestions with a specific status."""
-        logger.debug(f"Fetching suggestions with status: {status}")
+        logger.debug("Fetching suggestions with status: %s", status)
         result: Result[tuple[Suggestion]] = await self.session.execute(
             select(Suggestion).where(Suggestion.status == status)
         )
         suggestions = list(result.scalars().all())
-        logger.debug(f"Found {len(suggestions)} suggestions with status: {status}")
+        logger.debug("Found %s suggestions with status: %s", len(suggestions), status)
         return suggestions
 
     async def create(self, suggestion_schema: SuggestionSchema) -> Suggestion:
         """Create a new suggestion."""
-        logger.debug(f"Creating new suggestion for user ID: {suggestion_schema.user_id}")
+        logger.debug("Creating new suggestion for user ID: %s", suggestion_schema.user_id)
         # Convert schema to model
         suggestion = Suggestion(
             id=suggestion_schema.id,
@@ -74,38 +75,45 @@ class SuggestionRepository:
 
         self.session.add(suggestion)
         await self.session.flush()
-        logger.debug(f"Created suggestion with details: {vars(suggestion)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Created suggestion with details: %s", vars(suggestion))
+        return suggestion
+
+    async def upsert(self, suggestion_schema: SuggestionSchema) -> Suggestion:
+        """Create a new suggestion or update it in place if the ID already exists."""
+        logger.debug("Upserting suggestion with ID: %s", suggestion_schema.id)
+        suggestion: Suggestion = await execute_upsert(
+            self.session, Suggestion, suggestion_schema.to_db_dict()
+        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Upserted suggestion with details: %s", vars(suggestion))
         return suggestion
 
     async def update(
         self, suggestion_id: int, suggestion_schema: SuggestionSchema
     ) -> Suggestion | None:
-        """Update an existing suggestion."""
-        logger.debug(f"Attempting to update suggestion ID: {suggestion_id}")
-        suggestion: Suggestion | None = await self.get_by_id(suggestion_id)
+        """Update an existing suggestion, returning None if it doesn't exist."""
+        logger.debug("Attempting to update suggestion ID: %s", suggestion_id)
+        suggestion: Suggestion | None = await execute_update_returning(
+            self.session, Suggestion, suggestion_id, suggestion_schema.to_db_dict(exclude={"id"})
+        )
         if not suggestion:
-            logger.debug(f"Suggestion ID {suggestion_id} not found for update")
+            logger.debug("Suggestion ID %s not found for update", suggestion_id)
             return None
 
-        # Update fields
-        suggestion.user_id = suggestion_schema.user_id
-        suggestion.staff_id = suggestion_schema.staff_id
-        suggestion.suggestion = suggestion_schema.suggestion
-        suggestion.status = suggestion_schema.status
-
-        await self.session.flush()
-        logger.debug(f"Updated suggestion with details: {vars(suggestion)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Updated suggestion with details: %s", vars(suggestion))
         return suggestion
 
     async def delete(self, suggestion_id: int) -> bool:
         """Delete a suggestion by ID."""
-        logger.debug(f"Attempting to delete suggestion ID: {suggestion_id}")
+        logger.debug("Attempting to delete suggestion ID: %s", suggestion_id)
         suggestion: Suggestion | None = await self.get_by_id(suggestion_id)
         if not suggestion:
-            logger.debug(f"Suggestion ID {suggestion_id} not found for deletion")
+            logger.debug("Suggestion ID %s not found for deletion", suggestion_id)
             return False
 
         await self.session.delete(suggestion)
         await self.session.flush()
-        logger.debug(f"Deleted suggestion ID: {suggestion_id}")
+        logger.debug("Deleted suggestion ID: %s", suggestion_id)
         return True
@@ -1,8 +1,11 @@
-from logging import Logger
+from functools import lru_cache
+from logging import DEBUG, Logger
+from typing import Any, AsyncIterator, Iterable, cast
 
-from sqlalchemy import Result, select
+from sqlalchemy import CursorResult, Result, Select, bindparam, delete, desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from database import execute_update_returning, execute_upsert
 from database.models import TemporaryAction
 from database.schemas import TemporaryActionSchema
 from debug import get_logger
@@ -10,6 +13,38 @@ from debug import get_logger
 logger: Logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _filtered_query(
+    by_user_id: bool, by_staff_id: bool, by_punishment_type: bool, limited: bool, offset: bool
+) -> Select[tuple[TemporaryAction]]:
+    """
+    Build the filtered query for one combination of filters, newest first.
+
+    Filter values are bind parameters, so a single statement object is reused for every call
+    with the same filter signature and SQLAlchemy's compiled cache hits on each execution.
+    """
+    query = select(TemporaryAction)
+
+    if by_user_id:
+        query = query.where(TemporaryAction.user_id == bindparam("user_id"))
+
+    if by_staff_id:
+        query = query.where(TemporaryAction.staff_id == bindparam("staff_id"))
+
+    if by_punishment_type:
+        query = query.where(TemporaryAction.punishment_type == bindparam("punishment_type"))
+
+    query = query.order_by(desc(TemporaryAction.id))
+
+    if limited:
+        query = query.limit(bindparam("limit"))
+
+    if offset:
+        query = query.offset(bindparam("offset"))
+
+    return query
+
+
 class TemporaryActionRepository:
     """
     Repository for handling TemporaryAction database operations.
@@ -22,32 +57,32 @@ class TemporaryActionRepository:
 
     async def get_by_id(self, action_id: int) -> TemporaryAction | None:
         """Get a temporary action by ID."""
-        logger.debug(f"Fetching temporary action with ID: {action_id}")
+        logger.debug("Fetching temporary action with ID: %s", action_id)
         result: Result[tuple[TemporaryAction]] = await self.session.execute(
             select(TemporaryAction).where(TemporaryAction.id == action_id)
         )
         action = result.scalars().first()
-        logger.debug(f"Temporary action with ID {action_id} found: {action is not None}")
+        logger.debug("Temporary action with ID %s found: %s", action_id, action is not None)
         return action
 
     async def get_by_user_id(self, user_id: int) -> list[TemporaryAction]:
         """Get all temporary actions for a specific user."""
-        logger.debug(f"Fetching temporary actions for user ID: {user_id}")
+        logger.debug("Fetching temporary actions for user ID: %s", user_id)
         result: Result[tuple[TemporaryAction]] = await self.session.execute(
             select(TemporaryAction).where(TemporaryAction.user_id == user_id)
         )
         actions = list(result.scalars().all())
-        logger.debug(f"Found {len(actions)} temporary actions for user ID: {user_id}")
+        logger.debug("Found %s temporary actions for user ID: %s", len(actions), user_id)
         return actions
 
     async def get_by_punishment_type(self, punishment_type: str) -> list[TemporaryAction]:
         """Get all temporary actions of a specific type."""
-        logger.debug(f"Fetching temporary actions of type: {punishment_type}")
+        logger.debug("Fetching temporary actions of type: %s", punishment_type)
         result: Result[tuple[TemporaryAction]] = await self.session.execute(
             select(TemporaryAction).where(TemporaryAction.punishment_type == punishment_type)
         )
         actions = list(result.scalars().all())
-        logger.debug(f"Found {len(actions)} temporary actions of type: {punishment_type}")
+        logger.debug("Found %s temporary actions of type: %s", len(actions), punishment_type)
         return actions
 
     async def get_all(self) -> list[TemporaryAction]:
@@ -55,13 +90,24 @@ class TemporaryActionRepository:
         logger.debug("Fetching all temporary actions")
         result: Result[tuple[TemporaryAction]] = await self.session.execute(select(TemporaryAction))
         actions = list(result.scalars().all())
-        logger.debug(f"Found {len(actions)} temporary actions in total")
+        logger.debug("Found %s temporary actions in total", len(actions))
         return actions
 
+    async def stream_all(self, batch_size: int = 100) -> AsyncIterator[TemporaryAction]:
+        """Iterate over all temporary actions through a server-side cursor, batch by batch."""
+        logger.debug("Streaming all temporary actions in batches of %s", batch_size)
+        result = await self.session.stream_scalars(
+            select(TemporaryAction).execution_options(yield_per=batch_size)
+        )
+        async for action in result:
+            yield action
+
     async def create(self, action_schema: TemporaryActionSchema) -> TemporaryAction:
         """Create a new temporary action."""
         logger.debug(
-            f"Creating new temporary action for user ID: {action_schema.user_id}, type: {action_schema.punishment_type}"
+            "Creating new temporary action for user ID: %s, type: %s",
+            action_schema.user_id,
+            action_schema.punishment_type,
         )
         # Convert schema to model
         temporary_action = TemporaryAction(
@@ -75,42 +121,64 @@ class TemporaryActionRepository:
 
         self.session.add(temporary_action)
         await self.session.flush()
-        logger.debug(f"Created temporary action with details: {vars(temporary_action)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Created temporary action with details: %s", vars(temporary_action))
+        return temporary_action
+
+    async def upsert(self, action_schema: TemporaryActionSchema) -> TemporaryAction:
+        """Create a new temporary action or update it in place if the ID already exists."""
+        logger.debug("Upserting temporary action with ID: %s", action_schema.id)
+        temporary_action: TemporaryAction = await execute_upsert(
+            self.session, TemporaryAction, action_schema.to_db_dict()
+        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Upserted temporary action with details: %s", vars(temporary_action))
         return temporary_action
 
     async def update(
         self, action_id: int, action_schema: TemporaryActionSchema
     ) -> TemporaryAction | None:
-        """Update an existing temporary action."""
-        logger.debug(f"Attempting to update temporary action ID: {action_id}")
-        temporary_action: TemporaryAction | None = await self.get_by_id(action_id)
+        """Update an existing temporary action, returning None if it doesn't exist."""
+        logger.debug("Attempting to update temporary action ID: %s", action_id)
+        temporary_action: TemporaryAction | None = await execute_update_returning(
+            self.session, TemporaryAction, action_id, action_schema.to_db_dict(exclude={"id"})
+        )
         if not temporary_action:
-            logger.debug(f"Temporary action ID {action_id} not found for update")
+            logger.debug("Temporary action ID %s not found for update", action_id)
             return None
 
-        # Update fields
-        temporary_action.user_id = action_schema.user_id
-        temporary_action.punishment_type = action_schema.punishment_type
-        temporary_action.created_at = action_schema.created_at
-        temporary_action.expires_at = action_schema.expires_at
-        temporary_action.refresh_at = action_schema.refresh_at
-
-        await self.session.flush()
-        logger.debug(f"Updated temporary action with details: {vars(temporary_action)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Updated temporary action with details: %s", vars(temporary_action))
         return temporary_action
 
     async def delete(self, action_id: int) -> bool:
         """Delete a temporary action by ID."""
-        logger.debug(f"Attempting to delete temporary action ID: {action_id}")
+        logger.debug("Attempting to delete temporary action ID: %s", action_id)
         temporary_action: TemporaryAction | None = await self.get_by_id(action_id)
         if not temporary_action:
-            logger.debug(f"Temporary action ID {action_id} not found for deletion")
+            logger.debug("Temporary action ID %s not found for deletion", action_id)
             return False
 
         await self.session.delete(temporary_action)
         await self.session.flush()
         return True
 
+    async def delete_many(self, action_ids: Iterable[int]) -> int:
+        """Delete all temporary actions whose ID is in the given IDs with a single statement."""
+        id_tuple: tuple[int, ...] = tuple(action_ids)
+        logger.debug("Deleting temporary actions with IDs: %s", id_tuple)
+        if not id_tuple:
+            return 0
+
+        result = cast(
+            CursorResult[Any],
+            await self.session.execute(
+                delete(TemporaryAction).where(TemporaryAction.id.in_(id_tuple))
+            ),
+        )
+        logger.debug("Deleted %s of %s temporary actions", result.rowcount, len(id_tuple))
+        return result.rowcount
+
     async def get_latest_filtered_log(
         self,
         user_id: int | None = None,
@@ -128,33 +196,30 @@ class TemporaryActionRepository:
         Returns:
             A single PunishmentLog object or None if no matching logs
         """
-        from sqlalchemy import desc, select
-
         logger.debug(
-            f"Getting latest punishment log with filters: user_id={user_id}, "
-            f"staff_id={staff_id}, punishment_type={punishment_type}"
+            "Getting latest punishment log with filters: user_id=%s, staff_id=%s, punishment_type=%s",
+            user_id,
+            staff_id,
+            punishment_type,
         )
 
-        query = select(TemporaryAction)
-
-        # Apply filters
-        if user_id is not None:
-            query = query.where(TemporaryAction.user_id == user_id)
-
-        if staff_id is not None:
-            query = query.where(TemporaryAction.staff_id == staff_id)
-
-        if punishment_type is not None:
-            query = query.where(TemporaryAction.punishment_type == punishment_type)
-
-        # Get the highest ID (most recent log)
-        query = query.order_by(desc(TemporaryAction.id)).limit(1)
+        params: dict[str, Any] = {
+            "user_id": user_id,
+            "staff_id": staff_id,
+            "punishment_type": punishment_type,
+            "limit": 1,
+        }
+        query = _filtered_query(
+            user_id is not None, staff_id is not None, punishment_type is not None, True, False
+        )
 
-        result = await self.session.execute(query)
+        result = await self.session.execute(
+            query, {key: value for key, value in params.items() if value is not None}
+        )
         log = result.scalars().first()
 
         if log:
-            logger.debug(f"Found latest log with ID: {log.id}")
+            logger.debug("Found latest log with ID: %s", log.id)
         else:
             logger.debug("No matching logs found")
 
@@ -181,38 +246,27 @@ class TemporaryActionRepository:
         Returns:
             List of PunishmentLog objects matching the criteria
         """
-        from sqlalchemy import desc, select
-
         logger.debug(
-            f"Building filtered query with parameters: user_id={user_id}, "
-            f"staff_id={staff_id}, punishment_type={punishment_type}"
+            "Building filtered query with parameters: user_id=%s, staff_id=%s, punishment_type=%s",
+            user_id,
+            staff_id,
+            punishment_type,
         )
 
-        query = select(TemporaryAction)
-
-        # Apply filters
-        if user_id is not None:
-            query = query.where(TemporaryAction.user_id == user_id)
-
-        if staff_id is not None:
-            query = query.where(TemporaryAction.staff_id == staff_id)
-
-        if punishment_type is not None:
-            query = query.where(TemporaryAction.punishment_type == punishment_type)
-
-        # Order by ID descending (newest first)
-        query = query.order_by(desc(TemporaryAction.id))
-
-        # Apply pagination
-        if limit is not None:
-            query = query.limit(limit)
-
-        if offset is not None:
-            query = query.offset(offset)
+        params: dict[str, Any] = {
+            "user_id": user_id,
+            "staff_id": staff_id,
+            "punishment_type": punishment_type,
+            "limit": limit,
+            "offset": offset,
+        }
+        query = _filtered_query(*(value is not None for value in params.values()))
 
         logger.debug("Executing filtered punishment logs query")
-        result = await self.session.execute(query)
+        result = await self.session.execute(
+            query, {key: value for key, value in params.items() if value is not None}
+        )
         logs = list(result.scalars().all())
-        logger.debug(f"Found {len(logs)} logs matching the filter criteria")
+        logger.debug("Found %s logs matching the filter criteria", len(logs))
 
         return logs
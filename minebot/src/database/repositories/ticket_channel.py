@@ -1,8 +1,9 @@
-from logging import Logger
+from logging import DEBUG, Logger
 
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from database import execute_update_returning, execute_upsert
 from database.models import TicketChannel
 from database.schemas import TicketChannelSchema
 from debug import get_logger
@@ -22,37 +23,37 @@ class TicketChannelRepository:
 
     async def get_by_id(self, channel_id: int) -> TicketChannel | None:
         """Get a ticket channel by ID."""
-        logger.debug(f"Fetching ticket channel with ID: {channel_id}")
+        logger.debug("Fetching ticket channel with ID: %s", channel_id)
         result: Result[tuple[TicketChannel]] = await self.session.execute(
             select(TicketChannel).where(TicketChannel.id == channel_id)
         )
         channel = result.scalars().first()
-        logger.debug(f"Ticket channel with ID {channel_id} found: {channel is not None}")
+        logger.debug("Ticket channel with ID %s found: %s", channel_id, channel is not None)
         return channel
 
     async def get_by_owner_id(self, owner_id: int) -> list[TicketChannel]:
         """Get all ticket channels for a specific owner."""
-        logger.debug(f"Fetching ticket channels for owner ID: {owner_id}")
+        logger.debug("Fetching ticket channels for owner ID: %s", owner_id)
         result: Result[tuple[TicketChannel]] = await self.session.execute(
             select(TicketChannel).where(TicketChannel.owner_id == owner_id)
         )
         channels = list(result.scalars().all())
-        logger.debug(f"Found {len(channels)} ticket channels for owner ID: {owner_id}")
+        logger.debug("Found %s ticket channels for owner ID: %s", len(channels), owner_id)
         return channels
 
     async def get_by_category(self, category: str) -> list[TicketChannel]:
         """Get all ticket channels for a specific category."""
-        logger.debug(f"Fetching ticket channels for category: {category}")
+        logger.debug("Fetching ticket channels for category: %s", category)
         result: Result[tuple[TicketChannel]] = await self.session.execute(
             select(TicketChannel).where(TicketChannel.category == category)
         )
         channels = list(result.scalars().all())
-        logger.debug(f"Found {len(channels)} ticket channels for category: {category}")
+        logger.debug("Found %s ticket channels for category: %s", len(channels), category)
         return channels
 
     async def create(self, channel_schema: TicketChannelSchema) -> TicketChannel:
         """Create a new ticket channel."""
-        logger.debug(f"Creating new ticket channel for owner ID: {channel_schema.owner_id}")
+        logger.debug("Creating new ticket channel for owner ID: %s", channel_schema.owner_id)
         # Convert schema to model
         ticket_channel = TicketChannel(
             id=channel_schema.id,
@@ -62,36 +63,45 @@ class TicketChannelRepository:
 
         self.session.add(ticket_channel)
         await self.session.flush()
-        logger.debug(f"Created ticket channel with details: {vars(ticket_channel)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Created ticket channel with details: %s", vars(ticket_channel))
+        return ticket_channel
+
+    async def upsert(self, channel_schema: TicketChannelSchema) -> TicketChannel:
+        """Create a new ticket channel or update it in place if the ID already exists."""
+        logger.debug("Upserting ticket channel with ID: %s", channel_schema.id)
+        ticket_channel: TicketChannel = await execute_upsert(
+            self.session, TicketChannel, channel_schema.to_db_dict()
+        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Upserted ticket channel with details: %s", vars(ticket_channel))
         return ticket_channel
 
     async def update(
         self, channel_id: int, channel_schema: TicketChannelSchema
     ) -> TicketChannel | None:
-        """Update an existing ticket channel."""
-        logger.debug(f"Attempting to update ticket channel ID: {channel_id}")
-        ticket_channel: TicketChannel | None = await self.get_by_id(channel_id)
+        """Update an existing ticket channel, returning None if it doesn't exist."""
+        logger.debug("Attempting to update ticket channel ID: %s", channel_id)
+        ticket_channel: TicketChannel | None = await execute_update_returning(
+            self.session, TicketChannel, channel_id, channel_schema.to_db_dict(exclude={"id"})
+        )
         if not ticket_channel:
-            logger.debug(f"Ticket channel ID {channel_id} not found for update")
+            logger.debug("Ticket channel ID %s not found for update", channel_id)
             return None
 
-        # Update fields
-        ticket_channel.owner_id = channel_schema.owner_id
-        ticket_channel.category = channel_schema.category
-
-        await self.session.flush()
-        logger.debug(f"Updated ticket channel with details: {vars(ticket_channel)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Updated ticket channel with details: %s", vars(ticket_channel))
         return ticket_channel
 
     async def delete(self, channel_id: int) -> bool:
         """Delete a ticket channel by ID."""
-        logger.debug(f"Attempting to delete ticket channel ID: {channel_id}")
+        logger.debug("Attempting to delete ticket channel ID: %s", channel_id)
         ticket_channel: TicketChannel | None = await self.get_by_id(channel_id)
         if not ticket_channel:
-            logger.debug(f"Ticket channel ID {channel_id} not found for deletion")
+            logger.debug("Ticket channel ID %s not found for deletion", channel_id)
             return False
 
         await self.session.delete(ticket_channel)
         await self.session.flush()
-        logger.debug(f"Successfully deleted ticket channel ID: {channel_id}")
+        logger.debug("Successfully deleted ticket channel ID: %s", channel_id)
         return True
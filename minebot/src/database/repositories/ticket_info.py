@@ -1,14 +1,20 @@
-from logging import Logger
+from logging import DEBUG, Logger
 
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
+from database import execute_update_returning, execute_upsert
 from database.models import TicketInfo
 from database.schemas import TicketInfoSchema
 from debug import get_logger
 
 logger: Logger = get_logger(__name__)
 
+# TicketInfo has no relationships, so every lookup is a single query; raiseload makes any
+# relationship added later fail loudly instead of lazy loading one extra query per row
+_TICKET_INFO_LOOKUP = select(TicketInfo).options(raiseload("*"))
+
 
 class TicketInfoRepository:
     """
@@ -22,38 +28,40 @@ class TicketInfoRepository:
 
     async def get_by_id(self, ticket_id: int) -> TicketInfo | None:
         """Get a ticket by ID."""
-        logger.debug(f"Fetching ticket info with ID: {ticket_id}")
+        logger.debug("Fetching ticket info with ID: %s", ticket_id)
         result: Result[tuple[TicketInfo]] = await self.session.execute(
-            select(TicketInfo).where(TicketInfo.id == ticket_id)
+            _TICKET_INFO_LOOKUP.where(TicketInfo.id == ticket_id)
         )
         ticket = result.scalars().first()
-        logger.debug(f"Ticket info with ID {ticket_id} found: {ticket is not None}")
+        logger.debug("Ticket info with ID %s found: %s", ticket_id, ticket is not None)
         return ticket
 
     async def get_by_channel_id(self, channel_id: int) -> TicketInfo | None:
         """Get a ticket by channel ID."""
-        logger.debug(f"Fetching ticket info with channel ID: {channel_id}")
+        logger.debug("Fetching ticket info with channel ID: %s", channel_id)
         result: Result[tuple[TicketInfo]] = await self.session.execute(
-            select(TicketInfo).where(TicketInfo.channel_id == channel_id)
+            _TICKET_INFO_LOOKUP.where(TicketInfo.channel_id == channel_id)
         )
         ticket = result.scalars().first()
-        logger.debug(f"Ticket info with channel ID {channel_id} found: {ticket is not None}")
+        logger.debug("Ticket info with channel ID %s found: %s", channel_id, ticket is not None)
         return ticket
 
     async def get_by_message_id(self, message_id: int) -> TicketInfo | None:
         """Get a ticket by message ID."""
-        logger.debug(f"Fetching ticket info with message ID: {message_id}")
+        logger.debug("Fetching ticket info with message ID: %s", message_id)
         result: Result[tuple[TicketInfo]] = await self.session.execute(
-            select(TicketInfo).where(TicketInfo.message_id == message_id)
+            _TICKET_INFO_LOOKUP.where(TicketInfo.message_id == message_id)
         )
         ticket = result.scalars().first()
-        logger.debug(f"Ticket info with message ID {message_id} found: {ticket is not None}")
+        logger.debug("Ticket info with message ID %s found: %s", message_id, ticket is not None)
         return ticket
 
     async def create(self, ticket_schema: TicketInfoSchema) -> TicketInfo:
         """Create a new ticket info entry."""
         logger.debug(
-            f"Creating new ticket info with channel ID: {ticket_schema.channel_id}, message ID: {ticket_schema.message_id}"
+            "Creating new ticket info with channel ID: %s, message ID: %s",
+            ticket_schema.channel_id,
+            ticket_schema.message_id,
         )
         # Convert schema to model
         ticket_info = TicketInfo(
@@ -64,34 +72,43 @@ class TicketInfoRepository:
 
         self.session.add(ticket_info)
         await self.session.flush()
-        logger.debug(f"Created ticket info with details: {vars(ticket_info)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Created ticket info with details: %s", vars(ticket_info))
+        return ticket_info
+
+    async def upsert(self, ticket_schema: TicketInfoSchema) -> TicketInfo:
+        """Create a new ticket info entry or update it in place if the ID already exists."""
+        logger.debug("Upserting ticket info with ID: %s", ticket_schema.id)
+        ticket_info: TicketInfo = await execute_upsert(
+            self.session, TicketInfo, ticket_schema.to_db_dict()
+        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Upserted ticket info with details: %s", vars(ticket_info))
         return ticket_info
 
     async def update(self, ticket_id: int, ticket_schema: TicketInfoSchema) -> TicketInfo | None:
-        """Update an existing ticket info entry."""
-        logger.debug(f"Attempting to update ticket info with ID: {ticket_id}")
-        ticket_info: TicketInfo | None = await self.get_by_id(ticket_id)
+        """Update an existing ticket info entry, returning None if it doesn't exist."""
+        logger.debug("Attempting to update ticket info with ID: %s", ticket_id)
+        ticket_info: TicketInfo | None = await execute_update_returning(
+            self.session, TicketInfo, ticket_id, ticket_schema.to_db_dict(exclude={"id"})
+        )
         if not ticket_info:
-            logger.debug(f"Ticket info with ID {ticket_id} not found for update")
+            logger.debug("Ticket info with ID %s not found for update", ticket_id)
             return None
 
-        # Update fields
-        ticket_info.channel_id = ticket_schema.channel_id
-        ticket_info.message_id = ticket_schema.message_id
-
-        await self.session.flush()
-        logger.debug(f"Updated ticket info with details: {vars(ticket_info)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Updated ticket info with details: %s", vars(ticket_info))
         return ticket_info
 
     async def delete(self, ticket_id: int) -> bool:
         """Delete a ticket info entry by ID."""
-        logger.debug(f"Attempting to delete ticket info with ID: {ticket_id}")
+        logger.debug("Attempting to delete ticket info with ID: %s", ticket_id)
         ticket_info: TicketInfo | None = await self.get_by_id(ticket_id)
         if not ticket_info:
-            logger.debug(f"Ticket info with ID {ticket_id} not found for deletion")
+            logger.debug("Ticket info with ID %s not found for deletion", ticket_id)
             return False
 
         await self.session.delete(ticket_info)
         await self.session.flush()
-        logger.debug(f"Successfully deleted ticket info with ID: {ticket_id}")
+        logger.debug("Successfully deleted ticket info with ID: %s", ticket_id)
         return True
@@ -1,15 +1,23 @@
-from logging import Logger
+from logging import DEBUG, Logger
+from typing import Any, Iterable
 
 from sqlalchemy import Result, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 from sqlalchemy.orm.attributes import flag_modified
 
+from database import execute_update_returning, execute_upsert
 from database.models import User
 from database.schemas import UserSchema
 from debug import get_logger
 
 logger: Logger = get_logger(__name__)
 
+# User has no relationships and the reward inventory is a JSON column on the row, so every
+# lookup is a single query; raiseload makes any relationship added later fail loudly instead
+# of lazy loading one extra query per row
+_USER_LOOKUP = select(User).options(raiseload("*"))
+
 
 class UserRepository:
     """
@@ -23,28 +31,32 @@ class UserRepository:
 
     async def get_by_id(self, user_id: int) -> User | None:
         """Get a user by ID."""
-        logger.debug(f"Fetching user with ID: {user_id}")
+        logger.debug("Fetching user with ID: %s", user_id)
         result: Result[tuple[User]] = await self.session.execute(
-            select(User).where(User.id == user_id)
+            _USER_LOOKUP.where(User.id == user_id)
         )
         user = result.scalars().first()
-        logger.debug(f"User with ID {user_id} found: {user is not None}")
+        logger.debug("User with ID %s found: %s", user_id, user is not None)
         return user
 
     async def get_by_minecraft_username(self, minecraft_username: str) -> User | None:
         """Get a user by their Minecraft username."""
-        logger.debug(f"Fetching user with Minecraft username: {minecraft_username}")
+        logger.debug("Fetching user with Minecraft username: %s", minecraft_username)
         result: Result[tuple[User]] = await self.session.execute(
-            select(User).where(User.minecraft_username == minecraft_username)
+            _USER_LOOKUP.where(User.minecraft_username == minecraft_username)
         )
         user = result.scalars().first()
-        logger.debug(f"User with Minecraft username {minecraft_username} found: {user is not None}")
+        logger.debug(
+            "User with Minecraft username %s found: %s", minecraft_username, user is not None
+        )
         return user
 
     async def create(self, user_schema: UserSchema) -> User:
         """Create a new user."""
         logger.debug(
-            f"Creating new user with ID: {user_schema.id}, minecraft username: {user_schema.minecraft_username}"
+            "Creating new user with ID: %s, minecraft username: %s",
+            user_schema.id,
+            user_schema.minecraft_username,
         )
         # Convert schema to model
         user = User(
@@ -57,50 +69,48 @@ class UserRepository:
 
         self.session.add(user)
         await self.session.flush()
-        logger.debug(f"Created user with details: {vars(user)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Created user with details: %s", vars(user))
         return user
 
-    async def update(self, user_id: int, user_schema: UserSchema) -> User | None:
-        """Update an existing user."""
-        logger.debug(f"Attempting to update user with ID: {user_id}")
-        user: User | None = await self.get_by_id(user_id)
-        if not user:
-            logger.debug(f"User with ID {user_id} not found for update")
-            return None
-
-        # Check if there are any changes
-        has_changes: bool = (
-            user.locale != user_schema.locale
-            or user.minecraft_username != user_schema.minecraft_username
-            or user.minecraft_uuid != user_schema.minecraft_uuid
-            or user.reward_inventory != user_schema.reward_inventory
+    async def upsert(self, user_schema: UserSchema, keep_existing: Iterable[str] = ()) -> User:
+        """Create a user or update it in place, leaving the keep_existing columns untouched."""
+        logger.debug("Upserting user with ID: %s", user_schema.id)
+        user: User = await execute_upsert(
+            self.session, User, user_schema.to_db_dict(), keep_on_conflict=keep_existing
         )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Upserted user with details: %s", vars(user))
+        return user
 
-        if not has_changes:
-            logger.debug(f"No changes detected for user with ID: {user_id}")
-            return user
-
-        # Update fields
-        user.locale = user_schema.locale
-        user.minecraft_username = user_schema.minecraft_username
-        user.minecraft_uuid = user_schema.minecraft_uuid
-        user.reward_inventory = user_schema.reward_inventory
+    async def update_returning(self, user_id: int, values: dict[str, Any]) -> User | None:
+        """Update the given columns of a user in a single statement and return the stored row."""
+        logger.debug("Updating user with ID %s in place: %s", user_id, values)
+        user: User | None = await execute_update_returning(self.session, User, user_id, values)
+        if not user:
+            logger.debug("User with ID %s not found for update", user_id)
+            return None
 
-        await self.session.flush()
-        logger.debug(f"Updated user with details: {vars(user)}")
+        if logger.isEnabledFor(DEBUG):
+            logger.debug("Updated user with details: %s", vars(user))
         return user
 
+    async def update(self, user_id: int, user_schema: UserSchema) -> User | None:
+        """Update an existing user, returning None if it doesn't exist."""
+        logger.debug("Attempting to update user with ID: %s", user_id)
+        return await self.update_returning(user_id, user_schema.to_db_dict(exclude={"id"}))
+
     async def delete(self, user_id: int) -> bool:
         """Delete a user by ID."""
-        logger.debug(f"Attempting to delete user with ID: {user_id}")
+        logger.debug("Attempting to delete user with ID: %s", user_id)
         user: User | None = await self.get_by_id(user_id)
         if not user:
-            logger.debug(f"User with ID {user_id} not found for deletion")
+            logger.debug("User with ID %s not found for deletion", user_id)
             return False
 
         await self.session.delete(user)
         await self.session.flush()
-        logger.debug(f"Successfully deleted user with ID: {user_id}")
+        logger.debug("Successfully deleted user with ID: %s", user_id)
         return True
 
     async def add_item(self, user_id: int, server: str, items: str | list[str]) -> bool:
@@ -115,11 +125,11 @@ class UserRepository:
         Returns:
             True if the item(s) were added successfully, False otherwise
         """
-        logger.debug(f"Adding item(s) to user {user_id} on server {server}: {items}")
+        logger.debug("Adding item(s) to user %s on server %s: %s", user_id, server, items)
 
         user: User | None = await self.get_by_id(user_id)
         if not user:
-            logger.debug(f"User with ID {user_id} not found for adding items")
+            logger.debug("User with ID %s not found for adding items", user_id)
             return False
 
         # Normalize input to always be a list
@@ -151,6 +161,6 @@ class UserRepository:
         await self.session.flush()
 
         logger.debug(
-            f"Added items to user {user_id} inventory on server {server}: {processed_items}"
+            "Added items to user %s inventory on server %s: %s", user_id, server, processed_items
         )
         return True
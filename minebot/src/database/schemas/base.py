@@ -0,0 +1,43 @@
+from typing import Any, Callable
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from typing_extensions import Self
+
+
+class DatabaseSchema(BaseModel):
+    """Base for schemas that mirror a database table."""
+
+    model_config = ConfigDict(from_attributes=True, revalidate_instances="never", defer_build=False)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any) -> Self:
+        """
+        Build a schema from a database row without running validation.
+
+        Only use this for rows whose values were validated before they were written.
+        Input from Discord, Minecraft or the websocket must still go through model_validate.
+
+        Args:
+            obj: The model instance of the schema's table
+
+        Returns:
+            Schema populated from the row's attributes
+        """
+        return cls.model_construct(**{field: getattr(obj, field) for field in cls.model_fields})
+
+    @classmethod
+    def list_validator(cls) -> Callable[[Any], list[Self]]:
+        """
+        Build a function that validates a list of rows in a single call.
+
+        Services bind this and from_orm_trusted to module-level names at import, so the type
+        adapter is built once and converting a result skips the class attribute lookups.
+
+        Returns:
+            Function validating a list of model instances into a list of schemas
+        """
+        return TypeAdapter(list[cls]).validate_python
+
+    def to_db_dict(self, exclude: set[str] | None = None) -> dict[str, Any]:
+        """Dump the schema as column values, optionally leaving out some fields such as the ID."""
+        return self.__pydantic_serializer__.to_python(self, exclude=exclude)
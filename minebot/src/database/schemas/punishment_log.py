@@ -1,9 +1,11 @@
 from datetime import datetime, timezone
 
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt
+from pydantic import Field, PositiveInt
 
+from .base import DatabaseSchema
 
-class PunishmentLogSchema(BaseModel):
+
+class PunishmentLogSchema(DatabaseSchema):
     id: PositiveInt | None = Field(default=None)
     user_id: PositiveInt
     punishment_type: str = Field(max_length=50)
@@ -13,5 +15,3 @@ class PunishmentLogSchema(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     expires_at: datetime | None = Field(default=None)
     source: str = Field(max_length=20)
-
-    model_config = ConfigDict(from_attributes=True)
@@ -1,11 +1,11 @@
-from pydantic import BaseModel, ConfigDict, PositiveInt
+from pydantic import PositiveInt
 
+from .base import DatabaseSchema
 
-class SuggestionSchema(BaseModel):
+
+class SuggestionSchema(DatabaseSchema):
     id: PositiveInt
     user_id: PositiveInt
     staff_id: PositiveInt | None = None
     suggestion: str
     status: str
-
-    model_config = ConfigDict(from_attributes=True)
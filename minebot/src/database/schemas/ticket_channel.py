@@ -1,9 +1,9 @@
-from pydantic import BaseModel, ConfigDict, PositiveInt
+from pydantic import PositiveInt
 
+from .base import DatabaseSchema
 
-class TicketChannelSchema(BaseModel):
+
+class TicketChannelSchema(DatabaseSchema):
     id: PositiveInt
     owner_id: PositiveInt
     category: str
-
-    model_config = ConfigDict(from_attributes=True)
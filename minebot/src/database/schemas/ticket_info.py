@@ -1,9 +1,9 @@
-from pydantic import BaseModel, ConfigDict, PositiveInt
+from pydantic import PositiveInt
 
+from .base import DatabaseSchema
 
-class TicketInfoSchema(BaseModel):
+
+class TicketInfoSchema(DatabaseSchema):
     id: PositiveInt
     channel_id: PositiveInt
     message_id: PositiveInt
-
-    model_config = ConfigDict(from_attributes=True)
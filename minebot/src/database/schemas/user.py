@@ -1,13 +1,17 @@
-from pydantic import BaseModel, ConfigDict, Field, PositiveInt, field_validator
+from typing import Annotated
+
+from pydantic import Field, PositiveInt, StringConstraints, field_validator
 
 from core import GlobalState
 
+from .base import DatabaseSchema
+
 
-class UserSchema(BaseModel):
+class UserSchema(DatabaseSchema):
     id: PositiveInt
     locale: str
-    minecraft_username: str | None = Field(default=None, max_length=16)
-    minecraft_uuid: str | None = Field(default=None, max_length=36)
+    minecraft_username: Annotated[str, StringConstraints(max_length=16)] | None = None
+    minecraft_uuid: Annotated[str, StringConstraints(max_length=36)] | None = None
     reward_inventory: dict[str, list[str]] | None = Field(default=None)
 
     @field_validator("reward_inventory")
@@ -18,22 +22,18 @@ class UserSchema(BaseModel):
         if v is None or not v:  # Return early if None or empty dict
             return v
 
-        MINECRAFT_SERVERS = GlobalState.minecraft.get_servers()
+        server_set: frozenset[str] = GlobalState.minecraft.get_server_set()
 
-        # If MINECRAFT_SERVERS is empty or None, skip validation
-        if not MINECRAFT_SERVERS:
+        # If no servers are registered, skip validation
+        if not server_set:
             return v
 
-        server_set = set(MINECRAFT_SERVERS)
-
-        # Check for invalid keys
-        invalid_keys = [key for key in v if key not in server_set]
-
-        if invalid_keys:
-            raise ValueError(
-                f"Invalid server keys: {invalid_keys}. Allowed keys are: {MINECRAFT_SERVERS}"
-            )
-
-        return v
+        # Subset check short-circuits on valid input; only build the difference for the error
+        if v.keys() <= server_set:
+            return v
 
-    model_config = ConfigDict(from_attributes=True)
+        invalid_keys = v.keys() - server_set
+        raise ValueError(
+            f"Invalid server keys: {sorted(invalid_keys)}. "
+            f"Allowed keys are: {GlobalState.minecraft.get_servers()}"
+        )
@@ -1,6 +1,11 @@
+import asyncio
+from datetime import datetime
 from logging import Logger
+from typing import cast
 
-from database import get_db_session
+
+from data_types import TimedDict
+from database import call_after_commit, get_db_session
 from database.models import PunishmentLog
 from database.repositories import PunishmentLogRepository
 from database.schemas import PunishmentLogSchema
@@ -8,191 +13,372 @@ from debug import get_logger
 
 logger: Logger = get_logger(__name__)
 
+_construct_punishment_log = PunishmentLogSchema.from_orm_trusted
+_validate_punishment_log_list = PunishmentLogSchema.list_validator()
 
-class PunishmentLogService:
+# Latest log written per (user ID, punishment type). The audit-log listeners only look for a
+# log from the last two minutes to skip duplicates, so recent writes answer them from memory
+_RECENT_LOG_TTL: float = 120
+_recent_logs: TimedDict[tuple[int, str], PunishmentLogSchema] = TimedDict[
+    tuple[int, str], PunishmentLogSchema
+](_RECENT_LOG_TTL, key_type=tuple, lazy_expiration=True)
+
+
+def _remember_recent_log(log: PunishmentLogSchema) -> None:
+    """Keep a written log as the latest of its user and type unless a newer one is cached."""
+    if log.id is None:
+        return
+
+    key: tuple[int, str] = (log.user_id, log.punishment_type)
+    cached: PunishmentLogSchema | None = _recent_logs.get(key)
+    if cached is None or cached.id is None or cached.id <= log.id:
+        _recent_logs[key] = log
+
+
+def _forget_recent_log(log_id: int) -> None:
+    """Drop a deleted or updated log from the recent log cache."""
+    for key, log in _recent_logs.items():
+        if log.id == log_id:
+            _recent_logs.pop(key, None)
+
+
+# New logs waiting for the background writer, each with the future its caller awaits
+_PendingWrite = tuple[PunishmentLogSchema, asyncio.Future[PunishmentLogSchema]]
+_MAX_WRITE_BATCH: int = 100
+_pending_writes: asyncio.Queue[_PendingWrite] | None = None
+_writer_task: asyncio.Task[None] | None = None
+
+
+async def get_punishment_log(log_id: int) -> PunishmentLogSchema | None:
     """
-    Service for punishment log-related business logic and operations.
+    Get a punishment log by ID.
+
+    Args:
+        log_id: The punishment log ID
+
+    Returns:
+        PunishmentLogSchema or None if the log doesn't exist
     """
+    logger.debug("Getting punishment log with ID: %s", log_id)
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        log: PunishmentLog | None = await repository.get_by_id(log_id)
+        if log:
+            logger.debug("Found punishment log: %s", log)
+            return _construct_punishment_log(log)
+        logger.debug("No punishment log found with ID: %s", log_id)
+        return None
 
-    @staticmethod
-    async def get_punishment_log(log_id: int) -> PunishmentLogSchema | None:
-        """
-        Get a punishment log by ID.
 
-        Args:
-            log_id: The punishment log ID
+async def get_latest_punishment_log(
+    user_id: int, punishment_type: str
+) -> PunishmentLogSchema | None:
+    """
+    Get the latest punishment log of a type for a user.
 
-        Returns:
-            PunishmentLogSchema or None if the log doesn't exist
-        """
-        logger.debug(f"Getting punishment log with ID: {log_id}")
-        async with get_db_session() as session:
-            repository = PunishmentLogRepository(session)
-            log: PunishmentLog | None = await repository.get_by_id(log_id)
-            if log:
-                logger.debug(f"Found punishment log: {log}")
-                return PunishmentLogSchema.model_validate(log)
-            logger.debug(f"No punishment log found with ID: {log_id}")
-            return None
-
-    @staticmethod
-    async def get_punishment_logs_by_user(user_id: int) -> list[PunishmentLogSchema]:
-        """
-        Get all punishment logs for a specific user.
-
-        Args:
-            user_id: The Discord user ID
-
-        Returns:
-            List of PunishmentLogSchema objects
-        """
-        logger.debug(f"Getting punishment logs for user with ID: {user_id}")
-        async with get_db_session() as session:
-            repository = PunishmentLogRepository(session)
-            logs: list[PunishmentLog] = await repository.get_by_user_id(user_id)
-            logger.debug(f"Found {len(logs)} punishment logs for user {user_id}")
-            return [PunishmentLogSchema.model_validate(log) for log in logs]
-
-    @staticmethod
-    async def get_punishment_logs_by_staff(staff_id: int) -> list[PunishmentLogSchema]:
-        """
-        Get all punishment logs issued by a specific staff.
-
-        Args:
-            staff_id: The Discord moderator ID
-
-        Returns:
-            List of PunishmentLogSchema objects
-        """
-        logger.debug(f"Getting punishment logs for staff with ID: {staff_id}")
-        async with get_db_session() as session:
-            repository = PunishmentLogRepository(session)
-            logs: list[PunishmentLog] = await repository.get_by_staff_id(staff_id)
-            logger.debug(f"Found {len(logs)} punishment logs for staff {staff_id}")
-            return [PunishmentLogSchema.model_validate(log) for log in logs]
-
-    @staticmethod
-    async def get_punishment_logs_by_type(punishment_type: str) -> list[PunishmentLogSchema]:
-        """
-        Get all punishment logs of a specific type.
-
-        Args:
-            punishment_type: The type of punishment (e.g., "ban", "mute")
-
-        Returns:
-            List of PunishmentLogSchema objects
-        """
-        logger.debug(f"Getting punishment logs of type: {punishment_type}")
-        async with get_db_session() as session:
-            repository = PunishmentLogRepository(session)
-            logs: list[PunishmentLog] = await repository.get_by_punishment_type(punishment_type)
-            logger.debug(f"Found {len(logs)} punishment logs of type {punishment_type}")
-            return [PunishmentLogSchema.model_validate(log) for log in logs]
-
-    @staticmethod
-    async def create_or_update_punishment_log(log_data: PunishmentLogSchema) -> PunishmentLogSchema:
-        """
-        Create a new punishment log or update if it already exists.
-
-        Args:
-            log_data: The punishment log data to create or update
-
-        Returns:
-            The created/updated punishment log schema
-        """
-        logger.debug(f"Creating or updating punishment log: {log_data}")
-        async with get_db_session() as session:
-            repository = PunishmentLogRepository(session)
+    Logs written in the last two minutes are served from memory, which covers the duplicate
+    checks the audit-log listeners run right after a command issued the punishment.
 
-            # Check if we have an ID and if it exists in the database
-            if log_data.id is not None:
-                logger.debug(f"Checking if punishment log with ID {log_data.id} exists")
-                existing_log: PunishmentLog | None = await repository.get_by_id(log_data.id)
-                if existing_log:
-                    logger.debug(f"Updating existing punishment log with ID: {log_data.id}")
-                    updated_log: PunishmentLog | None = await repository.update(
-                        log_data.id, log_data
-                    )
-                    logger.debug(f"Updated punishment log: {updated_log}")
-                    return PunishmentLogSchema.model_validate(updated_log)
-
-            # If no ID or record doesn't exist, create a new one
-            logger.debug("Creating new punishment log")
-            new_log: PunishmentLog = await repository.create(log_data)
-            logger.debug(f"Created new punishment log with ID: {new_log.id}")
-            return PunishmentLogSchema.model_validate(new_log)
-
-    @staticmethod
-    async def delete_punishment_log(log_id: int) -> bool:
-        """
-        Delete a punishment log by ID.
-
-        Args:
-            log_id: The punishment log ID
-
-        Returns:
-            True if the log was deleted, False otherwise
-        """
-        logger.debug(f"Attempting to delete punishment log with ID: {log_id}")
-        async with get_db_session() as session:
-            repository = PunishmentLogRepository(session)
-            result = await repository.delete(log_id)
-            logger.debug(f"Deletion result for punishment log {log_id}: {result}")
-            return result
-
-    @staticmethod
-    async def get_filtered_punishment_logs(
-        user_id: int | None = None,
-        staff_id: int | None = None,
-        punishment_type: str | None = None,
-        limit: int | None = None,
-        offset: int | None = None,
-        get_latest: bool = False,
-    ) -> None | PunishmentLogSchema | list[PunishmentLogSchema]:
-        """
-        Get punishment logs with custom filtering.
-
-        Args:
-            user_id: Optional filter by user ID
-            staff_id: Optional filter by staff ID
-            punishment_type: Optional filter by punishment type
-            limit: Optional limit on the number of results
-            offset: Optional offset for pagination
-            get_latest: If True, returns only the most recent log (not a list)
-
-        Returns:
-            Single PunishmentLogSchema if get_latest=True, otherwise list of PunishmentLogSchema objects.
-            If get_latest=True and no logs found, returns None.
-        """
-        logger.debug(
-            f"Getting filtered punishment logs with filters: "
-            f"user_id={user_id}, staff_id={staff_id}, "
-            f"punishment_type={punishment_type}, limit={limit}, offset={offset}, "
-            f"get_latest={get_latest}"
-        )
-
-        async with get_db_session() as session:
+    Args:
+        user_id: The Discord user ID
+        punishment_type: The type of punishment (e.g., "ban", "mute")
+
+    Returns:
+        The latest matching PunishmentLogSchema, or None if there is none
+    """
+    cached: PunishmentLogSchema | None = _recent_logs.get((user_id, punishment_type))
+    if cached:
+        logger.debug("Found recent %s log for user %s in cache", punishment_type, user_id)
+        return cached.model_copy()
+
+    return cast(
+        PunishmentLogSchema | None,
+        await get_filtered_punishment_logs(
+            user_id=user_id, punishment_type=punishment_type, get_latest=True
+        ),
+    )
+
+
+async def get_latest_created_at(user_id: int, punishment_type: str) -> datetime | None:
+    """
+    Get the creation time of the latest punishment log of a type for a user.
+
+    Duplicate checks only compare timestamps, so this selects the single column instead of
+    loading and constructing the whole log. Recent logs are answered from memory.
+
+    Args:
+        user_id: The Discord user ID
+        punishment_type: The type of punishment (e.g., "ban", "mute")
+
+    Returns:
+        The creation time of the latest matching log, or None if there is none
+    """
+    cached: PunishmentLogSchema | None = _recent_logs.get((user_id, punishment_type))
+    if cached:
+        logger.debug("Found recent %s log for user %s in cache", punishment_type, user_id)
+        return cached.created_at
+
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        return await repository.get_latest_created_at(user_id, punishment_type)
+
+
+async def write_punishment_log(log_data: PunishmentLogSchema) -> PunishmentLogSchema:
+    """
+    Create a new punishment log through the batched background writer.
+
+    A single background task writes queued logs. Logs queued while it is busy with the
+    previous batch are inserted together in one statement and one commit, so a burst of
+    moderation events costs one round trip per batch rather than one per log, while a lone
+    log is still written right away. Logs that already have an ID are updated directly.
+
+    Args:
+        log_data: The punishment log to create
+
+    Returns:
+        The created punishment log schema
+    """
+    if log_data.id is not None:
+        return await create_or_update_punishment_log(log_data)
+
+    global _pending_writes, _writer_task
+    if _pending_writes is None:
+        _pending_writes = asyncio.Queue()
+    if _writer_task is None or _writer_task.done():
+        _writer_task = asyncio.create_task(_write_pending_logs(_pending_writes))
+
+    future: asyncio.Future[PunishmentLogSchema] = asyncio.get_running_loop().create_future()
+    _pending_writes.put_nowait((log_data, future))
+    return await future
+
+
+async def flush_punishment_log_writes() -> None:
+    """
+    Wait for every queued punishment log to be written, then stop the background writer.
+
+    Call this during shutdown, before the database is closed.
+    """
+    global _writer_task
+    if _pending_writes is not None:
+        await _pending_writes.join()
+
+    if _writer_task is not None:
+        _writer_task.cancel()
+        _writer_task = None
+
+
+async def _write_pending_logs(pending_writes: asyncio.Queue[_PendingWrite]) -> None:
+    """Background loop that drains queued logs in batches for as long as the bot runs."""
+    while True:
+        batch: list[_PendingWrite] = [await pending_writes.get()]
+        while len(batch) < _MAX_WRITE_BATCH and not pending_writes.empty():
+            batch.append(pending_writes.get_nowait())
+
+        try:
+            await _write_log_batch(batch)
+        finally:
+            for _ in batch:
+                pending_writes.task_done()
+
+
+async def _write_log_batch(batch: list[_PendingWrite]) -> None:
+    """Insert a batch of logs in one transaction and resolve the waiting callers."""
+    logger.debug("Writing batch of %s punishment logs", len(batch))
+    try:
+        async with get_db_session(shared=False) as session:
             repository = PunishmentLogRepository(session)
+            logs: list[PunishmentLog] = await repository.create_many([log for log, _ in batch])
+            results: list[PunishmentLogSchema] = [_construct_punishment_log(log) for log in logs]
+    except Exception as e:
+        if len(batch) > 1:
+            # Retry one at a time so a single bad log does not fail the others
+            logger.warning("Batched punishment log write failed, retrying one by one: %s", e)
+            for pending_write in batch:
+                await _write_log_batch([pending_write])
+            return
+
+        if not batch[0][1].done():
+            batch[0][1].set_exception(e)
+        return
+
+    for (_, future), result in zip(batch, results):
+        _remember_recent_log(result)
+        if not future.done():
+            future.set_result(result)
+
+
+async def get_punishment_logs_by_user(user_id: int) -> list[PunishmentLogSchema]:
+    """
+    Get all punishment logs for a specific user.
+
+    Args:
+        user_id: The Discord user ID
+
+    Returns:
+        List of PunishmentLogSchema objects
+    """
+    logger.debug("Getting punishment logs for user with ID: %s", user_id)
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        logs: list[PunishmentLog] = await repository.get_by_user_id(user_id)
+        logger.debug("Found %s punishment logs for user %s", len(logs), user_id)
+        return _validate_punishment_log_list(logs)
+
+
+async def get_punishment_logs_by_staff(staff_id: int) -> list[PunishmentLogSchema]:
+    """
+    Get all punishment logs issued by a specific staff.
+
+    Args:
+        staff_id: The Discord moderator ID
 
-            if get_latest:
-                log = await repository.get_latest_filtered_log(
-                    user_id=user_id, staff_id=staff_id, punishment_type=punishment_type
-                )
-
-                if log:
-                    logger.debug(f"Found latest punishment log with ID: {log.id}")
-                    return PunishmentLogSchema.model_validate(log)
-                else:
-                    logger.debug("No matching logs found for latest filter")
-                    return None
+    Returns:
+        List of PunishmentLogSchema objects
+    """
+    logger.debug("Getting punishment logs for staff with ID: %s", staff_id)
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        logs: list[PunishmentLog] = await repository.get_by_staff_id(staff_id)
+        logger.debug("Found %s punishment logs for staff %s", len(logs), staff_id)
+        return _validate_punishment_log_list(logs)
+
+
+async def get_punishment_logs_by_type(punishment_type: str) -> list[PunishmentLogSchema]:
+    """
+    Get all punishment logs of a specific type.
+
+    Args:
+        punishment_type: The type of punishment (e.g., "ban", "mute")
+
+    Returns:
+        List of PunishmentLogSchema objects
+    """
+    logger.debug("Getting punishment logs of type: %s", punishment_type)
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        logs: list[PunishmentLog] = await repository.get_by_punishment_type(punishment_type)
+        logger.debug("Found %s punishment logs of type %s", len(logs), punishment_type)
+        return _validate_punishment_log_list(logs)
+
+
+async def create_or_update_punishment_log(log_data: PunishmentLogSchema) -> PunishmentLogSchema:
+    """
+    Create a new punishment log or update if it already exists.
+
+    Args:
+        log_data: The punishment log data to create or update
+
+    Returns:
+        The created/updated punishment log schema
+    """
+    logger.debug("Creating or updating punishment log: %s", log_data)
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        log: PunishmentLog = await repository.upsert(log_data)
+        logger.debug("Created or updated punishment log with ID: %s", log.id)
+        result: PunishmentLogSchema = _construct_punishment_log(log)
+        if (log_id := log_data.id) is None:
+            call_after_commit(session, lambda: _remember_recent_log(result))
+        else:
+            # An updated log need not be the latest one, so only drop a stale cached copy of it
+            call_after_commit(session, lambda: _forget_recent_log(log_id))
+        return result
+
+
+async def delete_punishment_log(log_id: int) -> bool:
+    """
+    Delete a punishment log by ID.
+
+    Args:
+        log_id: The punishment log ID
+
+    Returns:
+        True if the log was deleted, False otherwise
+    """
+    logger.debug("Attempting to delete punishment log with ID: %s", log_id)
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+        result = await repository.delete(log_id)
+        logger.debug("Deletion result for punishment log %s: %s", log_id, result)
+        call_after_commit(session, lambda: _forget_recent_log(log_id))
+        return result
+
+
+async def get_filtered_punishment_logs(
+    user_id: int | None = None,
+    staff_id: int | None = None,
+    punishment_type: str | None = None,
+    limit: int | None = None,
+    offset: int | None = None,
+    get_latest: bool = False,
+) -> None | PunishmentLogSchema | list[PunishmentLogSchema]:
+    """
+    Get punishment logs with custom filtering.
+
+    Args:
+        user_id: Optional filter by user ID
+        staff_id: Optional filter by staff ID
+        punishment_type: Optional filter by punishment type
+        limit: Optional limit on the number of results
+        offset: Optional offset for pagination
+        get_latest: If True, returns only the most recent log (not a list)
+
+    Returns:
+        Single PunishmentLogSchema if get_latest=True, otherwise list of PunishmentLogSchema objects.
+        If get_latest=True and no logs found, returns None.
+    """
+    logger.debug(
+        "Getting filtered punishment logs with filters: user_id=%s, staff_id=%s, punishment_type=%s, limit=%s, offset=%s, get_latest=%s",
+        user_id,
+        staff_id,
+        punishment_type,
+        limit,
+        offset,
+        get_latest,
+    )
+
+    async with get_db_session() as session:
+        repository = PunishmentLogRepository(session)
+
+        if get_latest:
+            log = await repository.get_latest_filtered_log(
+                user_id=user_id, staff_id=staff_id, punishment_type=punishment_type
+            )
+
+            if log:
+                logger.debug("Found latest punishment log with ID: %s", log.id)
+                return _construct_punishment_log(log)
             else:
-                logs = await repository.get_filtered_logs(
-                    user_id=user_id,
-                    staff_id=staff_id,
-                    punishment_type=punishment_type,
-                    limit=limit,
-                    offset=offset,
-                )
-
-                logger.debug(f"Found {len(logs)} punishment logs matching filters")
-                return [PunishmentLogSchema.model_validate(log) for log in logs]
+                logger.debug("No matching logs found for latest filter")
+                return None
+        else:
+            logs = await repository.get_filtered_logs(
+                user_id=user_id,
+                staff_id=staff_id,
+                punishment_type=punishment_type,
+                limit=limit,
+                offset=offset,
+            )
+
+            logger.debug("Found %s punishment logs matching filters", len(logs))
+            return _validate_punishment_log_list(logs)
+
+
+class PunishmentLogService:
+    """
+    Service for punishment log-related business logic and operations.
+
+    The operations are module-level functions; this class groups them under one name.
+    """
+
+    get_punishment_log = staticmethod(get_punishment_log)
+    get_latest_punishment_log = staticmethod(get_latest_punishment_log)
+    get_latest_created_at = staticmethod(get_latest_created_at)
+    write_punishment_log = staticmethod(write_punishment_log)
+    flush_punishment_log_writes = staticmethod(flush_punishment_log_writes)
+    get_punishment_logs_by_user = staticmethod(get_punishment_logs_by_user)
+    get_punishment_logs_by_staff = staticmethod(get_punishment_logs_by_staff)
+    get_punishment_logs_by_type = staticmethod(get_punishment_logs_by_type)
+    create_or_update_punishment_log = staticmethod(create_or_update_punishment_log)
+    delete_punishment_log = staticmethod(delete_punishment_log)
+    get_filtered_punishment_logs = staticmethod(get_filtered_punishment_logs)
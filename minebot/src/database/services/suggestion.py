@@ -8,134 +8,131 @@ from debug import get_logger
 
 logger: Logger = get_logger(__name__)
 
+_construct_suggestion = SuggestionSchema.from_orm_trusted
+_validate_suggestion_list = SuggestionSchema.list_validator()
+
+
+async def get_suggestion(suggestion_id: int) -> SuggestionSchema | None:
+    """
+    Get a suggestion by ID.
+
+    Args:
+        suggestion_id: The suggestion ID
+
+    Returns:
+        SuggestionSchema or None if the suggestion doesn't exist
+    """
+    logger.debug("Getting suggestion with ID: %s", suggestion_id)
+    async with get_db_session() as session:
+        repository = SuggestionRepository(session)
+        suggestion: Suggestion | None = await repository.get_by_id(suggestion_id)
+        if suggestion:
+            logger.debug("Found suggestion: %s", suggestion)
+            return _construct_suggestion(suggestion)
+        logger.debug("No suggestion found with ID: %s", suggestion_id)
+        return None
+
+
+async def get_suggestions_by_user(user_id: int) -> list[SuggestionSchema]:
+    """
+    Get all suggestions from a specific user.
+
+    Args:
+        user_id: The Discord user ID
+
+    Returns:
+        List of SuggestionSchema objects
+    """
+    logger.debug("Getting suggestions for user with ID: %s", user_id)
+    async with get_db_session() as session:
+        repository = SuggestionRepository(session)
+        suggestions: list[Suggestion] = await repository.get_by_user_id(user_id)
+        logger.debug("Found %s suggestions for user %s", len(suggestions), user_id)
+        return _validate_suggestion_list(suggestions)
+
+
+async def get_suggestions_by_staff(staff_id: int) -> list[SuggestionSchema]:
+    """
+    Get all suggestions handled by a specific staff member.
+
+    Args:
+        staff_id: The Discord staff member ID
+
+    Returns:
+        List of SuggestionSchema objects
+    """
+    logger.debug("Getting suggestions handled by staff with ID: %s", staff_id)
+    async with get_db_session() as session:
+        repository = SuggestionRepository(session)
+        suggestions: list[Suggestion] = await repository.get_by_staff_id(staff_id)
+        logger.debug("Found %s suggestions handled by staff %s", len(suggestions), staff_id)
+        return _validate_suggestion_list(suggestions)
+
+
+async def get_suggestions_by_status(status: str) -> list[SuggestionSchema]:
+    """
+    Get all suggestions with a specific status.
+
+    Args:
+        status: The suggestion status (e.g., "pending", "approved", "rejected")
+
+    Returns:
+        List of SuggestionSchema objects
+    """
+    logger.debug("Getting suggestions with status: %s", status)
+    async with get_db_session() as session:
+        repository = SuggestionRepository(session)
+        suggestions: list[Suggestion] = await repository.get_by_status(status)
+        logger.debug("Found %s suggestions with status %s", len(suggestions), status)
+        return _validate_suggestion_list(suggestions)
+
+
+async def create_or_update_suggestion(suggestion_data: SuggestionSchema) -> SuggestionSchema:
+    """
+    Create a new suggestion or update if it already exists.
+
+    Args:
+        suggestion_data: The suggestion data to create or update
+
+    Returns:
+        The created/updated suggestion schema
+    """
+    logger.debug("Creating or updating suggestion: %s", suggestion_data)
+    async with get_db_session() as session:
+        repository = SuggestionRepository(session)
+        suggestion: Suggestion = await repository.upsert(suggestion_data)
+        logger.debug("Created or updated suggestion with ID: %s", suggestion.id)
+        return _construct_suggestion(suggestion)
+
+
+async def delete_suggestion(suggestion_id: int) -> bool:
+    """
+    Delete a suggestion by ID.
+
+    Args:
+        suggestion_id: The suggestion ID
+
+    Returns:
+        True if the suggestion was deleted, False otherwise
+    """
+    logger.debug("Attempting to delete suggestion with ID: %s", suggestion_id)
+    async with get_db_session() as session:
+        repository = SuggestionRepository(session)
+        result = await repository.delete(suggestion_id)
+        logger.debug("Deletion result for suggestion %s: %s", suggestion_id, result)
+        return result
+
 
 class SuggestionService:
     """
     Service for suggestion-related business logic and operations.
+
+    The operations are module-level functions; this class groups them under one name.
     """
 
-    @staticmethod
-    async def get_suggestion(suggestion_id: int) -> SuggestionSchema | None:
-        """
-        Get a suggestion by ID.
-
-        Args:
-            suggestion_id: The suggestion ID
-
-        Returns:
-            SuggestionSchema or None if the suggestion doesn't exist
-        """
-        logger.debug(f"Getting suggestion with ID: {suggestion_id}")
-        async with get_db_session() as session:
-            repository = SuggestionRepository(session)
-            suggestion: Suggestion | None = await repository.get_by_id(suggestion_id)
-            if suggestion:
-                logger.debug(f"Found suggestion: {suggestion}")
-                return SuggestionSchema.model_validate(suggestion)
-            logger.debug(f"No suggestion found with ID: {suggestion_id}")
-            return None
-
-    @staticmethod
-    async def get_suggestions_by_user(user_id: int) -> list[SuggestionSchema]:
-        """
-        Get all suggestions from a specific user.
-
-        Args:
-            user_id: The Discord user ID
-
-        Returns:
-            List of SuggestionSchema objects
-        """
-        logger.debug(f"Getting suggestions for user with ID: {user_id}")
-        async with get_db_session() as session:
-            repository = SuggestionRepository(session)
-            suggestions: list[Suggestion] = await repository.get_by_user_id(user_id)
-            logger.debug(f"Found {len(suggestions)} suggestions for user {user_id}")
-            return [SuggestionSchema.model_validate(suggestion) for suggestion in suggestions]
-
-    @staticmethod
-    async def get_suggestions_by_staff(staff_id: int) -> list[SuggestionSchema]:
-        """
-        Get all suggestions handled by a specific staff member.
-
-        Args:
-            staff_id: The Discord staff member ID
-
-        Returns:
-            List of SuggestionSchema objects
-        """
-        logger.debug(f"Getting suggestions handled by staff with ID: {staff_id}")
-        async with get_db_session() as session:
-            repository = SuggestionRepository(session)
-            suggestions: list[Suggestion] = await repository.get_by_staff_id(staff_id)
-            logger.debug(f"Found {len(suggestions)} suggestions handled by staff {staff_id}")
-            return [SuggestionSchema.model_validate(suggestion) for suggestion in suggestions]
-
-    @staticmethod
-    async def get_suggestions_by_status(status: str) -> list[SuggestionSchema]:
-        """
-        Get all suggestions with a specific status.
-
-        Args:
-            status: The suggestion status (e.g., "pending", "approved", "rejected")
-
-        Returns:
-            List of SuggestionSchema objects
-        """
-        logger.debug(f"Getting suggestions with status: {status}")
-        async with get_db_session() as session:
-            repository = SuggestionRepository(session)
-            suggestions: list[Suggestion] = await repository.get_by_status(status)
-            logger.debug(f"Found {len(suggestions)} suggestions with status {status}")
-            return [SuggestionSchema.model_validate(suggestion) for suggestion in suggestions]
-
-    @staticmethod
-    async def create_or_update_suggestion(suggestion_data: SuggestionSchema) -> SuggestionSchema:
-        """
-        Create a new suggestion or update if it already exists.
-
-        Args:
-            suggestion_data: The suggestion data to create or update
-
-        Returns:
-            The created/updated suggestion schema
-        """
-        logger.debug(f"Creating or updating suggestion: {suggestion_data}")
-        async with get_db_session() as session:
-            repository = SuggestionRepository(session)
-
-            # Check if we have an ID and if it exists in the database
-            if suggestion_data.id is not None:
-                logger.debug(f"Checking if suggestion with ID {suggestion_data.id} exists")
-                existing_suggestion: Suggestion | None = await repository.get_by_id(suggestion_data.id)
-                if existing_suggestion:
-                    logger.debug(f"Updating existing suggestion with ID: {suggestion_data.id}")
-                    updated_suggestion: Suggestion | None = await repository.update(
-                        suggestion_data.id, suggestion_data
-                    )
-                    logger.debug(f"Updated suggestion: {updated_suggestion}")
-                    return SuggestionSchema.model_validate(updated_suggestion)
-
-            # If no ID or record doesn't exist, create a new one
-            logger.debug("Creating new suggestion")
-            new_suggestion: Suggestion = await repository.create(suggestion_data)
-            logger.debug(f"Created new suggestion with ID: {new_suggestion.id}")
-            return SuggestionSchema.model_validate(new_suggestion)
-
-    @staticmethod
-    async def delete_suggestion(suggestion_id: int) -> bool:
-        """
-        Delete a suggestion by ID.
-
-        Args:
-            suggestion_id: The suggestion ID
-
-        Returns:
-            True if the suggestion was deleted, False otherwise
-        """
-        logger.debug(f"Attempting to delete suggestion with ID: {suggestion_id}")
-        async with get_db_session() as session:
-            repository = SuggestionRepository(session)
-            result = await repository.delete(suggestion_id)
-            logger.debug(f"Deletion result for suggestion {suggestion_id}: {result}")
-            return result
\ No newline at end of file
+    get_suggestion = staticmethod(get_suggestion)
+    get_suggestions_by_user = staticmethod(get_suggestions_by_user)
+    get_suggestions_by_staff = staticmethod(get_suggestions_by_staff)
+    get_suggestions_by_status = staticmethod(get_suggestions_by_status)
+    create_or_update_suggestion = staticmethod(create_or_update_suggestion)
+    delete_suggestion = staticmethod(delete_suggestion)
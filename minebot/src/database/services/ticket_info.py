@@ -1,6 +1,9 @@
 from logging import Logger
 
-from database import get_db_session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from data_types import TimedDict
+from database import call_after_commit, get_current_session, use_db_session
 from database.models import TicketInfo
 from database.repositories import TicketInfoRepository
 from database.schemas import TicketInfoSchema
@@ -8,118 +11,202 @@ from debug import get_logger
 
 logger: Logger = get_logger(__name__)
 
+_construct_ticket_info = TicketInfoSchema.from_orm_trusted
+
+# Recently read tickets, keyed by ID with channel and message IDs pointing at the ticket ID. The
+# cache is bypassed inside a caller's session, passed in or enclosing, since it may hold
+# uncommitted writes
+_TICKET_CACHE_TTL: float = 300
+_cached_tickets: TimedDict[int, TicketInfoSchema] = TimedDict[int, TicketInfoSchema](
+    _TICKET_CACHE_TTL, key_type=int, lazy_expiration=True
+)
+_cached_ticket_ids_by_channel: TimedDict[int, int] = TimedDict[int, int](
+    _TICKET_CACHE_TTL, key_type=int, lazy_expiration=True
+)
+_cached_ticket_ids_by_message: TimedDict[int, int] = TimedDict[int, int](
+    _TICKET_CACHE_TTL, key_type=int, lazy_expiration=True
+)
+
+# Bumped by every invalidation, so reads that overlapped a write do not cache the old row
+_cache_generation: int = 0
+
+
+def _cache_ticket(ticket: TicketInfoSchema, generation: int) -> TicketInfoSchema:
+    """Store a ticket in the lookup cache and return a copy the caller may modify."""
+    if generation != _cache_generation:
+        return ticket
+    _cached_tickets[ticket.id] = ticket
+    _cached_ticket_ids_by_channel[ticket.channel_id] = ticket.id
+    _cached_ticket_ids_by_message[ticket.message_id] = ticket.id
+    return ticket.model_copy()
+
+
+def _invalidate_ticket(ticket_id: int) -> None:
+    """Drop a ticket from the lookup cache after it was written or deleted."""
+    global _cache_generation
+    _cache_generation += 1
+    _cached_tickets.pop(ticket_id, None)
+
+
+def _get_cached_ticket(
+    ticket_id: int | None, field: str | None = None, value: int | None = None
+) -> TicketInfoSchema | None:
+    """Return a copy of a cached ticket, checking that the looked-up field still matches."""
+    ticket: TicketInfoSchema | None = _cached_tickets.get(ticket_id) if ticket_id else None
+    if not ticket or (field and getattr(ticket, field) != value):
+        return None
+    return ticket.model_copy()
+
+
+async def get_ticket_by_id(
+    ticket_id: int, session: AsyncSession | None = None
+) -> TicketInfoSchema | None:
+    """
+    Get a ticket by ID.
+
+    Args:
+        ticket_id: The ticket ID
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        TicketInfoSchema or None if the ticket doesn't exist
+    """
+    logger.debug("Getting ticket with ID: %s", ticket_id)
+    session = session or get_current_session()
+    if session is None and (cached := _get_cached_ticket(ticket_id)):
+        logger.debug("Found cached ticket with ID: %s", ticket_id)
+        return cached
+
+    generation: int = _cache_generation
+    async with use_db_session(session) as db_session:
+        repository = TicketInfoRepository(db_session)
+        ticket_info: TicketInfo | None = await repository.get_by_id(ticket_id)
+        if ticket_info:
+            logger.debug("Found ticket with ID %s: %s", ticket_id, ticket_info)
+            schema: TicketInfoSchema = _construct_ticket_info(ticket_info)
+            return _cache_ticket(schema, generation) if session is None else schema
+        logger.debug("No ticket found with ID: %s", ticket_id)
+        return None
+
+
+async def get_ticket_by_channel_id(
+    channel_id: int, session: AsyncSession | None = None
+) -> TicketInfoSchema | None:
+    """
+    Get a ticket by channel ID.
+
+    Args:
+        channel_id: The Discord channel ID
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        TicketInfoSchema or None if the ticket doesn't exist
+    """
+    logger.debug("Getting ticket by channel ID: %s", channel_id)
+    session = session or get_current_session()
+    cached_id: int | None = _cached_ticket_ids_by_channel.get(channel_id)
+    if session is None and (cached := _get_cached_ticket(cached_id, "channel_id", channel_id)):
+        logger.debug("Found cached ticket for channel %s", channel_id)
+        return cached
+
+    generation: int = _cache_generation
+    async with use_db_session(session) as db_session:
+        repository = TicketInfoRepository(db_session)
+        ticket_info: TicketInfo | None = await repository.get_by_channel_id(channel_id)
+        if ticket_info:
+            logger.debug("Found ticket for channel %s: %s", channel_id, ticket_info)
+            schema: TicketInfoSchema = _construct_ticket_info(ticket_info)
+            return _cache_ticket(schema, generation) if session is None else schema
+        logger.debug("No ticket found for channel ID: %s", channel_id)
+        return None
+
+
+async def get_ticket_by_message_id(
+    message_id: int, session: AsyncSession | None = None
+) -> TicketInfoSchema | None:
+    """
+    Get a ticket by message ID.
+
+    Args:
+        message_id: The Discord message ID
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        TicketInfoSchema or None if the ticket doesn't exist
+    """
+    logger.debug("Getting ticket by message ID: %s", message_id)
+    session = session or get_current_session()
+    cached_id: int | None = _cached_ticket_ids_by_message.get(message_id)
+    if session is None and (cached := _get_cached_ticket(cached_id, "message_id", message_id)):
+        logger.debug("Found cached ticket for message %s", message_id)
+        return cached
+
+    generation: int = _cache_generation
+    async with use_db_session(session) as db_session:
+        repository = TicketInfoRepository(db_session)
+        ticket_info: TicketInfo | None = await repository.get_by_message_id(message_id)
+        if ticket_info:
+            logger.debug("Found ticket for message %s: %s", message_id, ticket_info)
+            schema: TicketInfoSchema = _construct_ticket_info(ticket_info)
+            return _cache_ticket(schema, generation) if session is None else schema
+        logger.debug("No ticket found for message ID: %s", message_id)
+        return None
+
+
+async def create_or_update_ticket(
+    ticket_data: TicketInfoSchema, session: AsyncSession | None = None
+) -> TicketInfoSchema:
+    """
+    Create a new ticket or update if it already exists.
+
+    Args:
+        ticket_data: The ticket data to create or update
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        The created/updated ticket schema
+    """
+    logger.debug("Creating or updating ticket: %s", ticket_data)
+    async with use_db_session(session) as db_session:
+        repository = TicketInfoRepository(db_session)
+        ticket: TicketInfo = await repository.upsert(ticket_data)
+        logger.debug("Created or updated ticket with ID: %s", ticket.id)
+        result: TicketInfoSchema = _construct_ticket_info(ticket)
+
+        # Invalidate after the commit so reads made during the write do not leave old data cached
+        call_after_commit(db_session, lambda: _invalidate_ticket(result.id))
+        return result
+
+
+async def delete_ticket(ticket_id: int, session: AsyncSession | None = None) -> bool:
+    """
+    Delete a ticket by ID.
+
+    Args:
+        ticket_id: The ticket ID
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        True if the ticket was deleted, False otherwise
+    """
+    logger.debug("Attempting to delete ticket with ID: %s", ticket_id)
+    async with use_db_session(session) as db_session:
+        repository = TicketInfoRepository(db_session)
+        result = await repository.delete(ticket_id)
+        logger.debug("Deletion result for ticket %s: %s", ticket_id, result)
+        call_after_commit(db_session, lambda: _invalidate_ticket(ticket_id))
+        return result
+
 
 class TicketInfoService:
     """
     Service for ticket information related business logic and operations.
+
+    The operations are module-level functions; this class groups them under one name.
     """
 
-    @staticmethod
-    async def get_ticket_by_id(ticket_id: int) -> TicketInfoSchema | None:
-        """
-        Get a ticket by ID.
-
-        Args:
-            ticket_id: The ticket ID
-
-        Returns:
-            TicketInfoSchema or None if the ticket doesn't exist
-        """
-        logger.debug(f"Getting ticket with ID: {ticket_id}")
-        async with get_db_session() as session:
-            repository = TicketInfoRepository(session)
-            ticket_info: TicketInfo | None = await repository.get_by_id(ticket_id)
-            if ticket_info:
-                logger.debug(f"Found ticket with ID {ticket_id}: {ticket_info}")
-                return TicketInfoSchema.model_validate(ticket_info)
-            logger.debug(f"No ticket found with ID: {ticket_id}")
-            return None
-
-    @staticmethod
-    async def get_ticket_by_channel_id(channel_id: int) -> TicketInfoSchema | None:
-        """
-        Get a ticket by channel ID.
-
-        Args:
-            channel_id: The Discord channel ID
-
-        Returns:
-            TicketInfoSchema or None if the ticket doesn't exist
-        """
-        logger.debug(f"Getting ticket by channel ID: {channel_id}")
-        async with get_db_session() as session:
-            repository = TicketInfoRepository(session)
-            ticket_info: TicketInfo | None = await repository.get_by_channel_id(channel_id)
-            if ticket_info:
-                logger.debug(f"Found ticket for channel {channel_id}: {ticket_info}")
-                return TicketInfoSchema.model_validate(ticket_info)
-            logger.debug(f"No ticket found for channel ID: {channel_id}")
-            return None
-
-    @staticmethod
-    async def get_ticket_by_message_id(message_id: int) -> TicketInfoSchema | None:
-        """
-        Get a ticket by message ID.
-
-        Args:
-            message_id: The Discord message ID
-
-        Returns:
-            TicketInfoSchema or None if the ticket doesn't exist
-        """
-        logger.debug(f"Getting ticket by message ID: {message_id}")
-        async with get_db_session() as session:
-            repository = TicketInfoRepository(session)
-            ticket_info: TicketInfo | None = await repository.get_by_message_id(message_id)
-            if ticket_info:
-                logger.debug(f"Found ticket for message {message_id}: {ticket_info}")
-                return TicketInfoSchema.model_validate(ticket_info)
-            logger.debug(f"No ticket found for message ID: {message_id}")
-            return None
-
-    @staticmethod
-    async def create_or_update_ticket(ticket_data: TicketInfoSchema) -> TicketInfoSchema:
-        """
-        Create a new ticket or update if it already exists.
-
-        Args:
-            ticket_data: The ticket data to create or update
-
-        Returns:
-            The created/updated ticket schema
-        """
-        logger.debug(f"Creating or updating ticket: {ticket_data}")
-        async with get_db_session() as session:
-            repository = TicketInfoRepository(session)
-            existing_ticket: TicketInfo | None = await repository.get_by_id(ticket_data.id)
-
-            if existing_ticket:
-                logger.debug(f"Updating existing ticket with ID: {ticket_data.id}")
-                updated_ticket: TicketInfo | None = await repository.update(
-                    ticket_data.id, ticket_data
-                )
-                logger.debug(f"Updated ticket: {updated_ticket}")
-                return TicketInfoSchema.model_validate(updated_ticket)
-            else:
-                logger.debug(f"Creating new ticket with data: {ticket_data}")
-                new_ticket: TicketInfo = await repository.create(ticket_data)
-                logger.debug(f"Created new ticket with ID: {new_ticket.id}")
-                return TicketInfoSchema.model_validate(new_ticket)
-
-    @staticmethod
-    async def delete_ticket(ticket_id: int) -> bool:
-        """
-        Delete a ticket by ID.
-
-        Args:
-            ticket_id: The ticket ID
-
-        Returns:
-            True if the ticket was deleted, False otherwise
-        """
-        logger.debug(f"Attempting to delete ticket with ID: {ticket_id}")
-        async with get_db_session() as session:
-            repository = TicketInfoRepository(session)
-            result = await repository.delete(ticket_id)
-            logger.debug(f"Deletion result for ticket {ticket_id}: {result}")
-            return result
+    get_ticket_by_id = staticmethod(get_ticket_by_id)
+    get_ticket_by_channel_id = staticmethod(get_ticket_by_channel_id)
+    get_ticket_by_message_id = staticmethod(get_ticket_by_message_id)
+    create_or_update_ticket = staticmethod(create_or_update_ticket)
+    delete_ticket = staticmethod(delete_ticket)
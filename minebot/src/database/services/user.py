@@ -1,6 +1,9 @@
 from logging import Logger
 
-from database import get_db_session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from data_types import TimedDict
+from database import call_after_commit, get_current_session, use_db_session
 from database.models import User
 from database.repositories import UserRepository
 from database.schemas import UserSchema
@@ -8,136 +11,202 @@ from debug import get_logger
 
 logger: Logger = get_logger(__name__)
 
+_validate_user = UserSchema.model_validate
+
+# Rows returned by a write come from a UserSchema the caller already validated, so they are
+# constructed without validating every field a second time
+_construct_written_user = UserSchema.from_orm_trusted
+
+# Columns that keep their stored value when an update does not provide one
+_PRESERVED_COLUMNS: frozenset[str] = frozenset(
+    {"minecraft_username", "minecraft_uuid", "reward_inventory"}
+)
+
+# Recently read users, so repeated lookups from Discord events skip the database. The cache is
+# bypassed inside a caller's session, passed in or enclosing, since it may hold uncommitted writes
+_USER_CACHE_TTL: float = 300
+_cached_users: TimedDict[int, UserSchema] = TimedDict[int, UserSchema](
+    _USER_CACHE_TTL, key_type=int, lazy_expiration=True
+)
+_cached_user_ids_by_minecraft_username: TimedDict[str, int] = TimedDict[str, int](
+    _USER_CACHE_TTL, lazy_expiration=True
+)
+
+# Bumped by every invalidation. A read that started before a write committed may return the old
+# row after the invalidation ran, so reads only cache when the generation did not change meanwhile
+_cache_generation: int = 0
+
+
+def _cache_user(user: UserSchema, generation: int) -> UserSchema:
+    """Store a user in the lookup cache and return a copy the caller may modify."""
+    if generation != _cache_generation:
+        return user
+    _cached_users[user.id] = user
+    if user.minecraft_username:
+        _cached_user_ids_by_minecraft_username[user.minecraft_username] = user.id
+    return user.model_copy(deep=True)
+
+
+def _invalidate_user(user_id: int) -> None:
+    """Drop a user from the lookup cache after it was written or deleted."""
+    global _cache_generation
+    _cache_generation += 1
+    _cached_users.pop(user_id, None)
+
+
+async def get_user(user_id: int, session: AsyncSession | None = None) -> UserSchema | None:
+    """
+    Get a user by ID.
+
+    Args:
+        user_id: The Discord user ID
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        UserSchema or None if the user doesn't exist
+    """
+    logger.debug("Getting user with ID: %s", user_id)
+    session = session or get_current_session()
+    cached: UserSchema | None = _cached_users.get(user_id) if session is None else None
+    if cached:
+        logger.debug("Found cached user with ID: %s", user_id)
+        return cached.model_copy(deep=True)
+
+    generation: int = _cache_generation
+    async with use_db_session(session) as db_session:
+        repository = UserRepository(db_session)
+        user: User | None = await repository.get_by_id(user_id)
+        if user:
+            logger.debug("Found user with ID %s: %s", user_id, user)
+            schema: UserSchema = _validate_user(user)
+            return _cache_user(schema, generation) if session is None else schema
+        logger.debug("No user found with ID: %s", user_id)
+        return None
+
+
+async def get_user_by_minecraft_username(
+    minecraft_username: str, session: AsyncSession | None = None
+) -> UserSchema | None:
+    """
+    Get a user by their Minecraft username.
+
+    Args:
+        minecraft_username: The Minecraft username
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        UserSchema or None if the user doesn't exist
+    """
+    logger.debug("Getting user with Minecraft username: %s", minecraft_username)
+    session = session or get_current_session()
+    cached_id: int | None = (
+        _cached_user_ids_by_minecraft_username.get(minecraft_username) if session is None else None
+    )
+    cached: UserSchema | None = _cached_users.get(cached_id) if cached_id else None
+
+    # The name entry may be stale if the user was relinked, so confirm it still matches
+    if cached and cached.minecraft_username == minecraft_username:
+        logger.debug("Found cached user with Minecraft username: %s", minecraft_username)
+        return cached.model_copy(deep=True)
+
+    generation: int = _cache_generation
+    async with use_db_session(session) as db_session:
+        repository = UserRepository(db_session)
+        user: User | None = await repository.get_by_minecraft_username(minecraft_username)
+        if user:
+            logger.debug("Found user with Minecraft username %s: %s", minecraft_username, user)
+            schema: UserSchema = _validate_user(user)
+            return _cache_user(schema, generation) if session is None else schema
+        logger.debug("No user found with Minecraft username: %s", minecraft_username)
+        return None
+
+
+async def create_or_update_user(
+    user_data: UserSchema, preserve_existing: bool = True, session: AsyncSession | None = None
+) -> UserSchema:
+    """
+    Create a new user or update if it already exists.
+
+    Args:
+        user_data: The user data to create or update
+        preserve_existing: If True (default), preserve existing non-null values when updating
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        The created/updated user schema
+    """
+    logger.debug("Creating or updating user: %s", user_data)
+
+    # If preserving existing values, columns without a new value keep what is stored
+    keep_existing: set[str] = (
+        {column for column in _PRESERVED_COLUMNS if not getattr(user_data, column)}
+        if preserve_existing
+        else set()
+    )
+
+    async with use_db_session(session) as db_session:
+        repository = UserRepository(db_session)
+        user: User = await repository.upsert(user_data, keep_existing)
+        logger.debug("Created or updated user: %s", user)
+
+        # Invalidate after the commit so reads made during the write do not leave old data cached
+        call_after_commit(db_session, lambda: _invalidate_user(user_data.id))
+        return _construct_written_user(user)
+
+
+async def delete_user(user_id: int, session: AsyncSession | None = None) -> bool:
+    """
+    Delete a user by ID.
+
+    Args:
+        user_id: The Discord user ID
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        True if the user was deleted, False otherwise
+    """
+    logger.debug("Attempting to delete user with ID: %s", user_id)
+    async with use_db_session(session) as db_session:
+        repository = UserRepository(db_session)
+        result = await repository.delete(user_id)
+        logger.debug("Deletion result for user %s: %s", user_id, result)
+        call_after_commit(db_session, lambda: _invalidate_user(user_id))
+        return result
+
+
+async def add_item(
+    user_id: int, server: str, items: str | list[str], session: AsyncSession | None = None
+) -> bool:
+    """
+    Add an item to the user's inventory.
+
+    Args:
+        user_id: The Discord user ID
+        server: The server name
+        items: The item(s) to add
+        session: Optional session to run in instead of opening a new one
+
+    Returns:
+        True if the item was added, False otherwise
+    """
+    logger.debug("Adding item(s) to inventory for user %s: %s", user_id, items)
+    async with use_db_session(session) as db_session:
+        repository = UserRepository(db_session)
+        result: bool = await repository.add_item(user_id, server, items)
+        logger.debug("Add item result for user %s: %s", user_id, result)
+        call_after_commit(db_session, lambda: _invalidate_user(user_id))
+        return result
+
 
 class UserService:
     """
     Service for user-related business logic and operations.
+
+    The operations are module-level functions; this class groups them under one name.
     """
 
-    @staticmethod
-    async def get_user(user_id: int) -> UserSchema | None:
-        """
-        Get a user by ID.
-
-        Args:
-            user_id: The Discord user ID
-
-        Returns:
-            UserSchema or None if the user doesn't exist
-        """
-        logger.debug(f"Getting user with ID: {user_id}")
-        async with get_db_session() as session:
-            repository = UserRepository(session)
-            user: User | None = await repository.get_by_id(user_id)
-            if user:
-                logger.debug(f"Found user with ID {user_id}: {user}")
-                return UserSchema.model_validate(user)
-            logger.debug(f"No user found with ID: {user_id}")
-            return None
-
-    @staticmethod
-    async def get_user_by_minecraft_username(minecraft_username: str) -> UserSchema | None:
-        """
-        Get a user by their Minecraft username.
-
-        Args:
-            minecraft_username: The Minecraft username
-
-        Returns:
-            UserSchema or None if the user doesn't exist
-        """
-        logger.debug(f"Getting user with Minecraft username: {minecraft_username}")
-        async with get_db_session() as session:
-            repository = UserRepository(session)
-            user: User | None = await repository.get_by_minecraft_username(minecraft_username)
-            if user:
-                logger.debug(f"Found user with Minecraft username {minecraft_username}: {user}")
-                return UserSchema.model_validate(user)
-            logger.debug(f"No user found with Minecraft username: {minecraft_username}")
-            return None
-
-    @staticmethod
-    async def create_or_update_user(
-        user_data: UserSchema, preserve_existing: bool = True
-    ) -> UserSchema:
-        """
-        Create a new user or update if it already exists.
-
-        Args:
-            user_data: The user data to create or update
-            preserve_existing: If True (default), preserve existing non-null values when updating
-
-        Returns:
-            The created/updated user schema
-        """
-        logger.debug(f"Creating or updating user: {user_data}")
-        async with get_db_session() as session:
-            repository = UserRepository(session)
-            existing_user: User | None = await repository.get_by_id(user_data.id)
-
-            if not existing_user:
-                logger.debug(f"Creating new user with ID: {user_data.id}")
-                new_user: User = await repository.create(user_data)
-                logger.debug(f"Created new user: {new_user}")
-                return UserSchema.model_validate(new_user)
-
-            # Handle existing user update
-            logger.debug(f"Updating existing user with ID: {user_data.id}")
-
-            # If preserving existing values, only update fields if they're null
-            if preserve_existing:
-                user_data = UserSchema(
-                    id=user_data.id,
-                    locale=user_data.locale,
-                    minecraft_username=user_data.minecraft_username
-                    or existing_user.minecraft_username,
-                    minecraft_uuid=user_data.minecraft_uuid or existing_user.minecraft_uuid,
-                    reward_inventory=user_data.reward_inventory or existing_user.reward_inventory,
-                )
-
-            updated_user: User | None = await repository.update(user_data.id, user_data)
-
-            if updated_user != existing_user:
-                logger.debug(f"Updated user: {updated_user}")
-            else:
-                logger.debug("No changes were made to the user")
-
-            return UserSchema.model_validate(updated_user)
-
-    @staticmethod
-    async def delete_user(user_id: int) -> bool:
-        """
-        Delete a user by ID.
-
-        Args:
-            user_id: The Discord user ID
-
-        Returns:
-            True if the user was deleted, False otherwise
-        """
-        logger.debug(f"Attempting to delete user with ID: {user_id}")
-        async with get_db_session() as session:
-            repository = UserRepository(session)
-            result = await repository.delete(user_id)
-            logger.debug(f"Deletion result for user {user_id}: {result}")
-            return result
-
-    @staticmethod
-    async def add_item(user_id: int, server: str, items: str | list[str]) -> bool:
-        """
-        Add an item to the user's inventory.
-
-        Args:
-            user_id: The Discord user ID
-            server: The server name
-            items: The item(s) to add
-
-        Returns:
-            True if the item was added, False otherwise
-        """
-        logger.debug(f"Adding item(s) to inventory for user {user_id}: {items}")
-        async with get_db_session() as session:
-            repository = UserRepository(session)
-            result: bool = await repository.add_item(user_id, server, items)
-            logger.debug(f"Add item result for user {user_id}: {result}")
-            return result
+    get_user = staticmethod(get_user)
+    get_user_by_minecraft_username = staticmethod(get_user_by_minecraft_username)
+    create_or_update_user = staticmethod(create_or_update_user)
+    delete_user = staticmethod(delete_user)
+    add_item = staticmethod(add_item)
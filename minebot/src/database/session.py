@@ -1,7 +1,10 @@
+import asyncio
 import contextlib
+from contextvars import ContextVar
 from logging import Logger
-from typing import AsyncGenerator, TypeVar
+from typing import Any, AsyncGenerator, Callable, TypeVar
 
+from sqlalchemy import Connection, event
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -15,14 +18,41 @@ AsyncSessionLocal = None
 
 T = TypeVar("T")
 
+# Session of the innermost shared get_db_session block, with the task that opened it. Tasks
+# spawned inside the block inherit the variable but not the session, since an AsyncSession
+# cannot run statements from several tasks at once
+_current_session: ContextVar[tuple[AsyncSession, asyncio.Task[Any] | None] | None] = ContextVar(
+    "current_db_session", default=None
+)
+
+
+def get_current_session() -> AsyncSession | None:
+    """
+    Get the session of the enclosing get_db_session block in the running task.
+
+    Returns:
+        The enclosing session, or None when no shared session is open in this task
+    """
+    current = _current_session.get()
+    if current is None or current[1] is not asyncio.current_task():
+        return None
+    return current[0]
+
 
 @contextlib.asynccontextmanager
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
+async def get_db_session(shared: bool = True) -> AsyncGenerator[AsyncSession, None]:
     """
     Async context manager for database sessions.
 
-    Creates a new SQLAlchemy AsyncSession that automatically handles
-    commit/rollback and closes the session when the context exists.
+    Creates a new SQLAlchemy AsyncSession wrapped in a single transaction that is
+    committed when the context exits, rolled back on error, and then closed.
+
+    Nested calls in the same task reuse the enclosing session instead of opening another
+    one; only the outermost block commits, rolls back and closes it.
+
+    Args:
+        shared: If False, a new session is always opened and not offered to nested calls.
+            Use this for sessions held open across yields of an async generator.
 
     Yields:
         AsyncSession: The SQLAlchemy async session
@@ -31,23 +61,72 @@ async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
         async with get_db_session() as session:
             result = await session.execute(...)
     """
+    if shared and (current := get_current_session()) is not None:
+        yield current
+        return
+
     if AsyncSessionLocal is None:
         raise RuntimeError("Database not initialized. Call initialize_database() first.")
 
-    session: AsyncSession = AsyncSessionLocal()
-    try:
+    async with AsyncSessionLocal() as session:
+        token = _current_session.set((session, asyncio.current_task())) if shared else None
+        try:
+            # One explicit transaction per context: the connection stays pinned for the whole
+            # block and is committed once on exit, or rolled back if anything raises
+            async with session.begin():
+                yield session
+        except SQLAlchemyError as e:
+            logger.error(f"Database error: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during database operation: {e}")
+            raise
+        finally:
+            if token is not None:
+                _current_session.reset(token)
+
+
+@contextlib.asynccontextmanager
+async def use_db_session(session: AsyncSession | None = None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async context manager that reuses a caller's session or opens a new one.
+
+    Lets a service operation join the session an event handler already opened, so several
+    operations share one connection checkout and one commit. The caller's get_db_session
+    block stays responsible for committing a passed session.
+
+    Args:
+        session: The session to reuse, or None to open a new one with get_db_session
+
+    Yields:
+        AsyncSession: The SQLAlchemy async session
+    """
+    if session is not None:
         yield session
-        await session.commit()
-    except SQLAlchemyError as e:
-        await session.rollback()
-        logger.error(f"Database error: {e}")
-        raise
-    except Exception as e:
-        await session.rollback()
-        logger.error(f"Unexpected error during database operation: {e}")
-        raise
-    finally:
-        await session.close()
+        return
+
+    async with get_db_session() as new_session:
+        yield new_session
+
+
+def call_after_commit(session: AsyncSession, callback: Callable[[], object]) -> None:
+    """
+    Run a callback once the session's current transaction is committed.
+
+    Nothing is called if the transaction is rolled back instead.
+
+    Args:
+        session: The session whose commit to wait for
+        callback: The function to call after the commit; its return value is ignored
+    """
+    event.listen(session.sync_session, "after_commit", lambda _: callback(), once=True)
+
+
+def _create_missing_indexes(connection: Connection) -> None:
+    """Create every index declared on the models that is missing from the database."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
 
 
 async def initialize_database() -> None:
@@ -57,14 +136,6 @@ async def initialize_database() -> None:
     This should be called during application startup to ensure
     all tables defined in models are created in the database.
     """
-    from database.models import (  # noqa: F401
-        PunishmentLog,
-        TemporaryAction,
-        TicketChannel,
-        TicketInfo,
-        User,
-    )
-
     try:
         # Create engine and session factory
         global AsyncSessionLocal, engine
@@ -84,7 +155,11 @@ async def initialize_database() -> None:
         # Create tables
         async with engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            # create_all skips tables that already exist, so indexes added to existing
+            # tables are created here
+            await conn.run_sync(_create_missing_indexes)
             logger.info("Database initialized successfully")
+        logger.info(f"Database connection pool: {engine.pool.status()}")
     except SQLAlchemyError as e:
         logger.critical(f"Failed to initialize database: {e}")
         raise
@@ -94,8 +169,6 @@ async def close_database() -> None:
     """
     Close database connections and dispose of the engine.
     """
-    from database.base import engine
-
     try:
         if engine is not None:
             logger.info("Closing database engine and releasing connections...")
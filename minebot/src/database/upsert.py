@@ -0,0 +1,159 @@
+from typing import Any, Iterable, TypeVar, cast
+
+from sqlalchemy import CursorResult, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+ModelT = TypeVar("ModelT")
+
+# Dialects that support ON CONFLICT on INSERT and RETURNING on INSERT/UPDATE
+_ON_CONFLICT_DIALECTS: frozenset[str] = frozenset({"postgresql", "sqlite"})
+
+
+async def execute_upsert(
+    session: AsyncSession,
+    model: type[ModelT],
+    values: dict[str, Any],
+    key: str = "id",
+    keep_on_conflict: Iterable[str] = (),
+) -> ModelT:
+    """
+    Insert a row or update it in place if the primary key already exists.
+
+    The write is issued as a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``
+    statement on PostgreSQL and SQLite, and as ``INSERT ... ON DUPLICATE KEY UPDATE``
+    on MySQL, so callers never need a separate existence check before writing.
+
+    Args:
+        session: The active database session
+        model: The mapped model class to write to
+        values: Column values for the row; a ``None`` primary key lets the database generate one
+        key: Name of the primary key column used for conflict detection
+        keep_on_conflict: Columns that are written on insert but keep their stored value
+            when the row already exists
+
+    Returns:
+        The persisted model instance reflecting the row as stored in the database
+    """
+    if values.get(key) is None:
+        values = {column: value for column, value in values.items() if column != key}
+
+    skipped_columns: set[str] = {key, *keep_on_conflict}
+    update_values: dict[str, Any] = {
+        column: value for column, value in values.items() if column not in skipped_columns
+    }
+    dialect: str = session.get_bind().dialect.name
+
+    if dialect in _ON_CONFLICT_DIALECTS:
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+
+        statement = insert(model).values(**values)
+        statement = statement.on_conflict_do_update(index_elements=[key], set_=update_values)
+
+        result = await session.scalars(
+            statement.returning(model), execution_options={"populate_existing": True}
+        )
+        return result.one()
+
+    if dialect == "mysql":
+        from sqlalchemy.dialects.mysql import insert
+
+        statement = insert(model).values(**values).on_duplicate_key_update(**update_values)
+        result = cast(CursorResult[Any], await session.execute(statement))
+
+        # MySQL has no RETURNING, so load the row through the identity map instead
+        primary_key: Any = values.get(key, result.inserted_primary_key[0])
+        instance: ModelT | None = await session.get(model, primary_key, populate_existing=True)
+        assert instance is not None
+        return instance
+
+    raise NotImplementedError(f"Upsert is not supported for the '{dialect}' dialect")
+
+
+async def execute_insert_many(
+    session: AsyncSession, model: type[ModelT], rows: list[dict[str, Any]]
+) -> list[ModelT]:
+    """
+    Insert several rows and return them in the order given.
+
+    The rows are written as a single multi-row ``INSERT ... RETURNING`` statement on
+    PostgreSQL and SQLite. MySQL has no RETURNING, so each row is inserted and loaded in
+    turn instead, still within the caller's transaction.
+
+    Args:
+        session: The active database session
+        model: The mapped model class to write to
+        rows: Column values for each row; every row must provide the same columns
+
+    Returns:
+        The persisted model instances, in the same order as rows
+    """
+    if not rows:
+        return []
+
+    dialect: str = session.get_bind().dialect.name
+
+    if dialect in _ON_CONFLICT_DIALECTS:
+        result = await session.scalars(
+            insert(model).returning(model, sort_by_parameter_order=True), rows
+        )
+        return list(result.all())
+
+    if dialect == "mysql":
+        instances: list[ModelT] = []
+        for row in rows:
+            insert_result = cast(
+                CursorResult[Any], await session.execute(insert(model).values(**row))
+            )
+            instance: ModelT | None = await session.get(
+                model, insert_result.inserted_primary_key[0]
+            )
+            assert instance is not None
+            instances.append(instance)
+        return instances
+
+    raise NotImplementedError(f"INSERT ... RETURNING is not supported for the '{dialect}' dialect")
+
+
+async def execute_update_returning(
+    session: AsyncSession,
+    model: type[ModelT],
+    primary_key: Any,
+    values: dict[str, Any],
+    key: str = "id",
+) -> ModelT | None:
+    """
+    Update a row by primary key and return it, without loading it first.
+
+    The write is issued as a single ``UPDATE ... RETURNING`` statement on PostgreSQL and
+    SQLite. MySQL has no RETURNING, so the row is loaded after the update instead.
+
+    Args:
+        session: The active database session
+        model: The mapped model class to write to
+        primary_key: Primary key value of the row to update
+        values: Column values to set on the row
+        key: Name of the primary key column
+
+    Returns:
+        The updated model instance, or None if no row has the given primary key
+    """
+    statement = update(model).where(getattr(model, key) == primary_key).values(**values)
+    dialect: str = session.get_bind().dialect.name
+
+    if dialect in _ON_CONFLICT_DIALECTS:
+        result = await session.scalars(
+            statement.returning(model), execution_options={"populate_existing": True}
+        )
+        return result.one_or_none()
+
+    if dialect == "mysql":
+        # Matched rows are counted even when no value changes, so zero means the row is missing
+        update_result = cast(CursorResult[Any], await session.execute(statement))
+        if not update_result.rowcount:
+            return None
+        return await session.get(model, primary_key, populate_existing=True)
+
+    raise NotImplementedError(f"UPDATE ... RETURNING is not supported for the '{dialect}' dialect")
@@ -1,27 +1,55 @@
-import json
+import atexit
 import logging
 import logging.config
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, ClassVar, Final
+from typing import Any, Final
+
+import orjson
 
 from model import LogStyle
 
 
+def _build_level_format(levelname: str) -> str:
+    """Build the colored format string for one log level."""
+    level_color: str = LogStyle[levelname].value
+    reset: str = LogStyle.RESET.value
+    bracket: str = LogStyle.BRACKET.value
+    return (
+        f"{bracket}[{level_color}{levelname:4}{reset}{bracket}] "
+        f"{bracket}[{LogStyle.NAME.value}%(name)-8s{bracket}] "
+        f"{bracket}[{LogStyle.TIMESTAMP.value}%(asctime)s{bracket}] "
+        f"{LogStyle.ARROW.value}→ "
+        f"{level_color}%(message)s{reset}"
+    )
+
+
+# Styles for every known level are built once at import, so formatting a record is a single
+# dict lookup and the shared formatter style is never mutated between records
+_LEVEL_STYLES: Final[dict[str, logging.PercentStyle]] = {
+    levelname: logging.PercentStyle(_build_level_format(levelname))
+    for levelname in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter for colored log output with improved readability."""
 
-    # Cache format strings to avoid rebuilding them for each log record
-    _FORMATS: ClassVar[dict[str, str]] = {}
+    def usesTime(self) -> bool:
+        """Every colored format includes the timestamp."""
+        return True
 
-    def format(self, record: logging.LogRecord) -> str:
+    def formatMessage(self, record: logging.LogRecord) -> str:
         """
         Formats a logging record into a styled string based on its log level.
 
-        This method customizes the log message format by applying specific styles
-        (e.g., colors) to different parts of the log message, such as the log level,
-        logger name, timestamp, and message content. The styles are cached for each
-        log level to improve performance.
+        Specific styles (e.g., colors) are applied to different parts of the log message,
+        such as the log level, logger name, timestamp, and message content. The styles
+        are prebuilt for each log level at import time; records with an unknown level
+        fall back to the configured format.
 
         Args:
             record (logging.LogRecord): The log record to format.
@@ -29,30 +57,7 @@ class ColoredFormatter(logging.Formatter):
         Returns:
             str: The formatted log message as a string.
         """
-        # Get cached format for this level if available
-        if record.levelname not in self._FORMATS:
-            # Get styling
-            level_color = LogStyle[record.levelname].value
-            reset = LogStyle.RESET.value
-            timestamp_color = LogStyle.TIMESTAMP.value
-            name_color = LogStyle.NAME.value
-            bracket = LogStyle.BRACKET.value
-            arrow = LogStyle.ARROW.value
-
-            # Create cached format string for this level
-            self._FORMATS[record.levelname] = (
-                f"{bracket}[{level_color}{record.levelname:4}{reset}{bracket}] "
-                f"{bracket}[{name_color}%(name)-8s{bracket}] "
-                f"{bracket}[{timestamp_color}%(asctime)s{bracket}] "
-                f"{arrow}→ "
-                f"{level_color}%(message)s{reset}"
-            )
-
-        # Set format for this record
-        self._style._fmt = self._FORMATS[record.levelname]
-
-        # Apply standard formatting
-        return super().format(record)
+        return _LEVEL_STYLES.get(record.levelname, self._style).format(record)
 
 
 # Configuration constants
@@ -117,7 +122,7 @@ def setup_logging(config_path: Path | None = None) -> bool:
         bool: True if logging was successfully configured, False otherwise.
 
     Exceptions Handled:
-        - json.JSONDecodeError, ValueError: Raised when the configuration file
+        - orjson.JSONDecodeError, ValueError: Raised when the configuration file
           contains invalid JSON or formatting issues.
         - PermissionError, OSError: Raised when there are issues accessing the
           configuration file or creating necessary directories.
@@ -137,15 +142,16 @@ def setup_logging(config_path: Path | None = None) -> bool:
         logs_dir.mkdir(exist_ok=True)
 
         if config_path.exists():
-            with config_path.open("rt", encoding="utf-8") as f:
-                config: dict[str, Any] = json.load(f)
+            # Parse the raw bytes so the file is decoded only once
+            config: dict[str, Any] = orjson.loads(config_path.read_bytes())
         else:
             config = FALLBACK_CONFIG
 
         logging.config.dictConfig(config)
+        _move_handlers_off_event_loop()
         return True
 
-    except (json.JSONDecodeError, ValueError) as e:
+    except (orjson.JSONDecodeError, ValueError) as e:
         # Handle specific formatting errors in the config file
         _setup_emergency_logging()
         logging.error(f"Invalid logging configuration format: {e}. Using basic configuration.")
@@ -164,6 +170,53 @@ def setup_logging(config_path: Path | None = None) -> bool:
         return False
 
 
+# Listeners writing queued records on background threads, started by setup_logging
+_queue_listeners: list[QueueListener] = []
+
+
+def _stop_queue_listeners() -> None:
+    """Flush and stop every queue listener started by setup_logging."""
+    while _queue_listeners:
+        _queue_listeners.pop().stop()
+
+
+def _move_handlers_off_event_loop() -> None:
+    """
+    Routes the configured handlers through queues drained on background threads.
+
+    Console and file handlers write synchronously, so calling them from a logger on the
+    event loop thread blocks async I/O during logging bursts. Each distinct set of handlers
+    is replaced by a single QueueHandler, and a QueueListener hands the queued records to
+    the original handlers on its own thread. Logger and handler levels are kept as
+    configured. The listeners are flushed and stopped at interpreter exit.
+    """
+    _stop_queue_listeners()
+
+    loggers: list[logging.Logger] = [logging.getLogger()] + [
+        logger
+        for logger in logging.Logger.manager.loggerDict.values()
+        if isinstance(logger, logging.Logger)
+    ]
+
+    queue_handlers: dict[tuple[logging.Handler, ...], QueueHandler] = {}
+    for logger in loggers:
+        handlers: tuple[logging.Handler, ...] = tuple(logger.handlers)
+        if not handlers:
+            continue
+
+        if handlers not in queue_handlers:
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            listener.start()
+            _queue_listeners.append(listener)
+            queue_handlers[handlers] = QueueHandler(log_queue)
+
+        logger.handlers = [queue_handlers[handlers]]
+
+
+atexit.register(_stop_queue_listeners)
+
+
 def _setup_emergency_logging() -> None:
     """
     Configures emergency logging settings for the application.
@@ -180,10 +233,13 @@ def _setup_emergency_logging() -> None:
     )
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> logging.Logger:
     """
     Retrieves a logger instance with a specified name, prefixed by 'minebot.'.
 
+    Results are memoized, so repeated calls skip the logging module's lock and registry lookup.
+
     Args:
         name (str): The name to append to the 'minebot.' prefix for the logger.
 
@@ -1,5 +1,4 @@
 from logging import Logger
-from typing import Sequence
 
 import hikari
 import lightbulb
@@ -48,10 +47,9 @@ async def on_ready(event: hikari.ShardReadyEvent) -> None:
             raise Exception("Bot does not have administrator permissions.")
         logger.info("Bot has the required administrator permissions.")
 
-        # Set booster role
-        guild_roles: Sequence[hikari.Role] = await guild.fetch_roles()
-        GlobalState.guild.set_booster_role(
-            next((r for r in guild_roles if r.is_premium_subscriber_role), None)
+        # Set booster role ID from the roles already included in the fetched guild
+        GlobalState.guild.set_booster_role_id(
+            next((r.id for r in guild.get_roles().values() if r.is_premium_subscriber_role), None)
         )
 
         # Schedule punishment tasks
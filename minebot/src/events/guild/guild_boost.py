@@ -1,5 +1,5 @@
 from logging import Logger
-from typing import Sequence
+from typing import Iterable
 
 import hikari
 import lightbulb
@@ -21,6 +21,9 @@ async def find_booster_role(guild: hikari.GatewayGuild) -> hikari.Role | None:
     """
     Finds and returns the server booster role.
 
+    The guild's cached roles are searched first; the REST API is only queried when the
+    cache holds no roles for the guild.
+
     Args:
         guild: The guild to search for the booster role in
 
@@ -28,7 +31,7 @@ async def find_booster_role(guild: hikari.GatewayGuild) -> hikari.Role | None:
         The booster role if found, None otherwise
     """
     try:
-        guild_roles: Sequence[hikari.Role] = await guild.fetch_roles()
+        guild_roles: Iterable[hikari.Role] = guild.get_roles().values() or await guild.fetch_roles()
         return next((r for r in guild_roles if r.is_premium_subscriber_role), None)
     except Exception as e:
         logger.error(f"Failed to fetch guild roles: {e}")
@@ -48,29 +51,40 @@ async def on_guild_boost(event: hikari.MemberUpdateEvent) -> None:
         logger.debug("Skipping member update event - missing old member data")
         return
 
+    # Most member updates (nicknames, avatars) leave the roles untouched; comparing the role ID
+    # sequences directly skips them before any set is built
+    if event.member.role_ids == event.old_member.role_ids:
+        return
+
+    # Only a newly added role can be the booster role, so updates that only removed roles
+    # stop here without touching the guild or its roles
+    added_role_ids: set[hikari.Snowflake] = set(event.member.role_ids).difference(
+        event.old_member.role_ids
+    )
+    if not added_role_ids:
+        return
+
     guild: hikari.GatewayGuild | None = event.get_guild()
     if not guild:
         logger.warning(f"Unable to get guild for member update event (user: {event.member.id})")
         return
 
-    BOOSTER_ROLE = GlobalState.guild.get_booster_role()
+    BOOSTER_ROLE_ID = GlobalState.guild.get_booster_role_id()
 
-    # Find and cache the booster role if needed
-    if not BOOSTER_ROLE:
+    # Find and cache the booster role ID if needed; only the ID is kept so role updates
+    # never leave a stale role object behind
+    if not BOOSTER_ROLE_ID:
         logger.info("Booster role not cached, attempting to find it")
-        GlobalState.guild.set_booster_role(await find_booster_role(guild))
-        BOOSTER_ROLE = GlobalState.guild.get_booster_role()
-        if not BOOSTER_ROLE:
+        booster_role: hikari.Role | None = await find_booster_role(guild)
+        if not booster_role:
             logger.error(f"Couldn't find booster role in guild {guild.id}")
             return
-        logger.info(f"Cached booster role: {BOOSTER_ROLE.name} ({BOOSTER_ROLE.id})")
-
-    # Get role IDs
-    old_role_ids = set(event.old_member.role_ids)
-    new_role_ids = set(event.member.role_ids)
+        BOOSTER_ROLE_ID = booster_role.id
+        GlobalState.guild.set_booster_role_id(BOOSTER_ROLE_ID)
+        logger.info(f"Cached booster role: {booster_role.name} ({BOOSTER_ROLE_ID})")
 
     # Check if user just received the booster role
-    if BOOSTER_ROLE.id in new_role_ids and BOOSTER_ROLE.id not in old_role_ids:
+    if BOOSTER_ROLE_ID in added_role_ids:
         logger.info(f"User {event.member.username} (ID: {event.member.id}) boosted the server")
 
         try:
@@ -83,10 +97,12 @@ async def on_guild_boost(event: hikari.MemberUpdateEvent) -> None:
                 return
 
             # Process rewards
-            logger.debug(f"Processing rewards for booster {event.member.username}: {rewards}")
-            await MinecraftHelper.add_rewards(event.member, rewards)
+            logger.debug("Processing rewards for booster %s: %s", event.member.username, rewards)
+            if not await MinecraftHelper.add_rewards(event.member, rewards):
+                logger.warning(f"No boost rewards could be given to {event.member.username}")
+                return
 
-            # Send confirmation to log channel
+            # Send confirmation to log channel only once the rewards were given
             await MessageHelper(
                 MessageKeys.events.GUILD_BOOST_LOG_SUCCESS,
                 discord_username=event.member.username,
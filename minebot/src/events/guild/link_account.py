@@ -1,3 +1,4 @@
+import asyncio
 from logging import Logger
 
 import hikari
@@ -11,7 +12,7 @@ from model import CommandsKeys
 from model.schemas import LoggedRewardableCommandConfig, UserReward
 from settings import Settings
 
-helper: CommandHelper = CommandHelper(CommandsKeys.LINK_ACCOUNT)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.LINK_ACCOUNT)
 loader: lightbulb.Loader = helper.get_loader()
 
 logger: Logger = get_logger(__name__)
@@ -35,20 +36,41 @@ async def on_member_create(event: hikari.MemberCreateEvent) -> None:
     # Handle both single role_id and list of role_ids
     role_ids: list[int] = [rewards.role] if isinstance(rewards.role, int) else rewards.role
 
-    # Add role rewards with proper error handling
-    for role_id in role_ids:
-        try:
-            role: hikari.Role = await event.app.rest.fetch_role(event.guild_id, role_id)
-            if role:
-                await event.member.add_role(role, reason="Link account reward")
-                logger.debug(
-                    f"Link Account Reward: Added role '{role.name}' (ID: {role_id}) to member {event.member.display_name} (ID: {event.user_id})"
-                )
-        except hikari.NotFoundError:
+    # Fetch all reward roles concurrently instead of one request after another
+    fetched: list[hikari.Role | BaseException] = await asyncio.gather(
+        *(event.app.rest.fetch_role(event.guild_id, role_id) for role_id in role_ids),
+        return_exceptions=True,
+    )
+
+    roles: list[hikari.Role] = []
+    for role_id, role in zip(role_ids, fetched):
+        if isinstance(role, hikari.NotFoundError):
             logger.warning(
                 f"Link Account Reward Failed: Role ID {role_id} not found in guild '{event.guild_id}'. Check if the role still exists."
             )
-        except Exception as e:
+        elif isinstance(role, BaseException):
+            logger.error(
+                f"Link Account Reward Error: Failed to add role ID {role_id} to {event.member.display_name} (ID: {event.user_id}). Error: {type(role).__name__}: {role}"
+            )
+        elif role:
+            roles.append(role)
+
+    # Add role rewards concurrently with proper error handling
+    results: list[None | BaseException] = await asyncio.gather(
+        *(event.member.add_role(role, reason="Link account reward") for role in roles),
+        return_exceptions=True,
+    )
+
+    for role, result in zip(roles, results):
+        if isinstance(result, BaseException):
             logger.error(
-                f"Link Account Reward Error: Failed to add role ID {role_id} to {event.member.display_name} (ID: {event.user_id}). Error: {type(e).__name__}: {e}"
+                f"Link Account Reward Error: Failed to add role ID {role.id} to {event.member.display_name} (ID: {event.user_id}). Error: {type(result).__name__}: {result}"
+            )
+        else:
+            logger.debug(
+                "Link Account Reward: Added role '%s' (ID: %s) to member %s (ID: %s)",
+                role.name,
+                role.id,
+                event.member.display_name,
+                event.user_id,
             )
@@ -1,18 +1,18 @@
-from datetime import datetime, timezone
+import asyncio
 
 import hikari
 import lightbulb
 
 from core import GlobalState
 from database.schemas import PunishmentLogSchema
-from database.services import PunishmentLogService, UserService
+from database.services import UserService
 from helper import CommandHelper, MessageHelper, PunishmentHelper, UserHelper
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType
 from websocket import WebSocketManager
 from websocket.schemas.event import CommandExecutedSchema
 
 # Helper that manages event configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.KICK)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.KICK)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -33,43 +33,29 @@ async def on_kick_create(event: hikari.AuditLogEntryCreateEvent) -> None:
     if (staff_id := event.entry.user_id) is None:
         return
 
-    # --- Check for duplicate entries ---
-    # Get the most recent kick for this user
-    punishment = await PunishmentLogService.get_filtered_punishment_logs(
-        user_id=target_id, punishment_type=PunishmentType.KICK, get_latest=True
-    )
-
-    create_new_entry = True
-
-    # Convert event timestamp to UTC datetime
-    event_time = datetime.fromtimestamp(event.entry.id.created_at.timestamp(), tz=timezone.utc)
-
-    # Check if this is a duplicate entry (within 120 seconds window)
-    if punishment:
-        assert isinstance(punishment, PunishmentLogSchema)
-
-        punishment_time = punishment.created_at.replace(tzinfo=timezone.utc)
-        time_diff = abs((event_time - punishment_time).total_seconds())
-
-        # If a recent punishment log exists, don't create a new one
-        if time_diff < 120:
-            create_new_entry = False
+    # --- Skip the rest if the punishment is neither synchronized nor logged ---
+    if (
+        not GlobalState.commands.is_discord_to_minecraft(PunishmentType.KICK)
+        and not helper.get_log_channel_id()
+    ):
+        return
 
-    # --- Get and process kick reason ---
+    # --- Reuse the log of a recent duplicate or create a new database entry ---
+    # Without a log from the last two minutes, this is likely a kick performed outside the
+    # bot's commands
     reason_messages = PunishmentHelper.get_reason(event.entry.reason, None)
-
-    # --- Create database entry if needed ---
-    if create_new_entry:
-        # This is likely a kick performed outside the bot's commands
-        punishment = await PunishmentLogService.create_or_update_punishment_log(
-            PunishmentLogSchema(
-                user_id=target_id,
-                punishment_type=PunishmentType.KICK,
-                reason=reason_messages[1],
-                staff_id=staff_id,
-                source=PunishmentSource.DISCORD,
-            )
-        )
+    punishment = await PunishmentHelper.find_or_write_punishment_log(
+        target_id,
+        PunishmentType.KICK,
+        event.entry.id.created_at,
+        lambda: PunishmentLogSchema(
+            user_id=target_id,
+            punishment_type=PunishmentType.KICK,
+            reason=reason_messages[1],
+            staff_id=staff_id,
+            source=PunishmentSource.DISCORD,
+        ),
+    )
 
     if not punishment:  # Safety check - don't proceed if no punishment record exists
         return
@@ -92,15 +78,16 @@ async def on_kick_create(event: hikari.AuditLogEntryCreateEvent) -> None:
             )
         )
 
-    # --- Fetch user information for logging ---
-    target_member = await UserHelper.fetch_user(target_id)
-    staff_member = await UserHelper.fetch_user(punishment.staff_id)
+    # --- Fetch user information for logging; both lookups are independent ---
+    target_member, staff_member = await asyncio.gather(
+        UserHelper.fetch_user(target_id), UserHelper.fetch_user(punishment.staff_id)
+    )
 
     if target_member is None or staff_member is None:
         return
 
     # --- Send log message ---
-    await MessageHelper(
+    MessageHelper(
         MessageKeys.commands.KICK_LOG_SUCCESS,
         discord_username=target_member.username,
         discord_user_id=str(target_member.id),
@@ -109,4 +96,4 @@ async def on_kick_create(event: hikari.AuditLogEntryCreateEvent) -> None:
         discord_staff_user_id=str(staff_member.id),
         discord_staff_user_mention=staff_member.mention,
         reason=punishment.reason,  # Staff-facing/detailed reason
-    ).send_to_log_channel(helper)
+    ).send_to_log_channel_in_background(helper)
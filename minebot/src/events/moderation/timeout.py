@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import cast
 
@@ -13,7 +14,7 @@ from websocket import WebSocketManager
 from websocket.schemas.event import CommandExecutedSchema
 
 # Helper that manages event configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.TIMEOUT)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.TIMEOUT)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -32,11 +33,12 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
         return
 
     # Ensure this is a timeout-related member update
-    if not event.entry.changes or event.entry.changes[0].key != "communication_disabled_until":
+    changes = event.entry.changes
+    if not changes or (change := changes[0]).key != "communication_disabled_until":
         return
 
     # Check if a timeout was applied (not removed)
-    if (communication_disabled_until := event.entry.changes[0].new_value) is None:
+    if (communication_disabled_until := change.new_value) is None:
         return
 
     # Staff member who performed the action
@@ -45,67 +47,72 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
 
     communication_disabled_until = cast(datetime, communication_disabled_until)
 
-    # --- Check if that the refresh timeout ---
-    temp_punishment = await TemporaryActionService.get_filtered_temporoary_action_logs(
-        user_id=target_id, punishment_type=PunishmentType.TIMEOUT, get_latest=True
-    )
+    # --- Skip the rest if the punishment is neither synchronized nor logged ---
+    if (
+        not GlobalState.commands.is_discord_to_minecraft(PunishmentType.TIMEOUT)
+        and not helper.get_log_channel_id()
+    ):
+        return
 
-    if temp_punishment:
-        assert isinstance(temp_punishment, TemporaryActionSchema)
+    # Serialize the duplicate check and the log write with other handlers for this user
+    async with PunishmentHelper.get_user_lock(target_id):
+        # --- Fetch the latest timeout log and temporary action together ---
+        punishment, temp_punishment = await asyncio.gather(
+            PunishmentLogService.get_latest_punishment_log(target_id, PunishmentType.TIMEOUT),
+            TemporaryActionService.get_filtered_temporoary_action_logs(
+                user_id=target_id, punishment_type=PunishmentType.TIMEOUT, get_latest=True
+            ),
+        )
 
-        # Convert event timestamp to UTC datetime for comparison
-        event_time = datetime.fromtimestamp(event.entry.id.created_at.timestamp(), tz=timezone.utc)
-        punishment_time = temp_punishment.created_at.replace(tzinfo=timezone.utc)
-        time_diff = (event_time - punishment_time).total_seconds()
+        # Snowflake timestamps are already timezone-aware UTC datetimes
+        event_time = event.entry.id.created_at
 
-        # If the punishment was created earlier (than 120 seconds), consider it as a renewal
-        if abs(time_diff) > 120:
-            return
+        # --- Check if that the refresh timeout ---
+        if temp_punishment:
+            assert isinstance(temp_punishment, TemporaryActionSchema)
 
-    # --- Check for duplicate entries ---
-    # Get the most recent timeout for this user
-    punishment = await PunishmentLogService.get_filtered_punishment_logs(
-        user_id=target_id, punishment_type=PunishmentType.TIMEOUT, get_latest=True
-    )
+            punishment_time = temp_punishment.created_at.replace(tzinfo=timezone.utc)
+            time_diff = (event_time - punishment_time).total_seconds()
 
-    # Check if the punishment is recent enough to correspond to this timeout event
-    # or if we need to create a new punishment log
-    create_new_entry = True
+            # If the punishment was created earlier (than 120 seconds), consider it as a renewal
+            if abs(time_diff) > PunishmentHelper.DUPLICATE_WINDOW:
+                return
 
-    if punishment:
-        assert isinstance(punishment, PunishmentLogSchema)
+        # --- Check for duplicate entries ---
+        # Check if the punishment is recent enough to correspond to this timeout event
+        # or if we need to create a new punishment log
+        create_new_entry = True
 
-        # Convert event timestamp to UTC datetime for comparison
-        event_time = datetime.fromtimestamp(event.entry.id.created_at.timestamp(), tz=timezone.utc)
-        punishment_time = punishment.created_at.replace(tzinfo=timezone.utc)
-        time_diff = (event_time - punishment_time).total_seconds()
+        if punishment:
+            punishment_time = punishment.created_at.replace(tzinfo=timezone.utc)
+            time_diff = (event_time - punishment_time).total_seconds()
 
-        # If the punishment was created recently (within 120 seconds), consider it the same timeout
-        if abs(time_diff) < 120:
-            create_new_entry = False
+            # If the punishment was created recently (within 120 seconds), consider it the same timeout
+            if abs(time_diff) < PunishmentHelper.DUPLICATE_WINDOW:
+                create_new_entry = False
 
-    # --- Create new punishment entry if needed ---
-    if create_new_entry:
-        # Process reason from audit log
-        reason_messages = PunishmentHelper.get_reason(event.entry.reason, None)
+        # --- Create new punishment entry if needed ---
+        if create_new_entry:
+            # Process reason from audit log
+            reason_messages = PunishmentHelper.get_reason(event.entry.reason, None)
 
-        # Calculate timeout duration in seconds
-        duration_seconds = int(
-            (communication_disabled_until - datetime.now(timezone.utc)).total_seconds()
-        )
+            # Calculate timeout duration in seconds
+            duration_seconds = int(
+                (communication_disabled_until - datetime.now(timezone.utc)).total_seconds()
+            )
 
-        # Create punishment log entry
-        punishment = await PunishmentLogService.create_or_update_punishment_log(
-            PunishmentLogSchema(
-                user_id=target_id,
-                punishment_type=PunishmentType.TIMEOUT,
-                reason=reason_messages[1],
-                staff_id=staff_id,
-                duration=duration_seconds,
-                expires_at=communication_disabled_until,
-                source=PunishmentSource.DISCORD,
+            # Create punishment log entry
+            punishment = await PunishmentLogService.write_punishment_log(
+                PunishmentLogSchema(
+                    user_id=target_id,
+                    punishment_type=PunishmentType.TIMEOUT,
+                    reason=reason_messages[1],
+                    staff_id=staff_id,
+                    duration=duration_seconds,
+                    expires_at=communication_disabled_until,
+                    source=PunishmentSource.DISCORD,
+                )
             )
-        )
 
     # Safety check - don't proceed if no punishment record exists
     if not punishment:
@@ -137,15 +144,16 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
             )
         )
 
-    # --- Fetch user information for logging ---
-    target_member = await UserHelper.fetch_member(target_id)
-    staff_member = await UserHelper.fetch_member(punishment.staff_id)
+    # --- Fetch user information for logging; both lookups are independent ---
+    target_member, staff_member = await asyncio.gather(
+        UserHelper.fetch_member(target_id), UserHelper.fetch_member(punishment.staff_id)
+    )
 
     if target_member is None or staff_member is None:
         return
 
     # --- Send log message ---
-    await MessageHelper(
+    MessageHelper(
         MessageKeys.commands.TIMEOUT_LOG_SUCCESS,
         discord_username=target_member.username,
         discord_user_id=str(target_member.id),
@@ -153,6 +161,6 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
         discord_staff_username=staff_member.username,
         discord_staff_user_id=str(staff_member.id),
         discord_staff_user_mention=staff_member.mention,
-        duration=TimeHelper().from_timedelta(timedelta(seconds=punishment.duration)),
+        duration=TimeHelper.for_locale().from_timedelta(timedelta(seconds=punishment.duration)),
         reason=punishment.reason,  # Staff-facing/detailed reason
-    ).send_to_log_channel(helper)
+    ).send_to_log_channel_in_background(helper)
@@ -1,17 +1,17 @@
-from datetime import datetime, timezone
+import asyncio
 
 import hikari
 import lightbulb
 
 from core import GlobalState
 from database.schemas import PunishmentLogSchema, TemporaryActionSchema
-from database.services import PunishmentLogService, TemporaryActionService, UserService
+from database.services import TemporaryActionService, UserService
 from helper import CommandHelper, MessageHelper, PunishmentHelper, UserHelper
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType
 from websocket import WebSocketManager
 from websocket.schemas.event import CommandExecutedSchema
 
-helper: CommandHelper = CommandHelper(CommandsKeys.UNBAN)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.UNBAN)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -26,11 +26,12 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
         return
 
     # Ensure this is a timeout-related member update
-    if not event.entry.changes or event.entry.changes[0].key != "communication_disabled_until":
+    changes = event.entry.changes
+    if not changes or (change := changes[0]).key != "communication_disabled_until":
         return
 
     # Check if a timeout was remove (not applied)
-    if event.entry.changes[0].new_value is not None:
+    if change.new_value is not None:
         return
 
     # Staff member who performed the action
@@ -48,39 +49,29 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
         await TemporaryActionService.delete_temporary_action(temp_punishment.id)
         GlobalState.tasks.cancel_task(target_id, PunishmentType.TIMEOUT)
 
-    # --- Check for duplicate entries ---
-    create_new_entry = True
-
-    # Convert event timestamp to UTC datetime
-    event_time = datetime.fromtimestamp(event.entry.id.created_at.timestamp(), tz=timezone.utc)
-
-    punishment = await PunishmentLogService.get_filtered_punishment_logs(
-        user_id=target_id, punishment_type=PunishmentType.UNTIMEOUT, get_latest=True
-    )
-
-    if punishment:
-        assert isinstance(punishment, PunishmentLogSchema)
-
-        punishment_time = punishment.created_at.replace(tzinfo=timezone.utc)
-        time_diff = abs((event_time - punishment_time).total_seconds())
-
-        # If a recent punishment log exists, don't create a new one
-        if time_diff < 120:
-            create_new_entry = False
+    # --- Skip the rest if the punishment is neither synchronized nor logged ---
+    if (
+        not GlobalState.commands.is_discord_to_minecraft(PunishmentType.UNTIMEOUT)
+        and not helper.get_log_channel_id()
+    ):
+        return
 
-    # --- Create new punishment entry if needed ---
+    # --- Reuse the log of a recent duplicate or create a new database entry ---
+    # Without a log from the last two minutes, this is likely a timeout removal performed outside the
+    # bot's commands
     reason_messages = PunishmentHelper.get_reason(event.entry.reason, None)
-
-    if create_new_entry:
-        await PunishmentLogService.create_or_update_punishment_log(
-            PunishmentLogSchema(
-                user_id=target_id,
-                punishment_type=PunishmentType.UNTIMEOUT,
-                reason=reason_messages[1],
-                staff_id=staff_id,
-                source=PunishmentSource.DISCORD,
-            )
-        )
+    punishment = await PunishmentHelper.find_or_write_punishment_log(
+        target_id,
+        PunishmentType.UNTIMEOUT,
+        event.entry.id.created_at,
+        lambda: PunishmentLogSchema(
+            user_id=target_id,
+            punishment_type=PunishmentType.UNTIMEOUT,
+            reason=reason_messages[1],
+            staff_id=staff_id,
+            source=PunishmentSource.DISCORD,
+        ),
+    )
 
     if not punishment:
         return
@@ -106,15 +97,16 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
             )
         )
 
-    # --- Fetch user information for logging ---
-    target_member = await UserHelper.fetch_user(target_id)
-    staff_member = await UserHelper.fetch_user(punishment.staff_id)
+    # --- Fetch user information for logging; both lookups are independent ---
+    target_member, staff_member = await asyncio.gather(
+        UserHelper.fetch_user(target_id), UserHelper.fetch_user(punishment.staff_id)
+    )
 
     if target_member is None or staff_member is None:
         return
 
     # --- Send log message ---
-    await MessageHelper(
+    MessageHelper(
         MessageKeys.commands.UNTIMEOUT_LOG_SUCCESS,
         discord_username=target_member.username,
         discord_user_id=str(target_member.id),
@@ -123,4 +115,4 @@ async def on_member_update(event: hikari.AuditLogEntryCreateEvent) -> None:
         discord_staff_user_id=str(staff_member.id),
         discord_staff_user_mention=staff_member.mention,
         reason=punishment.reason,
-    ).send_to_log_channel(helper)
+    ).send_to_log_channel_in_background(helper)
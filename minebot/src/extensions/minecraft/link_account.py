@@ -1,6 +1,8 @@
 import asyncio
+import itertools
 import secrets
-import uuid
+from functools import lru_cache
+from typing import cast
 
 import hikari
 import lightbulb
@@ -8,12 +10,33 @@ import lightbulb
 from components.modals.link_account import LinkAccountConfirmModal
 from helper import CommandHelper, MessageHelper, MinecraftHelper
 from hooks.minecraft import verify_minecraft_account_link
-from model import CommandsKeys, MessageKeys, MessageType
+from model import CommandsKeys, MessageKeys, MessageType, TextMessage
+from settings import Localization
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.LINK_ACCOUNT)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.LINK_ACCOUNT)
 loader: lightbulb.Loader = helper.get_loader()
 
+# Modal IDs only need to be unique within this process, so a counter replaces random UUIDs
+_modal_counter: itertools.count[int] = itertools.count()
+
+
+@lru_cache(maxsize=64)
+def _get_confirmation_code_template(locale: str) -> str:
+    """
+    Get the localized in-game confirmation code message, still containing its placeholders.
+
+    Only the code changes between invocations and localizations are loaded once at startup, so
+    each locale's template is looked up once and formatted per invocation.
+    """
+    content = cast(
+        TextMessage,
+        Localization.get(
+            key=MessageKeys.commands.LINK_ACCOUNT_MINECRAFT_CONFIRMATION_CODE, locale=locale
+        ),
+    )
+    return content.text or ""
+
 
 @loader.command
 class LinkAccount(
@@ -53,20 +76,17 @@ class LinkAccount(
             ).send_response(ctx, ephemeral=True)
             return  # Exit if player is not online
 
-        # Send verification code to the Minecraft player in-game
-        await MinecraftHelper.send_player_message(
-            message_type=MessageType.INFO,
-            username=self.username,
-            message=MessageHelper(
-                key=MessageKeys.commands.LINK_ACCOUNT_MINECRAFT_CONFIRMATION_CODE,
-                locale=user_locale,
-                confirmation_code=code,
-            )._decode_plain(),
+        # Send verification code to the Minecraft player in-game and get the player's
+        # Minecraft UUID for storing in the account link; neither depends on the other
+        _, player_uuid = await asyncio.gather(
+            MinecraftHelper.send_player_message(
+                message_type=MessageType.INFO,
+                username=self.username,
+                message=_get_confirmation_code_template(user_locale).format(confirmation_code=code),
+            ),
+            MinecraftHelper.fetch_player_uuid(self.username),
         )
 
-        # Get the player's Minecraft UUID for storing in the account link
-        player_uuid: str | None = await MinecraftHelper.fetch_player_uuid(self.username)
-
         # Create the modal dialog for the user to enter the verification code
         modal = LinkAccountConfirmModal(
             username=self.username,
@@ -77,8 +97,10 @@ class LinkAccount(
         )
 
         # Display the modal and wait for user input
-        # Generate a random ID for this specific modal instance
-        await ctx.respond_with_modal(modal.title, c_id := str(uuid.uuid4()), components=modal)
+        # Generate a unique ID for this specific modal instance
+        await ctx.respond_with_modal(
+            modal.title, c_id := f"link-{next(_modal_counter)}", components=modal
+        )
         try:
             # Wait for the user to submit the modal
             await modal.attach(ctx.client, c_id)
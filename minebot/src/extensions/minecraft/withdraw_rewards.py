@@ -8,7 +8,7 @@ from hooks.minecraft import verify_minecraft_account_link
 from model import CommandsKeys, MessageKeys
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.WITHDRAW_REWARDS)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.WITHDRAW_REWARDS)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -42,6 +42,13 @@ class WithdrawRewards(
                 "minecraft_uuid": user_data.minecraft_uuid,
             }
 
+            # Log successful reward withdrawal in log channel; the log message does not depend
+            # on the response, so it is started first and sent alongside it
+            MessageHelper(
+                MessageKeys.commands.WITHDRAW_REWARDS_LOG_SUCCESS,
+                **default_params,
+                **minecraft_params,
+            ).send_to_log_channel_in_background(helper)
             # Send success message to the user
             await MessageHelper(
                 MessageKeys.commands.WITHDRAW_REWARDS_USER_SUCCESS,
@@ -49,18 +56,12 @@ class WithdrawRewards(
                 **default_params,
                 **minecraft_params,
             ).send_response(ctx, ephemeral=True)
-            # Log successful reward withdrawal in log channel
-            await MessageHelper(
-                MessageKeys.commands.WITHDRAW_REWARDS_LOG_SUCCESS,
-                **default_params,
-                **minecraft_params,
-            ).send_to_log_channel(helper)
         else:
+            # Log failed reward withdrawal attempt in log channel alongside the response
+            MessageHelper(
+                MessageKeys.commands.WITHDRAW_REWARDS_LOG_FAILURE, **default_params
+            ).send_to_log_channel_in_background(helper)
             # Rewards could not be given - notify user of failure
             await MessageHelper(
                 MessageKeys.commands.WITHDRAW_REWARDS_USER_FAILURE, **default_params
             ).send_response(ctx, ephemeral=True)
-            # Log failed reward withdrawal attempt in log channel
-            await MessageHelper(
-                MessageKeys.commands.WITHDRAW_REWARDS_LOG_FAILURE, **default_params
-            ).send_to_log_channel(helper)
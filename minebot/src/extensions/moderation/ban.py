@@ -1,16 +1,22 @@
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
 import hikari
 import lightbulb
 
-from core import GlobalState
 from database.schemas import PunishmentLogSchema, TemporaryActionSchema
 from database.services import PunishmentLogService, TemporaryActionService
-from helper import CommandHelper, MessageHelper, PunishmentHelper, TimeHelper, UserHelper
+from helper import (
+    CommandHelper,
+    MessageHelper,
+    PunishmentHelper,
+    TimeHelper,
+    UnbanScheduler,
+    UserHelper,
+)
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType
 
 # Helper that manages command configuration and localization
-helper = CommandHelper(CommandsKeys.BAN)
+helper = CommandHelper.get(CommandsKeys.BAN)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -46,14 +52,10 @@ class Ban(
     )
 
     async def _handle_temporary_ban(
-        self,
-        ctx: lightbulb.Context,
-        target_member: hikari.Member,
-        parsed_duration: timedelta,
+        self, target_member: hikari.Member, expires_at: datetime
     ) -> None:
         """Handle the creation and scheduling of a temporary ban."""
         # Persist temporary ban information to database with expiration
-        expires_at = datetime.now(timezone.utc) + parsed_duration
         temporary_action = await TemporaryActionService.create_or_update_temporary_action(
             TemporaryActionSchema(
                 user_id=target_member.id,
@@ -62,31 +64,11 @@ class Ban(
             )
         )
 
-        # Register timed task to automatically unban when duration expires
-        @ctx.client.task(
-            lightbulb.uniformtrigger(seconds=int(parsed_duration.total_seconds())),
-            max_invocations=1,
-        )
-        async def handle_temporary_ban() -> None:
-            try:
-                # Remove the ban when time period completes
-                await target_member.unban(
-                    reason=MessageHelper(key=MessageKeys.general.NO_REASON)._decode_plain()
-                )
-
-                # Remove temporary action record from database after completion
-                if temporary_action.id is not None:
-                    await TemporaryActionService.delete_temporary_action(temporary_action.id)
-
-                # Remove the task from global state to prevent re-execution
-                GlobalState.tasks.remove_task(target_member, PunishmentType.BAN)
-            except Exception as e:
-                # Record error details for debugging and monitoring
-                print(f"Error in temporary ban handler: {e}")
-
-        GlobalState.tasks.add_or_refresh_task(
-            target_member, PunishmentType.BAN, handle_temporary_ban
-        )
+        # Queue the automatic unban for when the duration expires
+        if temporary_action.id is not None:
+            UnbanScheduler.schedule(
+                target_member.id, target_member.guild_id, expires_at, temporary_action.id
+            )
 
     @lightbulb.invoke
     async def invoke(self, ctx: lightbulb.Context) -> None:
@@ -110,54 +92,48 @@ class Ban(
             return
 
         # Setup timing variables for temporary ban processing
-        parsed_duration = timedelta(0)
         formatted_duration = None
+        duration_seconds = None
         expiry = None
 
         # Process duration parameter if specified by moderator
         if self.duration:
-            time_helper = TimeHelper(ctx.interaction.locale)
+            time_helper = TimeHelper.for_locale(ctx.interaction.locale)
             parsed_duration = time_helper.parse_time_string(self.duration)
+            formatted_duration = time_helper.from_timedelta(parsed_duration)
 
             # Configure temporary ban only for valid positive durations
-            if parsed_duration.total_seconds() > 0:
-                formatted_duration = time_helper.from_timedelta(parsed_duration)
+            total_seconds = parsed_duration.total_seconds()
+            if total_seconds > 0:
+                duration_seconds = int(total_seconds)
                 expiry = datetime.now(timezone.utc) + parsed_duration
 
         # Generate appropriate reason text for logging and notifications
         reason_messages = PunishmentHelper.get_reason(self.reason, ctx.interaction.locale)
 
-        # Set up automatic unban for temporary bans
-        if self.duration and parsed_duration.total_seconds() > 0:
-            await self._handle_temporary_ban(ctx, target_member, parsed_duration)
-
-        # Record punishment details in moderation history database
-        duration_seconds = (
-            int(parsed_duration.total_seconds()) if parsed_duration.total_seconds() > 0 else None
-        )
-        await PunishmentLogService.create_or_update_punishment_log(
-            PunishmentLogSchema(
-                user_id=target_member.id,
-                punishment_type=PunishmentType.BAN,
-                reason=reason_messages[1],
-                staff_id=ctx.member.id,
-                duration=duration_seconds,
-                expires_at=expiry,  # Will be None for permanent bans
-                source=PunishmentSource.DISCORD,
+        # Set up automatic unban for temporary bans, reusing the expiry computed above
+        if expiry is not None:
+            await self._handle_temporary_ban(target_member, expiry)
+
+        # Hold the user's lock so the ban audit listener sees this log before checking for one
+        async with PunishmentHelper.get_user_lock(target_member.id):
+            # Record punishment details in moderation history database
+            await PunishmentLogService.write_punishment_log(
+                PunishmentLogSchema(
+                    user_id=target_member.id,
+                    punishment_type=PunishmentType.BAN,
+                    reason=reason_messages[1],
+                    staff_id=ctx.member.id,
+                    duration=duration_seconds,
+                    expires_at=expiry,  # Will be None for permanent bans
+                    source=PunishmentSource.DISCORD,
+                )
             )
-        )
 
-        # Apply the ban through Discord API with moderator reason
-        await target_member.ban(reason=reason_messages[1])
+            # Apply the ban through Discord API with moderator reason
+            await target_member.ban(reason=reason_messages[1])
 
         # Notify moderator of successful action with duration details
-        if formatted_duration is None and self.duration:
-            # Initialize time formatter if not already available
-            time_helper = (
-                TimeHelper(ctx.interaction.locale) if "time_helper" not in locals() else time_helper
-            )
-            formatted_duration = time_helper.from_timedelta(parsed_duration)
-
         await MessageHelper(
             MessageKeys.commands.BAN_USER_SUCCESS,
             locale=ctx.interaction.locale,
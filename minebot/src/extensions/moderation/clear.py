@@ -1,4 +1,6 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
+from typing import Final, Sequence
 
 import hikari
 import lightbulb
@@ -7,9 +9,15 @@ from helper import CommandHelper, MessageHelper, PunishmentHelper
 from model import CommandsKeys, MessageKeys
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.CLEAR)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.CLEAR)
 loader: lightbulb.Loader = helper.get_loader()
 
+# Discord's bulk delete endpoint accepts at most 100 messages per request
+BULK_DELETE_CHUNK_SIZE: Final[int] = 100
+# Upper bound on bulk delete requests in flight at once; they share the channel's rate limit
+# bucket, which hikari's limiter drains proactively instead of running into 429 responses
+MAX_CONCURRENT_BULK_DELETES: Final[int] = 5
+
 
 @loader.command
 class Clear(
@@ -42,50 +50,73 @@ class Clear(
         reason_messages = PunishmentHelper.get_reason(self.reason, ctx.interaction.locale)
 
         # Calculate bulk delete limit (Discord API restriction: can't delete messages older than 14 days)
-        bulk_delete_limit = datetime.now(timezone.utc) - timedelta(days=14)
+        # The current time is captured once and shared by both bounds
+        now = datetime.now(timezone.utc)
+        bulk_delete_limit = now - timedelta(days=14)
 
         # Create message iterator with appropriate filters:
-        # - Messages must be newer than 14 days old (Discord API limitation)
-        # - Messages must be older than the current time (avoid potential race conditions)
+        # - Messages must be older than the invocation time (avoid potential race conditions);
+        #   Discord applies this bound itself, so fetched messages need no per-message check
+        # - Messages must be newer than 14 days old (Discord API limitation); history is
+        #   returned newest first, so iteration stops at the first older message
         # - Limit to the requested amount of messages
         iterator = (
-            ctx.client.rest.fetch_messages(ctx.channel_id)
+            ctx.client.rest.fetch_messages(ctx.channel_id, before=now)
             .take_while(lambda m: m.created_at > bulk_delete_limit)
-            .filter(lambda m: m.created_at < datetime.now(timezone.utc))
             .limit(self.amount)
         )
 
-        # Convert iterator to a list of messages to be deleted
-        messages_to_delete = await iterator.collect(list)
+        # Execute the bulk deletion with audit log reason; hikari sends the chunks of a single
+        # call one after another, so each chunk is dispatched as its own request instead
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_BULK_DELETES)
+        deleted_amount = 0
+
+        async def delete_chunk(chunk: Sequence[hikari.Message]) -> None:
+            nonlocal deleted_amount
+            async with semaphore:
+                await ctx.client.rest.delete_messages(
+                    ctx.channel_id, chunk, reason=reason_messages[1]
+                )
+            deleted_amount += len(chunk)
+
+        # Each chunk is deleted as soon as it is fetched, so deleting overlaps paging through
+        # the rest of the history
+        deletions: list[asyncio.Task[None]] = []
+        try:
+            async for chunk in iterator.chunk(BULK_DELETE_CHUNK_SIZE):
+                deletions.append(asyncio.create_task(delete_chunk(chunk)))
+
+            await asyncio.gather(*deletions)
+        finally:
+            # If fetching or a deletion failed, stop the chunks still pending and wait for all of
+            # them, so none outlives the command or leaves its exception unretrieved
+            for deletion in deletions:
+                deletion.cancel()
+            await asyncio.gather(*deletions, return_exceptions=True)
 
         # Common parameters for feedback messages to avoid repetition
         common_params = {
             "channel_name": ctx.interaction.channel.name,
             "channel_id": ctx.channel_id,
             "channel_mention": ctx.interaction.channel.mention,
-            "amount": len(messages_to_delete),  # Get actual count of messages to be deleted
+            "amount": deleted_amount,  # Count of messages whose deletion succeeded
         }
 
-        # Execute the bulk deletion operation with audit log reason
-        await ctx.client.rest.delete_messages(
-            ctx.channel_id, messages_to_delete, reason=reason_messages[1]
-        )
-
         # Send confirmation message to the moderator with deletion details
-        await MessageHelper(
+        user_message = MessageHelper(
             MessageKeys.commands.CLEAR_USER_SUCCESS,
             ctx.interaction.locale,
             reason=reason_messages[0],  # User-facing reason
             **common_params,
-        ).send_response(ctx, ephemeral=True)
+        )
+        await user_message.send_response(ctx, ephemeral=True)
 
-        # Send notification to moderation log channel for accountability
-        await MessageHelper(
+        # Send notification to moderation log channel for accountability without waiting for
+        # it; the log message reuses the response's locale and channel parameters
+        user_message.clone_with(
             MessageKeys.commands.CLEAR_LOG_SUCCESS,
-            ctx.interaction.locale,
             discord_staff_username=ctx.user.username,
             discord_staff_user_id=ctx.user.id,
             discord_staff_user_mention=ctx.user.mention,
             reason=reason_messages[1],  # Audit log reason
-            **common_params,
-        ).send_to_log_channel(helper)
+        ).send_to_log_channel_in_background(helper)
@@ -2,12 +2,11 @@ import hikari
 import lightbulb
 
 from database.schemas import PunishmentLogSchema
-from database.services import PunishmentLogService
 from helper import CommandHelper, MessageHelper, PunishmentHelper, UserHelper
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.KICK)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.KICK)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -59,20 +58,19 @@ class Kick(
         # Process reason parameter for both user-facing messages and audit logs
         reason_messages = PunishmentHelper.get_reason(self.reason, ctx.interaction.locale)
 
-        # Record the punishment in the database for tracking and reporting
-        await PunishmentLogService.create_or_update_punishment_log(
+        # Record the punishment in the database for tracking and reporting while the kick is
+        # executed with the reason for audit logs
+        await PunishmentHelper.write_log_alongside(
             PunishmentLogSchema(
                 user_id=target_member.id,
                 punishment_type=PunishmentType.KICK,
                 reason=reason_messages[1],  # Store the detailed reason
                 staff_id=ctx.user.id,  # Track which staff member performed the action
                 source=PunishmentSource.DISCORD,  # Indicate source of punishment
-            )
+            ),
+            target_member.kick(reason=reason_messages[1]),
         )
 
-        # Execute the actual kick operation with the reason for audit logs
-        await target_member.kick(reason=reason_messages[1])
-
         # Notify the moderator that the kick was successful
         # Ephemeral response ensures only the command user sees the confirmation
         await MessageHelper(
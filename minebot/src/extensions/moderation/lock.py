@@ -5,7 +5,7 @@ from helper import ChannelHelper, CommandHelper, MessageHelper, PunishmentHelper
 from model import CommandsKeys, MessageKeys
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.LOCK)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.LOCK)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -55,6 +55,18 @@ class Lock(
             ).send_response(ctx, ephemeral=True)
             return
 
+        # Skip the request when @everyone is already denied sending messages
+        everyone_overwrite = channel.permission_overwrites.get(hikari.Snowflake(ctx.guild_id))
+        if everyone_overwrite and hikari.Permissions.SEND_MESSAGES in everyone_overwrite.deny:
+            await MessageHelper(
+                MessageKeys.error.CHANNEL_ALREADY_LOCKED,
+                ctx.interaction.locale,
+                channel_name=channel.name,
+                channel_id=channel.id,
+                channel_mention=channel.mention,
+            ).send_response(ctx, ephemeral=True)
+            return
+
         # Apply permission overwrite to disable message sending for @everyone role
         await channel.edit_overwrite(
             target=ctx.guild_id,  # Target is @everyone role (same ID as guild)
@@ -71,20 +83,20 @@ class Lock(
         }
 
         # Notify moderator of successful action
-        await MessageHelper(
+        user_message = MessageHelper(
             MessageKeys.commands.LOCK_USER_SUCCESS,
             ctx.interaction.locale,
             **common_params,
             reason=reason_messages[0],  # User-facing reason
-        ).send_response(ctx, ephemeral=True)
+        )
+        await user_message.send_response(ctx, ephemeral=True)
 
-        # Log action to designated logging channel for moderation transparency
-        await MessageHelper(
+        # Log action to designated logging channel for moderation transparency, reusing the
+        # response's locale and channel parameters; the command does not wait for it
+        user_message.clone_with(
             MessageKeys.commands.LOCK_LOG_SUCCESS,
-            ctx.interaction.locale,
-            **common_params,
             discord_staff_username=ctx.user.username,
             discord_staff_user_id=ctx.user.id,
             discord_staff_user_mention=ctx.user.mention,
             reason=reason_messages[1],  # Staff/audit log reason
-        ).send_to_log_channel(helper)
+        ).send_to_log_channel_in_background(helper)
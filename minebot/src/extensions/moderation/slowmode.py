@@ -7,7 +7,7 @@ from helper import ChannelHelper, CommandHelper, MessageHelper, PunishmentHelper
 from model import CommandsKeys, MessageKeys
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.SLOWMODE)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.SLOWMODE)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -64,13 +64,14 @@ class Slowmode(
             ).send_response(ctx, ephemeral=True)
             return
 
-        # Parse duration string into timedelta object
-        duration = TimeHelper(ctx.interaction.locale).parse_time_string(self.duration)
+        # Parse duration string into timedelta object; one helper serves every duration below
+        time_helper = TimeHelper.for_locale(ctx.interaction.locale)
+        duration = time_helper.parse_time_string(self.duration)
 
         # Ensure the duration is within allowed bounds (0 to 6 hours)
         if duration > timedelta(hours=6):
-            min_duration = TimeHelper(ctx.interaction.locale).from_timedelta(timedelta(seconds=0))
-            max_duration = TimeHelper(ctx.interaction.locale).from_timedelta(timedelta(hours=6))
+            min_duration = time_helper.from_timedelta(timedelta(seconds=0))
+            max_duration = time_helper.from_timedelta(timedelta(hours=6))
             await MessageHelper(
                 MessageKeys.error.DURATION_OUT_OF_RANGE,
                 ctx.interaction.locale,
@@ -87,24 +88,24 @@ class Slowmode(
             "channel_name": channel.name,
             "channel_id": channel.id,
             "channel_mention": channel.mention,
-            "duration": TimeHelper(ctx.interaction.locale).from_timedelta(duration),
+            "duration": time_helper.from_timedelta(duration),
         }
 
         # Notify moderator of successful action (visible only to them)
-        await MessageHelper(
+        user_message = MessageHelper(
             MessageKeys.commands.SLOWMODE_USER_SUCCESS,
             ctx.interaction.locale,
             **common_params,
             reason=reason_messages[0],  # User-facing reason
-        ).send_response(ctx, ephemeral=True)
+        )
+        await user_message.send_response(ctx, ephemeral=True)
 
-        # Log action to designated logging channel for moderation transparency
-        await MessageHelper(
+        # Log action to designated logging channel for moderation transparency, reusing the
+        # response's locale and channel parameters; the command does not wait for it
+        user_message.clone_with(
             MessageKeys.commands.SLOWMODE_LOG_SUCCESS,
-            ctx.interaction.locale,
-            **common_params,
             discord_staff_username=ctx.user.username,
             discord_staff_user_id=ctx.user.id,
             discord_staff_user_mention=ctx.user.mention,
             reason=reason_messages[1],  # Staff/audit log reason
-        ).send_to_log_channel(helper)
+        ).send_to_log_channel_in_background(helper)
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Final
 
@@ -11,11 +12,13 @@ from helper import CommandHelper, MessageHelper, PunishmentHelper, TimeHelper, U
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.TIMEOUT)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.TIMEOUT)
 loader: lightbulb.Loader = helper.get_loader()
 
 # Discord's maximum timeout duration (28 days in seconds)
 MAX_TIMEOUT_DURATION: Final[int] = 2419200
+# The same duration as a timedelta, built once for refresh time arithmetic
+MAX_TIMEOUT_DELTA: Final[timedelta] = timedelta(seconds=MAX_TIMEOUT_DURATION)
 
 
 @loader.command
@@ -47,85 +50,89 @@ class Timeout(
         default=None,
     )
 
+    @staticmethod
     async def _refresh_timeout_task(
-        self,
-        ctx: lightbulb.Context,
-        target_member: hikari.Member,
-        punishment: TemporaryActionSchema,
+        guild_id: int,
+        user_id: int,
+        action_id: int,
+        expires_at: datetime,
         refresh_time: datetime,
-        reason_messages: tuple[str, str],
+        reason: str,
     ) -> None:
-        """Task to refresh a timeout that needs to be extended beyond Discord's maximum duration."""
-        assert punishment.id is not None
-        assert punishment.expires_at is not None
-
-        now = datetime.now(timezone.utc)
+        """
+        Task to refresh a timeout that needs to be extended beyond Discord's maximum duration.
 
+        Only IDs, times and the reason are passed in, so a pending refresh does not keep the
+        member or command context alive for the up to 28 days it waits.
+        """
         # Check if we still need to keep the timeout active
-        if refresh_time < punishment.expires_at:
-            remaining_seconds = (punishment.expires_at - refresh_time).total_seconds()
+        if refresh_time < expires_at:
+            remaining_seconds = (expires_at - refresh_time).total_seconds()
+            rest = GlobalState.bot.get_client().rest
 
             if remaining_seconds > MAX_TIMEOUT_DURATION:
-                next_refresh = now + timedelta(seconds=MAX_TIMEOUT_DURATION)
-
-                # Make sure refresh_at is properly set
-                updated_punishment = await TemporaryActionService.create_or_update_temporary_action(
-                    TemporaryActionSchema(
-                        id=punishment.id,
-                        user_id=punishment.user_id,
-                        punishment_type=PunishmentType.TIMEOUT,
-                        expires_at=punishment.expires_at,
-                        refresh_at=next_refresh,  # Ensure this is not None
-                    )
+                next_refresh = refresh_time + MAX_TIMEOUT_DELTA
+
+                # Still exceeds max timeout, so apply max timeout while making sure refresh_at is
+                # properly set, then schedule another refresh; the write and edit are independent
+                await asyncio.gather(
+                    TemporaryActionService.create_or_update_temporary_action(
+                        TemporaryActionSchema(
+                            id=action_id,
+                            user_id=user_id,
+                            punishment_type=PunishmentType.TIMEOUT,
+                            expires_at=expires_at,
+                            refresh_at=next_refresh,  # Ensure this is not None
+                        )
+                    ),
+                    rest.edit_member(
+                        guild_id, user_id, communication_disabled_until=next_refresh, reason=reason
+                    ),
                 )
 
-                # Still exceeds max timeout, apply max timeout and schedule another refresh
-                await target_member.edit(
-                    communication_disabled_until=next_refresh,
-                    reason=reason_messages[1],
-                )
-
-                # Schedule next refresh task
-                @ctx.client.task(
-                    lightbulb.uniformtrigger(seconds=MAX_TIMEOUT_DURATION), max_invocations=1
-                )
-                async def next_refresh_timeout() -> None:
-                    await self._refresh_timeout_task(
-                        ctx, target_member, updated_punishment, next_refresh, reason_messages
-                    )
-
-                GlobalState.tasks.add_or_refresh_task(
-                    target_member, PunishmentType.TIMEOUT, next_refresh_timeout
+                # Schedule next refresh task for when the applied timeout ends; counting from now
+                # rather than the planned refresh time keeps a late run from letting the timeout lapse
+                GlobalState.tasks.schedule(
+                    user_id,
+                    PunishmentType.TIMEOUT,
+                    (next_refresh - datetime.now(timezone.utc)).total_seconds(),
+                    lambda: Timeout._refresh_timeout_task(
+                        guild_id, user_id, action_id, expires_at, next_refresh, reason
+                    ),
                 )
             else:
                 # Final timeout period is less than max, set exact expiry time
-                await TemporaryActionService.create_or_update_temporary_action(
-                    TemporaryActionSchema(
-                        id=punishment.id,
-                        user_id=punishment.user_id,
-                        punishment_type=PunishmentType.TIMEOUT,
-                        expires_at=punishment.expires_at,
-                        refresh_at=None,  # Only set to None for final period
-                    )
-                )
-
-                await target_member.edit(
-                    communication_disabled_until=punishment.expires_at,
-                    reason=reason_messages[1],
+                await asyncio.gather(
+                    TemporaryActionService.create_or_update_temporary_action(
+                        TemporaryActionSchema(
+                            id=action_id,
+                            user_id=user_id,
+                            punishment_type=PunishmentType.TIMEOUT,
+                            expires_at=expires_at,
+                            refresh_at=None,  # Only set to None for final period
+                        )
+                    ),
+                    rest.edit_member(
+                        guild_id, user_id, communication_disabled_until=expires_at, reason=reason
+                    ),
                 )
 
                 # Schedule the final cleanup task
-                delay = int(remaining_seconds)
+                GlobalState.tasks.schedule(
+                    user_id,
+                    PunishmentType.TIMEOUT,
+                    (expires_at - datetime.now(timezone.utc)).total_seconds(),
+                    lambda: Timeout._timeout_expired(user_id, action_id),
+                )
 
-                @ctx.client.task(lightbulb.uniformtrigger(seconds=delay), max_invocations=1)
-                async def timeout_expired() -> None:
-                    assert punishment.id is not None
-                    await TemporaryActionService.delete_temporary_action(punishment.id)
-                    GlobalState.tasks.remove_task(target_member, PunishmentType.TIMEOUT)
+    @staticmethod
+    async def _timeout_expired(user_id: int, action_id: int) -> None:
+        """Task to clean up a timeout once its final period ends."""
+        await TemporaryActionService.delete_temporary_action(action_id)
+        GlobalState.tasks.remove_task(user_id, PunishmentType.TIMEOUT)
 
     async def _handle_extended_timeout(
         self,
-        ctx: lightbulb.Context,
         target_member: hikari.Member,
         now: datetime,
         expires_at: datetime,
@@ -133,7 +140,7 @@ class Timeout(
     ) -> None:
         """Handle timeouts longer than Discord's maximum allowable duration."""
         # First apply the maximum timeout duration
-        initial_timeout_end = now + timedelta(seconds=MAX_TIMEOUT_DURATION)
+        initial_timeout_end = now + MAX_TIMEOUT_DELTA
 
         # Create a temporary action to track this extended timeout
         punishment = await TemporaryActionService.create_or_update_temporary_action(
@@ -144,17 +151,24 @@ class Timeout(
                 refresh_at=initial_timeout_end,
             )
         )
+        assert punishment.id is not None
 
         await target_member.edit(
             communication_disabled_until=initial_timeout_end, reason=reason_messages[1]
         )
 
-        # Schedule a task to refresh the timeout when it's about to expire
-        @ctx.client.task(lightbulb.uniformtrigger(seconds=MAX_TIMEOUT_DURATION), max_invocations=1)
-        async def refresh_timeout() -> None:
-            await self._refresh_timeout_task(
-                ctx, target_member, punishment, initial_timeout_end, reason_messages
-            )
+        # Schedule a task to refresh the timeout when it's about to expire; it captures only the
+        # IDs and the staff-facing reason, not the member
+        guild_id, user_id, action_id = target_member.guild_id, target_member.id, punishment.id
+        reason = reason_messages[1]
+        GlobalState.tasks.schedule(
+            user_id,
+            PunishmentType.TIMEOUT,
+            MAX_TIMEOUT_DURATION,
+            lambda: Timeout._refresh_timeout_task(
+                guild_id, user_id, action_id, expires_at, initial_timeout_end, reason
+            ),
+        )
 
     async def _apply_timeout(
         self,
@@ -170,7 +184,7 @@ class Timeout(
         expires_at = now + parsed_duration
 
         # Log the timeout in the punishment database
-        await PunishmentLogService.create_or_update_punishment_log(
+        await PunishmentLogService.write_punishment_log(
             PunishmentLogSchema(
                 user_id=target_member.id,
                 punishment_type=PunishmentType.TIMEOUT,
@@ -184,9 +198,7 @@ class Timeout(
 
         # Apply timeout with handling for durations longer than Discord's maximum
         if parsed_duration.total_seconds() > MAX_TIMEOUT_DURATION:
-            await self._handle_extended_timeout(
-                ctx, target_member, now, expires_at, reason_messages
-            )
+            await self._handle_extended_timeout(target_member, now, expires_at, reason_messages)
         else:
             # Set timeout for the requested duration
             await target_member.edit(
@@ -200,17 +212,25 @@ class Timeout(
         assert ctx.member is not None
         assert target_member is not None
 
+        # Target and staff parameters shared by the messages below
+        target_params: dict[str, str] = {
+            "discord_username": target_member.username,
+            "discord_user_id": str(target_member.id),
+            "discord_user_mention": target_member.mention,
+        }
+        staff_params: dict[str, str] = {
+            "discord_staff_username": ctx.member.username,
+            "discord_staff_user_id": str(ctx.member.id),
+            "discord_staff_user_mention": ctx.member.mention,
+        }
+
         # Check if user can be moderated
         if not PunishmentHelper.can_moderate(target_member, ctx.member):
             await MessageHelper(
                 MessageKeys.error.CAN_NOT_MODERATE,
                 locale=ctx.interaction.locale,
-                discord_username=target_member.username,
-                discord_user_id=str(target_member.id),
-                discord_user_mention=target_member.mention,
-                discord_staff_username=ctx.member.username,
-                discord_staff_user_id=str(ctx.member.id),
-                discord_staff_user_mention=ctx.member.mention,
+                **target_params,
+                **staff_params,
             ).send_response(ctx, ephemeral=True)
             return
 
@@ -219,14 +239,13 @@ class Timeout(
             await MessageHelper(
                 MessageKeys.error.USER_ALREADY_TIMED_OUT,
                 locale=ctx.interaction.locale,
-                discord_username=target_member.username,
-                discord_user_id=str(target_member.id),
-                discord_user_mention=target_member.mention,
+                **target_params,
             ).send_response(ctx, ephemeral=True)
             return
 
         # Parse duration and get reason
-        parsed_duration = TimeHelper(ctx.interaction.locale).parse_time_string(self.duration)
+        time_helper = TimeHelper.for_locale(ctx.interaction.locale)
+        parsed_duration = time_helper.parse_time_string(self.duration)
         reason_messages = PunishmentHelper.get_reason(self.reason, ctx.interaction.locale)
 
         # Apply timeout
@@ -236,12 +255,8 @@ class Timeout(
         await MessageHelper(
             MessageKeys.commands.TIMEOUT_USER_SUCCESS,
             locale=ctx.interaction.locale,
-            discord_username=target_member.username,
-            discord_user_id=str(target_member.id),
-            discord_user_mention=target_member.mention,
-            discord_staff_username=ctx.member.username,
-            discord_staff_user_id=str(ctx.member.id),
-            discord_staff_user_mention=ctx.member.mention,
-            duration=TimeHelper(ctx.interaction.locale).from_timedelta(parsed_duration),
+            **target_params,
+            **staff_params,
+            duration=time_helper.from_timedelta(parsed_duration),
             reason=reason_messages[0],
         ).send_response(ctx, ephemeral=True)
@@ -1,38 +1,108 @@
-from typing import Sequence
+from itertools import islice
+from typing import NamedTuple, Sequence
 
 import hikari
 import lightbulb
 
+from data_types import TimedDict
 from database.schemas import PunishmentLogSchema
-from database.services import PunishmentLogService
 from helper import CommandHelper, MessageHelper, PunishmentHelper
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType, SecretKeys
 from settings import Settings
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.UNBAN)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.UNBAN)
 loader: lightbulb.Loader = helper.get_loader()
 
 
+class _BanList(NamedTuple):
+    """A guild's ban list with its users indexed by lowercase username and by ID."""
+
+    bans: Sequence[hikari.GuildBan]
+    users_by_username: dict[str, hikari.User]
+    users_by_id: dict[int, hikari.User]
+
+
+# Ban list per guild, shared by autocomplete and the command so typing a username and then
+# running /unban fetches and scans the list once
+_BAN_CACHE_TTL: float = 60
+_cached_bans: TimedDict[int, _BanList] = TimedDict[int, _BanList](
+    _BAN_CACHE_TTL, key_type=int, lazy_expiration=True
+)
+
+
+async def _get_bans(client: lightbulb.Client, guild_id: int, refresh: bool = False) -> _BanList:
+    """
+    Get the guild's ban list and its indexes from the cache, fetching the list when missing or
+    refresh is set.
+    """
+    if not refresh and (cached := _cached_bans.get(guild_id)) is not None:
+        return cached
+
+    bans = await client.rest.fetch_bans(guild_id)
+    _cached_bans[guild_id] = cached = _BanList(
+        bans,
+        {ban.user.username.lower(): ban.user for ban in bans},
+        {ban.user.id: ban.user for ban in bans},
+    )
+    return cached
+
+
 async def autocomplete_callback(ctx: lightbulb.AutocompleteContext[str]) -> None:
     """Provide username autocompletion suggestions from the server's ban list."""
     assert ctx.interaction.guild_id is not None
 
     current_value = ctx.focused.value.lower() if isinstance(ctx.focused.value, str) else ""
-    ban_list = await ctx.client.rest.fetch_bans(ctx.interaction.guild_id)
 
-    # Filter banned users by partial username match
-    value_to_recommend = []
-    for ban in ban_list:
-        username = ban.user.username
-        if username and current_value in username.lower():
-            value_to_recommend.append(username)
-            if len(value_to_recommend) >= 25:  # Discord limits autocompletion options
-                break
+    ban_list = (await _get_bans(ctx.client, ctx.interaction.guild_id)).bans
+
+    # Filter banned users by partial username match; an empty input matches everyone. Each
+    # choice submits the user's ID so the command can look up that single ban
+    if current_value:
+        choices = (
+            (ban.user.username, str(ban.user.id))
+            for ban in ban_list
+            if ban.user.username and current_value in ban.user.username.lower()
+        )
+    else:
+        choices = ((ban.user.username, str(ban.user.id)) for ban in ban_list if ban.user.username)
+
+    # Discord limits autocompletion options to 25
+    value_to_recommend = list(islice(choices, 25))
 
     await ctx.respond(value_to_recommend)
 
 
+async def _resolve_banned_user(
+    client: lightbulb.Client, guild_id: int, value: str
+) -> hikari.User | None:
+    """
+    Resolve the submitted user option to a banned user.
+
+    Choices picked from autocomplete carry the user's ID, which is normally still in the ban
+    list cached while autocompleting, so the unban needs no lookup request; otherwise that single
+    ban is fetched. Anything else is treated as a username and resolved through the ban list.
+    """
+    if value.isdigit():
+        user_id = int(value)
+        # Only an already cached list is checked; fetching the whole list costs more than one ban
+        cached = _cached_bans.get(guild_id)
+        if cached is not None and (target_user := cached.users_by_id.get(user_id)) is not None:
+            return target_user
+        try:
+            return (await client.rest.fetch_ban(guild_id, user_id)).user
+        except (hikari.NotFoundError, hikari.BadRequestError):
+            pass  # Not a banned user's ID, so it may be a numeric username
+
+    username = value.lower()
+    target_user = (await _get_bans(client, guild_id)).users_by_username.get(username)
+    if target_user is None:
+        # The cached list may predate a recent ban, so check a fresh one before giving up
+        ban_list = await _get_bans(client, guild_id, refresh=True)
+        target_user = ban_list.users_by_username.get(username)
+    return target_user
+
+
 @loader.command
 class UnBan(
     lightbulb.SlashCommand,
@@ -65,13 +135,8 @@ class UnBan(
         assert ctx.guild_id is not None
         assert ctx.member is not None
 
-        # Find the banned user by username from the server's ban list
-        username_to_check = self.user.lower()
-        ban_list: Sequence[hikari.GuildBan] = await ctx.client.rest.fetch_bans(ctx.guild_id)
-
-        target_user = next(
-            (ban.user for ban in ban_list if ban.user.username.lower() == username_to_check), None
-        )
+        # Find the banned user by ID or username
+        target_user = await _resolve_banned_user(ctx.client, ctx.guild_id, self.user)
 
         # Handle case where user isn't found in the ban list
         if not target_user:
@@ -79,28 +144,41 @@ class UnBan(
                 key=MessageKeys.error.USER_NOT_FOUND,
                 locale=ctx.interaction.locale,
                 discord_user_id="N/A",
-                discord_username=username_to_check,
+                discord_username=self.user,
             ).send_response(ctx, ephemeral=True)
             return
 
         # Generate appropriate reason text for logging and notifications
         reason_messages = PunishmentHelper.get_reason(self.reason, ctx.interaction.locale)
 
-        # Record unban action in moderation history database
-        await PunishmentLogService.create_or_update_punishment_log(
-            PunishmentLogSchema(
-                user_id=target_user.id,
-                punishment_type=PunishmentType.UNBAN,
-                reason=reason_messages[1],
-                staff_id=ctx.member.id,
-                source=PunishmentSource.DISCORD,
+        # Record unban action in moderation history database while applying the unban through
+        # Discord API with moderator reason
+        try:
+            await PunishmentHelper.write_log_alongside(
+                PunishmentLogSchema(
+                    user_id=target_user.id,
+                    punishment_type=PunishmentType.UNBAN,
+                    reason=reason_messages[1],
+                    staff_id=ctx.member.id,
+                    source=PunishmentSource.DISCORD,
+                ),
+                ctx.client.rest.unban_user(
+                    Settings.get(SecretKeys.DEFAULT_GUILD), target_user, reason=reason_messages[1]
+                ),
             )
-        )
+        except hikari.NotFoundError:
+            # The cached ban list still had the user, but they were unbanned elsewhere meanwhile
+            _cached_bans.pop(ctx.guild_id, None)
+            await MessageHelper(
+                key=MessageKeys.error.USER_NOT_FOUND,
+                locale=ctx.interaction.locale,
+                discord_user_id=str(target_user.id),
+                discord_username=target_user.username,
+            ).send_response(ctx, ephemeral=True)
+            return
 
-        # Apply the unban through Discord API with moderator reason
-        await ctx.client.rest.unban_user(
-            Settings.get(SecretKeys.DEFAULT_GUILD), target_user, reason=reason_messages[1]
-        )
+        # The user is no longer banned, so the cached list is out of date
+        _cached_bans.pop(ctx.guild_id, None)
 
         # Notify moderator of successful unban action
         await MessageHelper(
@@ -5,7 +5,7 @@ from helper import ChannelHelper, CommandHelper, MessageHelper, PunishmentHelper
 from model import CommandsKeys, MessageKeys
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.UNLOCK)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.UNLOCK)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -71,20 +71,20 @@ class Unlock(
         }
 
         # Notify moderator of successful action
-        await MessageHelper(
+        user_message = MessageHelper(
             MessageKeys.commands.UNLOCK_USER_SUCCESS,
             ctx.interaction.locale,
             **common_params,
             reason=reason_messages[0],  # User-facing reason
-        ).send_response(ctx, ephemeral=True)
+        )
+        await user_message.send_response(ctx, ephemeral=True)
 
-        # Log action to designated logging channel for moderation transparency
-        await MessageHelper(
+        # Log action to designated logging channel for moderation transparency, reusing the
+        # response's locale and channel parameters; the command does not wait for it
+        user_message.clone_with(
             MessageKeys.commands.UNLOCK_LOG_SUCCESS,
-            ctx.interaction.locale,
-            **common_params,
             discord_staff_username=ctx.user.username,
             discord_staff_user_id=ctx.user.id,
             discord_staff_user_mention=ctx.user.mention,
             reason=reason_messages[1],  # Staff/audit log reason
-        ).send_to_log_channel(helper)
+        ).send_to_log_channel_in_background(helper)
@@ -2,12 +2,11 @@ import hikari
 import lightbulb
 
 from database.schemas import PunishmentLogSchema
-from database.services import PunishmentLogService
 from helper import CommandHelper, MessageHelper, PunishmentHelper, UserHelper
 from model import CommandsKeys, MessageKeys, PunishmentSource, PunishmentType
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.UNTIMEOUT)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.UNTIMEOUT)
 loader: lightbulb.Loader = helper.get_loader()
 
 
@@ -42,49 +41,54 @@ class UnTimeout(
         assert ctx.guild_id is not None
         assert ctx.member is not None
 
+        # The locale stays the same for the whole invocation
+        locale = ctx.interaction.locale
+
         # Fetch the target member from the guild
         target_member: hikari.Member | None = await UserHelper.fetch_member(self.user)
         if not target_member:
-            await MessageHelper(
-                MessageKeys.error.MEMBER_NOT_FOUND, locale=ctx.interaction.locale
-            ).send_response(ctx, ephemeral=True)
+            await MessageHelper(MessageKeys.error.MEMBER_NOT_FOUND, locale=locale).send_response(
+                ctx, ephemeral=True
+            )
             return
 
+        # Target parameters shared by the messages below
+        target_params: dict[str, str] = {
+            "discord_user_id": str(target_member.id),
+            "discord_username": target_member.username,
+            "discord_user_mention": target_member.mention,
+        }
+
         # Check if the user currently has a timeout active
         if target_member.communication_disabled_until() is None:
             await MessageHelper(
                 MessageKeys.error.USER_NOT_TIMED_OUT,
-                locale=ctx.interaction.locale,
-                discord_user_id=target_member.id,
-                discord_username=target_member.username,
-                discord_user_mention=target_member.mention,
+                locale=locale,
+                **target_params,
             ).send_response(ctx, ephemeral=True)
             return
 
         # Get formatted reason messages for audit logs and response
-        reason_messages = PunishmentHelper.get_reason(self.reason, ctx.interaction.locale)
+        reason_messages = PunishmentHelper.get_reason(self.reason, locale)
 
-        # Record untimeout action in moderation history database
-        await PunishmentLogService.create_or_update_punishment_log(
+        # Record untimeout action in moderation history database while removing the timeout by
+        # setting communication_disabled_until to None; the log is dropped if the edit fails
+        await PunishmentHelper.write_log_alongside(
             PunishmentLogSchema(
                 user_id=target_member.id,
                 punishment_type=PunishmentType.TIMEOUT,
                 reason=reason_messages[1],
                 staff_id=ctx.member.id,
                 source=PunishmentSource.DISCORD,
-            )
+            ),
+            target_member.edit(communication_disabled_until=None, reason=reason_messages[1]),
         )
 
-        # Attempt to remove the timeout by setting communication_disabled_until to None
-        await target_member.edit(communication_disabled_until=None, reason=reason_messages[1])
-
         # Notify about the successful removal of timeout
         await MessageHelper(
             MessageKeys.commands.UNTIMEOUT_USER_SUCCESS,
-            locale=ctx.interaction.locale,
-            discord_user_id=target_member.id,
-            discord_username=target_member.username,
-            discord_user_mention=target_member.mention,
+            locale=locale,
+            **target_params,
             discord_staff_username=ctx.member.username,
             reason=reason_messages[0],
         ).send_response(ctx)
@@ -11,7 +11,7 @@ from model import CommandsKeys
 from model.message import MessageKeys
 
 # Helper that manages command configuration and localization
-helper: CommandHelper = CommandHelper(CommandsKeys.SUGGEST)
+helper: CommandHelper = CommandHelper.get(CommandsKeys.SUGGEST)
 loader: lightbulb.Loader = helper.get_loader()
 
 
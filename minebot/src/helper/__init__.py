@@ -15,6 +15,7 @@ from .modal import ModalHelper
 from .punishment import PunishmentHelper
 from .ticket import TicketHelper
 from .time import TimeHelper
+from .unban_scheduler import UnbanScheduler
 from .user import UserHelper
 from .wiki import WikiHelper
 
@@ -29,6 +30,7 @@ __all__: list[str] = [
     "PunishmentHelper",
     "TicketHelper",
     "TimeHelper",
+    "UnbanScheduler",
     "UserHelper",
     "WikiHelper",
 ]
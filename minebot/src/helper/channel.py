@@ -33,6 +33,9 @@ class ChannelHelper:
         """
         Fetches a Discord channel by ID and verifies its type.
 
+        Guild channels and threads are taken from the gateway cache, which gateway events keep
+        current, so only channels missing from it are fetched over REST.
+
         Args:
             channel_id (int): The ID of the channel to fetch
             channel_type (type[hikari.PartialChannel]): The expected channel type
@@ -45,10 +48,15 @@ class ChannelHelper:
             Exception: If an unexpected error occurs during the fetch operation
         """
         try:
-            channel = await ChannelHelper._get_client().rest.fetch_channel(channel_id)
+            cache = GlobalState.bot.get_bot().cache
+            channel: hikari.PartialChannel | None = cache.get_guild_channel(channel_id)
+            if channel is None:
+                channel = cache.get_thread(channel_id)
+            if channel is None:
+                channel = await ChannelHelper._get_client().rest.fetch_channel(channel_id)
 
             if isinstance(channel, channel_type):
-                logger.debug(f"Fetched channel {channel_id} of type {channel_type.__name__}")
+                logger.debug("Fetched channel %s of type %s", channel_id, channel_type.__name__)
                 return cast(T, channel)
 
             logger.warning(
@@ -1,5 +1,5 @@
-from logging import Logger
-from typing import Literal, cast
+from logging import DEBUG, Logger
+from typing import ClassVar, Literal, cast
 
 import hikari
 import lightbulb
@@ -24,6 +24,45 @@ logger: Logger = get_logger(__name__)
 
 
 class CommandHelper:
+    # One helper is created per command module, so instances carry no per-instance __dict__
+    __slots__ = (
+        "command_name",
+        "command_enabled",
+        "command_permissions",
+        "command_cooldown",
+        "command_log_enabled",
+        "command_log_channel",
+        "command_reward_mode",
+        "command_reward_role",
+        "command_reward_item",
+        "command_synchronization_minecraft_to_discord",
+        "command_synchronization_discord_to_minecraft",
+        "_permission_value",
+        "_cooldown_hook",
+        "_resolved_reward_items",
+    )
+
+    # Helpers already created by get, by command key
+    _instances: ClassVar[dict[CommandsKeys, "CommandHelper"]] = {}
+
+    @classmethod
+    def get(cls, command: CommandsKeys) -> "CommandHelper":
+        """
+        Get the command helper for a command key, creating it on first use.
+
+        The helper only depends on the command's settings, so the command and event modules of
+        the same command share one instance instead of each parsing the configuration again.
+
+        Args:
+            command (CommandsKeys): The command key identifier.
+
+        Returns:
+            CommandHelper: The shared helper for the command.
+        """
+        if (helper := cls._instances.get(command)) is None:
+            helper = cls._instances[command] = cls(command)
+        return helper
+
     def __init__(self, command: CommandsKeys) -> None:
         """
         Initialize a command helper.
@@ -40,7 +79,6 @@ class CommandHelper:
             command_log_channel (PositiveInt): The channel ID for logging.
         """
         self.command_name: str = command.name.lower()
-        self._cached_permission_value: int | None = None
 
         try:
             command_info: BasicCommand = Settings.get(command)
@@ -53,7 +91,9 @@ class CommandHelper:
             # Basic command properties
             self.command_enabled: bool = True
             self.command_cooldown: CommandCooldown | None = command_info.cooldown
+            self._cooldown_hook: ExecutionHook | None = self._build_cooldown_hook()
             self.command_permissions = self._parse_permissions(command_info.permissions)
+            self._permission_value: int = self._combine_permissions()
 
             # Log initialization
             self._log_initialization()
@@ -76,14 +116,19 @@ class CommandHelper:
         """Set default values for command properties."""
         self.command_enabled = False
         self.command_permissions = [hikari.Permissions.NONE]
+        self._permission_value = 0
         self.command_cooldown = None
+        self._cooldown_hook = None
         self.command_log_enabled = False
         self.command_log_channel = None
 
-        logger.debug(
-            f"[Command: {self.command_name}] Initialized with defaults - Enabled: {self.command_enabled}, "
-            f"Permissions: {[p.name for p in self.command_permissions]}"
-        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "[Command: %s] Initialized with defaults - Enabled: %s, Permissions: %s",
+                self.command_name,
+                self.command_enabled,
+                [p.name for p in self.command_permissions],
+            )
 
     def _parse_permissions(self, permission_strings: list[str]) -> list[hikari.Permissions]:
         """Parse string permissions into hikari.Permissions enum values."""
@@ -94,10 +139,13 @@ class CommandHelper:
 
     def _log_initialization(self) -> None:
         """Log basic command initialization details."""
-        logger.debug(
-            f"[Command: {self.command_name}] Initialized - Enabled: {self.command_enabled}, "
-            f"Permissions: {[p.name for p in self.command_permissions]}"
-        )
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "[Command: %s] Initialized - Enabled: %s, Permissions: %s",
+                self.command_name,
+                self.command_enabled,
+                [p.name for p in self.command_permissions],
+            )
 
     def _configure_logging(self, command_info: BasicCommand) -> None:
         """Configure logging properties if available."""
@@ -107,8 +155,10 @@ class CommandHelper:
         if isinstance(command_info, LoggedCommandConfig):
             self.command_log_channel = command_info.log
             logger.debug(
-                f"[Command: {self.command_name}] Logging configured - Enabled: {bool(self.command_log_channel)}, "
-                f"Channel: {self.command_log_channel}"
+                "[Command: %s] Logging configured - Enabled: %s, Channel: %s",
+                self.command_name,
+                bool(self.command_log_channel),
+                self.command_log_channel,
             )
 
     def _configure_reward(self, command_info: BasicCommand) -> None:
@@ -117,6 +167,9 @@ class CommandHelper:
         self.command_reward_mode: str | None = None
         self.command_reward_role: list[PositiveInt] | None = None
         self.command_reward_item: dict[str, list[str]] | None = None
+        # Reward items resolved against the known servers, with the server set they were
+        # resolved for; the set is replaced whenever the server list changes
+        self._resolved_reward_items: tuple[frozenset[str], dict[str, list[str]]] | None = None
 
         if isinstance(command_info, RewardableCommandConfig) and command_info.reward is not None:
             self.command_reward_mode = command_info.reward.mode
@@ -136,10 +189,11 @@ class CommandHelper:
                 }
 
             logger.debug(
-                f"[Command: {self.command_name}] Reward configured - "
-                f"Enabled: {bool(self.command_reward_mode)}, "
-                f"Role: {self.command_reward_role}, "
-                f"Item: {self.command_reward_item}"
+                "[Command: %s] Reward configured - Enabled: %s, Role: %s, Item: %s",
+                self.command_name,
+                bool(self.command_reward_mode),
+                self.command_reward_role,
+                self.command_reward_item,
             )
 
     def _configure_synchronization(self, command_info: BasicCommand) -> None:
@@ -170,10 +224,11 @@ class CommandHelper:
                 )
 
             logger.debug(
-                f"[Command: {self.command_name}] Synchronization configured - "
-                f"Enabled: {enabled}, "
-                f"MC to Discord: {self.command_synchronization_minecraft_to_discord}, "
-                f"Discord to MC: {self.command_synchronization_discord_to_minecraft}"
+                "[Command: %s] Synchronization configured - Enabled: %s, MC to Discord: %s, Discord to MC: %s",
+                self.command_name,
+                enabled,
+                self.command_synchronization_minecraft_to_discord,
+                self.command_synchronization_discord_to_minecraft,
             )
 
     def get_loader(self) -> lightbulb.Loader:
@@ -184,26 +239,17 @@ class CommandHelper:
             lightbulb.Loader: A loader instance that uses the command_enabled status as a condition.
         """
         logger.info(
-            f"[Command: {self.command_name}] Creating command loader "
-            f"(Status: {'ENABLED' if self.command_enabled else 'DISABLED'})"
+            "[Command: %s] Creating command loader (Status: %s)",
+            self.command_name,
+            "ENABLED" if self.command_enabled else "DISABLED",
         )
         return lightbulb.Loader(lambda: self.command_enabled)
 
-    def get_permissions(self) -> int:
-        """
-        Get the permissions required for the command as a combined integer value.
-
-        Returns:
-            int: The combined permission value as expected by Discord's API.
-        """
-        # Return cached value if available
-        if self._cached_permission_value is not None:
-            return self._cached_permission_value
-
-        # Special case: if NONE is in the permissions list, return 0
-        if any(p == hikari.Permissions.NONE for p in self.command_permissions):
-            logger.debug(f"[Command: {self.command_name}] Using NONE permission (value: 0)")
-            self._cached_permission_value = 0
+    def _combine_permissions(self) -> int:
+        """Combine the parsed permissions into the integer value expected by Discord's API."""
+        # Special case: if NONE is in the permissions list, the value is 0
+        if hikari.Permissions.NONE in self.command_permissions:
+            logger.debug("[Command: %s] Using NONE permission (value: 0)", self.command_name)
             return 0
 
         # Combine permissions
@@ -211,14 +257,26 @@ class CommandHelper:
         for permission in self.command_permissions:
             combined_permissions |= permission.value
 
-        logger.debug(
-            f"[Command: {self.command_name}] Permissions: {[p.name for p in self.command_permissions]} → {combined_permissions}"
-        )
-
-        # Cache the result
-        self._cached_permission_value = combined_permissions
+        if logger.isEnabledFor(DEBUG):
+            logger.debug(
+                "[Command: %s] Permissions: %s → %s",
+                self.command_name,
+                [p.name for p in self.command_permissions],
+                combined_permissions,
+            )
         return combined_permissions
 
+    def get_permissions(self) -> int:
+        """
+        Get the permissions required for the command as a combined integer value.
+
+        The value is computed once when the helper is created, as the permissions do not change.
+
+        Returns:
+            int: The combined permission value as expected by Discord's API.
+        """
+        return self._permission_value
+
     def generate_hooks(
         self,
         additional_hooks: ExecutionHook | list[ExecutionHook] | None = None,
@@ -231,13 +289,17 @@ class CommandHelper:
 
         Returns:
             list[lb.ExecutionHook]: A list of execution hooks, including cooldowns if configured.
+
+        Note:
+            The cooldown hook is built once with the helper, so every call returns the same hook
+            and with it the same cooldown state.
         """
-        logger.debug(f"[Command: {self.command_name}] Generating execution hooks")
+        logger.debug("[Command: %s] Generating execution hooks", self.command_name)
         hooks = []
 
         # Add cooldown if configured
-        if cooldown_hook := self._get_cooldown():
-            hooks.append(cooldown_hook)
+        if self._cooldown_hook is not None:
+            hooks.append(self._cooldown_hook)
 
         # Add additional hooks if provided
         if additional_hooks:
@@ -270,21 +332,31 @@ class CommandHelper:
         """
         Get the items that should be rewarded for using the command.
 
+        The items are resolved once per set of known Minecraft servers and reused until the
+        server list changes, so the returned dictionary must not be modified.
+
         Returns:
             dict[str, list[str]] | None: The item data if rewards are enabled, None otherwise.
         """
         if self.command_reward_item is None:
             return None
 
+        server_set = GlobalState.minecraft.get_server_set()
+        if self._resolved_reward_items is not None and self._resolved_reward_items[0] is server_set:
+            return self._resolved_reward_items[1]
+
         final_item_reward: dict[str, list[str]] = {}
-        default_reward: list[str] | None = self.command_reward_item.get("defualt", None)
+        default_reward: list[str] | None = self.command_reward_item.get("default", None)
 
         for server_name, items in self.command_reward_item.items():
-            if GlobalState.minecraft.contains_server(server_name):
+            if server_name in server_set:
                 final_item_reward[server_name] = items
             elif server_name != "default":
                 final_item_reward[server_name] = default_reward or []
 
+        self._resolved_reward_items = (server_set, final_item_reward)
+        return final_item_reward
+
     def has_synchronization_minecraft_to_discord(self) -> bool:
         """
         Check if the command has synchronization from Minecraft to Discord enabled.
@@ -318,15 +390,17 @@ class CommandHelper:
             )
         )
 
-    def _get_cooldown(self) -> ExecutionHook | None:
+    def _build_cooldown_hook(self) -> ExecutionHook | None:
         """
-        Get the configured cooldown as a lightbulb execution hook.
+        Build the configured cooldown as a lightbulb execution hook.
+
+        The cooldown settings do not change after initialization, so this is only called once.
 
         Returns:
             lightbulb.ExecutionHook | None: The configured cooldown hook or None if no cooldown is set.
         """
         if not self.command_cooldown:
-            logger.debug(f"[Command: {self.command_name}] No cooldown configured")
+            logger.debug("[Command: %s] No cooldown configured", self.command_name)
             return None
 
         try:
@@ -345,28 +419,28 @@ class CommandHelper:
             bucket_literal = cast(Literal["global", "user", "channel", "guild"], bucket)
 
             logger.debug(
-                f"[Command: {self.command_name}] Configuring {algorithm} cooldown: "
-                f"{allowed_invocations} invocations per {window_length}s ({bucket})"
+                "[Command: %s] Configuring %s cooldown: %s invocations per %ss (%s)",
+                self.command_name,
+                algorithm,
+                allowed_invocations,
+                window_length,
+                bucket,
             )
 
-            # Dictionary-based cooldown creation
-            cooldown_creators = {
-                "fixed_window": lambda: cooldowns.fixed_window(
+            if algorithm == "fixed_window":
+                return cooldowns.fixed_window(
                     window_length=window_length,
                     allowed_invocations=allowed_invocations,
                     bucket=bucket_literal,
-                ),
-                "sliding_window": lambda: cooldowns.sliding_window(
+                )
+            elif algorithm == "sliding_window":
+                return cooldowns.sliding_window(
                     window_length=window_length,
                     allowed_invocations=allowed_invocations,
                     bucket=bucket_literal,
-                ),
-            }
-
-            if algorithm not in cooldown_creators:
-                raise ValueError(f"Unknown cooldown algorithm: {algorithm}")
+                )
 
-            return cooldown_creators[algorithm]()
+            raise ValueError(f"Unknown cooldown algorithm: {algorithm}")
 
         except (ValueError, KeyError, AttributeError) as e:
             # More specific exception handling
@@ -60,8 +60,10 @@ class EventHelper:
         self.event_log_channel = None
 
         logger.debug(
-            f"[Event: {self.event_name}] Initialized with defaults - Enabled: {self.event_enabled}, "
-            f"Logging: {self.event_log_enabled}"
+            "[Event: %s] Initialized with defaults - Enabled: %s, Logging: %s",
+            self.event_name,
+            self.event_enabled,
+            self.event_log_enabled,
         )
 
     def _log_initialization(self) -> None:
@@ -72,8 +74,11 @@ class EventHelper:
         to help with troubleshooting.
         """
         logger.debug(
-            f"[Event: {self.event_name}] Initialized - Enabled: {self.event_enabled}, "
-            f"Logging: {self.event_log_enabled}, Channel: {self.event_log_channel}"
+            "[Event: %s] Initialized - Enabled: %s, Logging: %s, Channel: %s",
+            self.event_name,
+            self.event_enabled,
+            self.event_log_enabled,
+            self.event_log_channel,
         )
 
     def _configure_logging(self, event_info: BasicEvent) -> None:
@@ -91,8 +96,10 @@ class EventHelper:
             self.event_log_enabled = bool(event_info.log)
             self.event_log_channel: PositiveInt | None = event_info.log
             logger.debug(
-                f"[Event: {self.event_name}] Logging configured - Enabled: {self.event_log_enabled}, "
-                f"Channel: {self.event_log_channel}"
+                "[Event: %s] Logging configured - Enabled: %s, Channel: %s",
+                self.event_name,
+                self.event_log_enabled,
+                self.event_log_channel,
             )
 
     def get_loader(self) -> lightbulb.Loader:
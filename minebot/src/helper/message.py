@@ -1,3 +1,4 @@
+import asyncio
 from logging import Logger
 from typing import Any, Literal, Sequence, cast, overload
 
@@ -25,6 +26,17 @@ ContextType = (
     lightbulb.Context | lightbulb.components.MenuContext | lightbulb.components.ModalContext
 )
 
+# Log sends running in the background; referenced here so they are not garbage collected
+_background_sends: set[asyncio.Task[hikari.Message | None]] = set()
+
+
+def _on_background_send_done(task: asyncio.Task[hikari.Message | None]) -> None:
+    """Forget a finished background send and log its failure, if any."""
+    _background_sends.discard(task)
+    if not task.cancelled() and (exception := task.exception()) is not None:
+        logger.error("Failed to send message to log channel: %s", exception, exc_info=exception)
+
+
 # Replace DecodeType with more specific typing
 MessagePairMode = Literal["text", "embed", "mixed"]
 
@@ -78,7 +90,25 @@ class MessageHelper:
         self.key: MessageKeyType = key
         self.locale: str | hikari.Locale | None = locale
         self.kwargs: dict[str, Any] = kwargs
-        logger.debug(f"[Message: {key.name}] Initialized with locale: {locale}, params: {kwargs}")
+        logger.debug(
+            "[Message: %s] Initialized with locale: %s, params: %s", key.name, locale, kwargs
+        )
+
+    def clone_with(self, key: MessageKeyType, **kwargs) -> "MessageHelper":
+        """
+        Create a message for another key that shares this message's locale and parameters.
+
+        Commands that answer the moderator and then log the action send two messages built from
+        the same parameters; the second one is derived from the first instead of repeating them.
+
+        Args:
+            key (MessageKeyType): The message key of the new message.
+            **kwargs: Parameters added to, or replacing, the ones of this message.
+
+        Returns:
+            MessageHelper: The new message helper.
+        """
+        return MessageHelper(key, self.locale, **{**self.kwargs, **kwargs})
 
     def _decode_plain(self, content: TextMessage | None = None) -> str:
         """
@@ -102,7 +132,7 @@ class MessageHelper:
 
         result: str = content.text.format(**self.kwargs) if content.text else ""
         truncated: str = result[:50] + ("..." if len(result) > 50 else "")
-        logger.debug(f"[Message: {self.key.name}] Plain content: {truncated}")
+        logger.debug("[Message: %s] Plain content: %s", self.key.name, truncated)
         return result
 
     def _decode_embed(self, content: DiscordEmbed | None = None) -> hikari.Embed:
@@ -137,7 +167,7 @@ class MessageHelper:
 
         # Add fields if they exist
         if content.fields:
-            logger.debug(f"[Message: {self.key.name}] Adding {len(content.fields)} fields")
+            logger.debug("[Message: %s] Adding %s fields", self.key.name, len(content.fields))
             for field in content.fields:
                 embed.add_field(
                     name=field.name.format(**self.kwargs) if field.name else None,
@@ -166,7 +196,7 @@ class MessageHelper:
                 icon=str(content.author.icon) if content.author.icon else None,
             )
 
-        logger.debug(f"[Message: {self.key.name}] Embed message construction completed")
+        logger.debug("[Message: %s] Embed message construction completed", self.key.name)
         return embed
 
     def decode(self) -> str | hikari.Embed:
@@ -187,7 +217,7 @@ class MessageHelper:
         Logs:
             Debug information about the decoding process.
         """
-        logger.debug(f"[Message: {self.key.name}] Decoding {self.locale} message")
+        logger.debug("[Message: %s] Decoding %s message", self.key.name, self.locale)
         message: DiscordMessage = Localization.get(key=self.key, locale=self.locale)
         content: TextMessage | DiscordEmbed = message.content
 
@@ -196,7 +226,7 @@ class MessageHelper:
             return self._decode_plain(content)
 
         # Must be an embed message
-        logger.debug(f"[Message: {self.key.name}] Building embed message")
+        logger.debug("[Message: %s] Building embed message", self.key.name)
         content = cast(DiscordEmbed, content)
         return self._decode_embed(content)
 
@@ -306,7 +336,10 @@ class MessageHelper:
         message_type = "embed" if isinstance(message, hikari.Embed) else "plain"
 
         logger.debug(
-            f"[Message: {self.key.name}] Responding with {message_type} message (ephemeral: {ephemeral})"
+            "[Message: %s] Responding with %s message (ephemeral: %s)",
+            self.key.name,
+            message_type,
+            ephemeral,
         )
 
         response_message: hikari.Message = cast(
@@ -318,7 +351,7 @@ class MessageHelper:
                 attachment=attachment or hikari.UNDEFINED,
             ),
         )
-        logger.debug(f"[Message: {self.key.name}] Response sent successfully")
+        logger.debug("[Message: %s] Response sent successfully", self.key.name)
 
         return response_message
 
@@ -340,30 +373,60 @@ class MessageHelper:
         Returns:
             None: The method returns early if logging is disabled or no channel is configured.
         """
-        logger.debug(f"[Message: {self.key.name}] Checking if logging is enabled")
+        logger.debug("[Message: %s] Checking if logging is enabled", self.key.name)
         channel_id = helper.get_log_channel_id()
         if not channel_id:
-            logger.debug(f"[Message: {self.key.name}] Logging is disabled, skipping")
+            logger.debug("[Message: %s] Logging is disabled, skipping", self.key.name)
             return None
 
-        logger.debug(f"[Message: {self.key.name}] Fetching channel {channel_id}")
+        logger.debug("[Message: %s] Fetching channel %s", self.key.name, channel_id)
         channel: hikari.TextableGuildChannel = await ChannelHelper.fetch_channel(
             channel_id, hikari.TextableGuildChannel
         )
 
         message: str | hikari.Embed = self.decode()
         message_type = "embed" if isinstance(message, hikari.Embed) else "plain"
-        logger.debug(f"[Message: {self.key.name}] Sending {message_type} message to log channel")
+        logger.debug("[Message: %s] Sending %s message to log channel", self.key.name, message_type)
 
         response_message: hikari.Message = await channel.send(
             content=message,
             components=components or hikari.UNDEFINED,
             attachment=attachment or hikari.UNDEFINED,
         )
-        logger.debug(f"[Message: {self.key.name}] Log message sent successfully")
+        logger.debug("[Message: %s] Log message sent successfully", self.key.name)
 
         return response_message
 
+    def send_to_log_channel_in_background(
+        self,
+        helper: CommandHelper | EventHelper,
+        components: Sequence[hikari.api.ComponentBuilder] | None = None,
+        attachment: hikari.Resourceish | None = None,
+    ) -> None:
+        """
+        Sends the message to the configured log channel without waiting for it.
+
+        The send runs as a background task, so the caller is not held up by the Discord
+        request. Failures are logged instead of being raised to the caller.
+
+        Args:
+            helper: The (CommandHelper | EventHelper) instance to check logging configuration.
+        """
+        task = asyncio.create_task(self.send_to_log_channel(helper, components, attachment))
+        _background_sends.add(task)
+        task.add_done_callback(_on_background_send_done)
+
+    @staticmethod
+    async def drain_background_sends() -> None:
+        """
+        Wait for every log message sent in the background to finish.
+
+        Call this during shutdown, before the client is stopped, so queued log messages are not
+        dropped. Failures are logged by the sends themselves.
+        """
+        while _background_sends:
+            await asyncio.gather(*_background_sends, return_exceptions=True)
+
     async def send_to_channel(
         self,
         channel: int | hikari.TextableChannel,
@@ -382,19 +445,19 @@ class MessageHelper:
         Returns:
             hikari.Message | None: The sent message or None if the channel is not found.
         """
-        logger.debug(f"[Message: {self.key.name}] Sending message to channel {channel}")
+        logger.debug("[Message: %s] Sending message to channel %s", self.key.name, channel)
         if isinstance(channel, int):
             channel = await ChannelHelper.fetch_channel(channel, hikari.TextableChannel)
 
         message: str | hikari.Embed = self.decode()
         message_type = "embed" if isinstance(message, hikari.Embed) else "plain"
-        logger.debug(f"[Message: {self.key.name}] Sending {message_type} message to channel")
+        logger.debug("[Message: %s] Sending %s message to channel", self.key.name, message_type)
 
         response_message: hikari.Message = await channel.send(
             content=message,
             components=components or hikari.UNDEFINED,
             attachment=attachment or hikari.UNDEFINED,
         )
-        logger.debug(f"[Message: {self.key.name}] Message sent successfully to channel")
+        logger.debug("[Message: %s] Message sent successfully to channel", self.key.name)
 
         return response_message
@@ -1,17 +1,16 @@
-import asyncio
 from logging import Logger
 
 import hikari
 from pydantic import PositiveInt
 
 from core import GlobalState
+from database import get_db_session
 from database.schemas import UserSchema
 from database.services import UserService
 from debug import get_logger
 from model import MessageType, SecretKeys
 from model.schemas import UserReward
 from settings.json_wrapper import Settings
-from websocket.schemas import ResponseAwaitableSchema
 from websocket.schemas.request import (
     DispatchCommandSchema,
     SendGlobalMessageSchema,
@@ -52,14 +51,14 @@ class MinecraftHelper:
                 )
                 raise ValueError("When 'user' is provided, 'username' and 'uuid' must be None")
 
-            logger.debug(f"Looking up Minecraft UUID for Discord user {user.id}")
+            logger.debug("Looking up Minecraft UUID for Discord user %s", user.id)
             schema: UserSchema | None = await UserService.get_user(user.id)
             if not schema or not schema.minecraft_uuid:
-                logger.debug(f"No Minecraft UUID found for Discord user {user.id}")
+                logger.debug("No Minecraft UUID found for Discord user %s", user.id)
                 return "", False
 
             uuid = schema.minecraft_uuid
-            logger.debug(f"Found Minecraft UUID {uuid} for Discord user {user.id}")
+            logger.debug("Found Minecraft UUID %s for Discord user %s", uuid, user.id)
             return uuid, True
 
         # Validate we have exactly one identifier
@@ -72,21 +71,25 @@ class MinecraftHelper:
 
     @staticmethod
     async def _get_player_websocket_response(
-        schema: ResponseAwaitableSchema,
+        schema: PlayerStatusCheckSchema | PlayerServerCheckSchema,
+        identifier: str,
         response_timeout: float = 1.0,
     ) -> None:
         """
         Send schema to WebSocket and wait for response.
 
+        Returns as soon as the response for the identifier was handled, or once the timeout
+        passes without one.
+
         Args:
             schema: The schema to send
+            identifier: The player username or UUID the response is expected for
             response_timeout: Timeout for waiting for response
         """
         from websocket import WebSocketManager
 
-        await WebSocketManager.send_message(schema)
-        logger.debug(f"Waiting {response_timeout}s for WebSocket response")
-        await asyncio.sleep(response_timeout)
+        logger.debug("Waiting up to %ss for WebSocket response", response_timeout)
+        await WebSocketManager.send_and_wait(schema, schema.action, identifier, response_timeout)
 
     @staticmethod
     def check_servers_available() -> bool:
@@ -122,31 +125,35 @@ class MinecraftHelper:
             return False
 
         logger.debug(
-            f"Checking player status with: user={user and user.id}, username={username}, uuid={uuid}"
+            "Checking player status with: user=%s, username=%s, uuid=%s",
+            user and user.id,
+            username,
+            uuid,
         )
 
         identifier, from_db = await MinecraftHelper._resolve_identifier(user, username, uuid)
         if not identifier:
             return False
 
-        logger.debug(f"Using identifier: {identifier}")
+        logger.debug("Using identifier: %s", identifier)
 
         # Quick check if already in cache before making request
         if GlobalState.minecraft.check_player_online(identifier):
-            logger.debug(f"Player {identifier} found in cache, returning online status")
+            logger.debug("Player %s found in cache, returning online status", identifier)
             return True
 
         # Request status check from websocket
-        logger.debug(f"Player {identifier} not in cache, requesting status from WebSocket")
+        logger.debug("Player %s not in cache, requesting status from WebSocket", identifier)
         await MinecraftHelper._get_player_websocket_response(
             PlayerStatusCheckSchema(
                 username=None if from_db else username, uuid=identifier if from_db else uuid
             ),
+            identifier,
             response_timeout,
         )
 
         is_online = GlobalState.minecraft.check_player_online(identifier)
-        logger.debug(f"Player {identifier} is {'online' if is_online else 'offline'}")
+        logger.debug("Player %s is %s", identifier, "online" if is_online else "offline")
         return is_online
 
     @staticmethod
@@ -169,7 +176,7 @@ class MinecraftHelper:
             username=username, response_timeout=response_timeout
         ):
             if bool(UUID := GlobalState.minecraft.get_player_uuid(username)):
-                logger.debug(f"UUID for {username} found: {UUID}")
+                logger.debug("UUID for %s found: %s", username, UUID)
                 return UUID
 
     @staticmethod
@@ -198,18 +205,21 @@ class MinecraftHelper:
             return None
 
         logger.debug(
-            f"Checking player server with: user={user and user.id}, username={username}, uuid={uuid}"
+            "Checking player server with: user=%s, username=%s, uuid=%s",
+            user and user.id,
+            username,
+            uuid,
         )
 
         identifier, from_db = await MinecraftHelper._resolve_identifier(user, username, uuid)
         if not identifier:
             return None
 
-        logger.debug(f"Using identifier: {identifier}")
+        logger.debug("Using identifier: %s", identifier)
 
         # Quick check if already in cache before making request
         if SERVER := GlobalState.minecraft.get_player_server(identifier):
-            logger.debug(f"Player {identifier} found in cache, returning server: {SERVER}")
+            logger.debug("Player %s found in cache, returning server: %s", identifier, SERVER)
             return SERVER
 
         # Check online status first, this already includes waiting for the response
@@ -220,30 +230,33 @@ class MinecraftHelper:
         )
 
         if not is_online:
-            logger.debug(f"Player {identifier} is offline, cannot fetch server")
+            logger.debug("Player %s is offline, cannot fetch server", identifier)
             return None
 
         # After status check, see if server info was populated
         if SERVER := GlobalState.minecraft.get_player_server(identifier):
-            logger.debug(f"Server found in cache after status check: {SERVER}")
+            logger.debug("Server found in cache after status check: %s", SERVER)
             return SERVER
 
         # If only one server is available, we know the player must be there
         if len(SERVERS := GlobalState.minecraft.get_servers()) == 1:
-            logger.debug(f"Only one server available: {SERVERS[0]}")
+            logger.debug("Only one server available: %s", SERVERS[0])
             return SERVERS[0]
 
         # If we need to explicitly request server info
-        logger.debug(f"Player {identifier} is online but server unknown, requesting from WebSocket")
+        logger.debug(
+            "Player %s is online but server unknown, requesting from WebSocket", identifier
+        )
         await MinecraftHelper._get_player_websocket_response(
             PlayerServerCheckSchema(
                 username=None if from_db else username, uuid=identifier if from_db else uuid
             ),
+            identifier,
             response_timeout,
         )
 
         server = GlobalState.minecraft.get_player_server(identifier)
-        logger.debug(f"Player {identifier} is on server: {server}")
+        logger.debug("Player %s is on server: %s", identifier, server)
         return server
 
     @staticmethod
@@ -276,7 +289,10 @@ class MinecraftHelper:
             return False
 
         logger.debug(
-            f"Sending message to player with: user={user and user.id}, username={username}, uuid={uuid}"
+            "Sending message to player with: user=%s, username=%s, uuid=%s",
+            user and user.id,
+            username,
+            uuid,
         )
 
         identifier, from_db = await MinecraftHelper._resolve_identifier(user, username, uuid)
@@ -291,7 +307,7 @@ class MinecraftHelper:
         )
 
         if not is_online:
-            logger.debug(f"Player {identifier} is offline, cannot send message")
+            logger.debug("Player %s is offline, cannot send message", identifier)
             return False
 
         from websocket import WebSocketManager
@@ -306,7 +322,9 @@ class MinecraftHelper:
         )
         # Truncate message for logging if too long
         logger.debug(
-            f"Message sent to player {identifier}: {message if len(message) <= 50 else message[:47] + '...'}"
+            "Message sent to player %s: %s",
+            identifier,
+            message if len(message) <= 50 else message[:47] + "...",
         )
         return True
 
@@ -325,7 +343,7 @@ class MinecraftHelper:
         if not MinecraftHelper.check_servers_available():
             return False
 
-        logger.debug(f"Sending global message: {message}")
+        logger.debug("Sending global message: %s", message)
 
         from websocket import WebSocketManager
 
@@ -358,7 +376,9 @@ class MinecraftHelper:
             return False
 
         logger.debug(
-            f"Sending server message to {server}: {message if len(message) <= 50 else message[:47] + '...'}"
+            "Sending server message to %s: %s",
+            server,
+            message if len(message) <= 50 else message[:47] + "...",
         )
 
         from websocket import WebSocketManager
@@ -397,7 +417,7 @@ class MinecraftHelper:
         # Import inside the method to avoid circular imports
         from websocket import WebSocketManager
 
-        logger.debug(f"Dispatching command(s) to server {server}")
+        logger.debug("Dispatching command(s) to server %s", server)
         await WebSocketManager.send_message(DispatchCommandSchema(server=server, commands=commands))
         return True
 
@@ -424,7 +444,7 @@ class MinecraftHelper:
             True if any rewards were successfully added, False otherwise
         """
         if not rewards:
-            logger.debug(f"No rewards to add for user {user.id}")
+            logger.debug("No rewards to add for user %s", user.id)
             return False
 
         success = False
@@ -475,12 +495,15 @@ class MinecraftHelper:
                             default_reward, username, uuid
                         )
 
-                # Add items to user inventory in database
+                # Add items to user inventory in database, sharing one session and commit
                 try:
-                    for server_name, items in final_item_reward.items():
-                        if items:  # Only process non-empty item lists
-                            await UserService.add_item(user.id, server_name, items)
-                            success = True
+                    async with get_db_session() as session:
+                        for server_name, items in final_item_reward.items():
+                            if items:  # Only process non-empty item lists
+                                await UserService.add_item(
+                                    user.id, server_name, items, session=session
+                                )
+                    success = success or any(final_item_reward.values())
                 except Exception as e:
                     logger.error(f"Failed to add item rewards for user {user.id}: {e}")
 
@@ -509,7 +532,7 @@ class MinecraftHelper:
         # Get user data and validate rewards exist
         user_data: UserSchema | None = await UserService.get_user(int(actual_user_id))
         if not user_data or not user_data.reward_inventory:
-            logger.debug(f"User {actual_user_id} not found or has no rewards")
+            logger.debug("User %s not found or has no rewards", actual_user_id)
             return False
 
         # Check if user is online and get their server
@@ -517,13 +540,13 @@ class MinecraftHelper:
             uuid=user_data.minecraft_uuid
         )
         if not server:
-            logger.debug(f"User {actual_user_id} not online on any server")
+            logger.debug("User %s not online on any server", actual_user_id)
             return False
 
         # Check if user has rewards for current server
         rewards: list[str] | None = user_data.reward_inventory.get(server)
         if not rewards or len(rewards) == 0:
-            logger.debug(f"No rewards found for user {actual_user_id} on server {server}")
+            logger.debug("No rewards found for user %s on server %s", actual_user_id, server)
             return False
 
         # Dispatch commands and update user data
@@ -532,10 +555,10 @@ class MinecraftHelper:
                 # Clear the rewards immediately after successful dispatch
                 user_data.reward_inventory[server] = []
                 await UserService.create_or_update_user(user_data)
-                logger.debug(f"Rewards dispatched successfully for user {actual_user_id}")
+                logger.debug("Rewards dispatched successfully for user %s", actual_user_id)
                 return True
         except ValueError as e:
             logger.error(f"Failed to dispatch commands: {e}")
 
-        logger.debug(f"Failed to dispatch rewards for user {actual_user_id}")
+        logger.debug("Failed to dispatch rewards for user %s", actual_user_id)
         return False
@@ -40,7 +40,7 @@ class ModalHelper:
         Raises:
             KeyError: If an invalid style is provided in the TextInputField
         """
-        logger.debug(f"Creating field with label '{key.label}' and style '{key.style}'")
+        logger.debug("Creating field with label '%s' and style '%s'", key.label, key.style)
 
         mapper: dict[str, Callable] = {
             "SHORT": instance.add_short_text_input,
@@ -56,7 +56,7 @@ class ModalHelper:
         value: str | hikari.UndefinedType = key.value or hikari.UNDEFINED
 
         logger.debug(
-            f"Adding field '{key.label}' with min_length={min_lenght}, max_length={max_length}"
+            "Adding field '%s' with min_length=%s, max_length=%s", key.label, min_lenght, max_length
         )
 
         field = mapper[key.style](
@@ -67,5 +67,5 @@ class ModalHelper:
             max_length=max_length,
         )
 
-        logger.debug(f"Field '{key.label}' successfully added to modal")
+        logger.debug("Field '%s' successfully added to modal", key.label)
         return field
@@ -1,4 +1,7 @@
+import asyncio
+import weakref
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from logging import Logger
 from typing import Awaitable, Callable, Final
 
@@ -7,10 +10,11 @@ import lightbulb
 import toolbox
 
 from core import GlobalState
-from database.schemas import TemporaryActionSchema
-from database.services import TemporaryActionService
+from database.schemas import PunishmentLogSchema, TemporaryActionSchema
+from database.services import PunishmentLogService, TemporaryActionService
 from debug import get_logger
 from helper import MessageHelper
+from helper.unban_scheduler import UnbanScheduler
 from model import MessageKeys, PunishmentType, SecretKeys
 from settings import Settings
 
@@ -20,6 +24,11 @@ logger: Logger = get_logger(__name__)
 class PunishmentHelper:
     _client: lightbulb.Client | None = None
     _bot_member: hikari.Member | None = None
+    # Audit events this many seconds or less from a log of the same type are its duplicate
+    DUPLICATE_WINDOW: Final[float] = 120
+
+    # Per-user locks for punishment log checks and writes; a lock is dropped once nobody holds it
+    _user_locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
 
     @classmethod
     def _get_client(cls) -> lightbulb.Client:
@@ -37,6 +46,92 @@ class PunishmentHelper:
             logger.debug("Bot member instance cached")
         return cls._bot_member
 
+    @classmethod
+    def get_user_lock(cls, user_id: int) -> asyncio.Lock:
+        """
+        Get the lock that serializes punishment log checks and writes for a user.
+
+        Audit listeners hold it across their duplicate check and log write, and commands hold
+        it while writing a log and applying the punishment, so two handlers for the same user
+        cannot both miss each other's log and insert it twice.
+        """
+        lock = cls._user_locks.get(user_id)
+        if lock is None:
+            lock = cls._user_locks[user_id] = asyncio.Lock()
+        return lock
+
+    @classmethod
+    async def find_or_write_punishment_log(
+        cls,
+        user_id: int,
+        punishment_type: str,
+        event_time: datetime,
+        new_log: Callable[[], PunishmentLogSchema],
+    ) -> PunishmentLogSchema | None:
+        """
+        Get the punishment log an audit event duplicates, or write a new one.
+
+        Punishments issued through the bot's commands are logged before Discord reports them.
+        When the latest log of the type for the user was created within the duplicate window of
+        the event, that log is returned; otherwise the log built by new_log is written. The check
+        and the write hold the user's lock, so concurrent handlers cannot both write.
+
+        Args:
+            user_id: The punished user's ID
+            punishment_type: The type of punishment
+            event_time: When the audit log entry was created, as a timezone-aware UTC datetime.
+                Snowflake created_at values already are, so they are passed without conversion
+            new_log: Builds the log to write when the event is not a duplicate
+
+        Returns:
+            The duplicated or newly written PunishmentLogSchema
+        """
+        async with cls.get_user_lock(user_id):
+            # Only the creation time of the latest log is needed to spot a duplicate
+            latest_created_at = await PunishmentLogService.get_latest_created_at(
+                user_id, punishment_type
+            )
+            if latest_created_at is not None:
+                punishment_time = latest_created_at.replace(tzinfo=timezone.utc)
+                if abs((event_time - punishment_time).total_seconds()) < cls.DUPLICATE_WINDOW:
+                    logger.debug("Audit %s for user %s is a duplicate", punishment_type, user_id)
+                    return await PunishmentLogService.get_latest_punishment_log(
+                        user_id, punishment_type
+                    )
+
+            return await PunishmentLogService.write_punishment_log(new_log())
+
+    @classmethod
+    async def write_log_alongside(
+        cls, log: PunishmentLogSchema, action: Awaitable[object]
+    ) -> PunishmentLogSchema:
+        """
+        Write a punishment log while the Discord action that applies it runs.
+
+        Neither depends on the other, so both are awaited together under the user's lock; the
+        audit listener therefore still finds the log once the action's event arrives. When the
+        action fails, the written log is deleted again before the error is raised.
+
+        Args:
+            log: The punishment log to write
+            action: The Discord call applying the punishment
+
+        Returns:
+            The written PunishmentLogSchema
+        """
+        async with cls.get_user_lock(log.user_id):
+            written, result = await asyncio.gather(
+                PunishmentLogService.write_punishment_log(log), action, return_exceptions=True
+            )
+
+            if isinstance(result, BaseException):
+                if not isinstance(written, BaseException) and written.id is not None:
+                    await PunishmentLogService.delete_punishment_log(written.id)
+                raise result
+            if isinstance(written, BaseException):
+                raise written
+            return written
+
     @classmethod
     def can_moderate(
         cls,
@@ -45,7 +140,7 @@ class PunishmentHelper:
         permission: hikari.Permissions = hikari.Permissions.NONE,
     ) -> bool:
         """Check if both moderator and bot can moderate the target."""
-        logger.debug(f"Checking moderation: moderator={moderator.id}, target={target.id}")
+        logger.debug("Checking moderation: moderator=%s, target=%s", moderator.id, target.id)
         try:
             bot_member = cls._get_bot_member()
             return toolbox.can_moderate(moderator, target, permission) and toolbox.can_moderate(
@@ -61,6 +156,17 @@ class PunishmentHelper:
         if reason:
             return reason, reason
 
+        return PunishmentHelper._get_no_reason(locale)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _get_no_reason(locale: str | hikari.Locale | None) -> tuple[str, str]:
+        """
+        Decode the localized no-reason message pair.
+
+        Audit events mostly arrive without a reason and the pair only depends on the locale, so
+        each locale is decoded once.
+        """
         if locale is None:
             message = MessageHelper(MessageKeys.general.NO_REASON)._decode_plain()
             return message, message
@@ -88,31 +194,36 @@ class PunishmentHelper:
             logger.debug("Failed to get client, cannot schedule punishment tasks")
             return
 
-        temp_actions = await TemporaryActionService.get_all_temporary_actions()
-        if not temp_actions:
-            logger.debug("No temporary actions found, nothing to schedule")
-            return
-
-        logger.debug(f"Retrieved {len(temp_actions)} temporary actions")
         guild = Settings.get(SecretKeys.DEFAULT_GUILD)
         no_reason = MessageHelper(MessageKeys.general.NO_REASON)._decode_plain()
         now = datetime.now(timezone.utc)
 
-        handlers = {
-            PunishmentType.BAN: cls._handle_ban_action,
-            PunishmentType.TIMEOUT: cls._handle_timeout_action,
-        }
-
-        for action in temp_actions:
+        # Rows are streamed, so only timeouts are kept: bans are handed to the unban scheduler
+        # in memory, while timeouts need Discord and database calls that must not run while the
+        # streaming session is open
+        action_count = 0
+        timeout_actions: list[TemporaryActionSchema] = []
+        async for action in TemporaryActionService.iter_all_temporary_actions():
+            action_count += 1
             if action.id is None:
                 continue
 
-            handler = handlers.get(getattr(PunishmentType, action.punishment_type.upper()))
-            if handler:
-                await handler(client, guild, action, now, no_reason)
+            punishment_type = getattr(PunishmentType, action.punishment_type.upper())
+            if punishment_type == PunishmentType.BAN:
+                await cls._handle_ban_action(client, guild, action, now, no_reason)
+            elif punishment_type == PunishmentType.TIMEOUT:
+                timeout_actions.append(action)
             else:
                 logger.warning(f"Unknown punishment type: {action.punishment_type}")
 
+        if not action_count:
+            logger.debug("No temporary actions found, nothing to schedule")
+            return
+
+        logger.debug("Retrieved %s temporary actions", action_count)
+        for action in timeout_actions:
+            await cls._handle_timeout_action(client, guild, action, now, no_reason)
+
     @classmethod
     async def _handle_ban_action(
         cls,
@@ -129,53 +240,10 @@ class PunishmentHelper:
         action_id = int(action.id)
         expires_at = cls._ensure_timezone_aware(action.expires_at)
 
-        # Handle expired ban immediately
-        if expires_at and expires_at <= now:
-            logger.debug(f"Ban expired for user {action.user_id}, unbanning immediately")
-            try:
-                await client.rest.unban_member(guild, action.user_id, reason=no_reason)
-                await TemporaryActionService.delete_temporary_action(action_id)
-            except hikari.NotFoundError:
-                logger.info(f"User {action.user_id} already unbanned or not found")
-                await TemporaryActionService.delete_temporary_action(action_id)
-            except Exception as e:
-                logger.error(f"Error unbanning user {action.user_id}: {e}")
-            return
-
-        # Schedule future unban
+        # Expired bans are lifted by the scheduler right away, together in one batch
         if expires_at:
-            delay = int((expires_at - now).total_seconds())
-            logger.debug(f"Scheduling unban for user {action.user_id} in {delay} seconds")
-            GlobalState.tasks.add_or_refresh_task(
-                action.user_id,
-                PunishmentType.BAN,
-                client.task(lightbulb.uniformtrigger(seconds=delay), max_invocations=1)(
-                    cls._create_ban_expiry_task(action_id, guild, action.user_id, no_reason)
-                ),
-            )
-
-    @staticmethod
-    def _create_ban_expiry_task(
-        action_id: int, guild_id: int, user_id: int, reason: str
-    ) -> Callable[[], Awaitable[None]]:
-        """Create a ban expiry task."""
-
-        async def ban_expiry_task() -> None:
-            logger.debug(f"Executing scheduled unban for user {user_id}, action {action_id}")
-            try:
-                await GlobalState.bot.get_client().rest.unban_member(
-                    guild_id, user_id, reason=reason
-                )
-                await TemporaryActionService.delete_temporary_action(action_id)
-                GlobalState.tasks.remove_task(user_id, PunishmentType.BAN)
-                logger.debug(f"Completed scheduled unban for user {user_id}")
-            except hikari.NotFoundError:
-                logger.info(f"User {user_id} already unbanned or not found")
-                await TemporaryActionService.delete_temporary_action(action_id)
-            except Exception as e:
-                logger.error(f"Error in ban expiry task for user {user_id}: {e}")
-
-        return ban_expiry_task
+            logger.debug("Scheduling unban for user %s at %s", action.user_id, expires_at)
+            UnbanScheduler.schedule(action.user_id, guild, expires_at, action_id)
 
     @classmethod
     async def _handle_timeout_action(
@@ -196,7 +264,9 @@ class PunishmentHelper:
 
         # Handle expired timeout
         if expires_at and expires_at <= now:
-            logger.debug(f"Timeout expired for user {action.user_id}, deleting action {action_id}")
+            logger.debug(
+                "Timeout expired for user %s, deleting action %s", action.user_id, action_id
+            )
             await TemporaryActionService.delete_temporary_action(action_id)
             return
 
@@ -208,7 +278,7 @@ class PunishmentHelper:
             await cls._handle_timeout_refresh(client, guild, action, action_id, now, no_reason)
         # Initialize refresh for long timeouts that don't have refresh_at set
         elif expires_at and refresh_at is None and (expires_at - now).total_seconds() > max_timeout:
-            logger.debug(f"Setting up initial refresh for long timeout for user {action.user_id}")
+            logger.debug("Setting up initial refresh for long timeout for user %s", action.user_id)
             # Create a modified action with an initial refresh_at value
             modified_action = TemporaryActionSchema(
                 id=action.id,
@@ -223,13 +293,14 @@ class PunishmentHelper:
         # Schedule timeout removal
         elif expires_at:
             delay = int((expires_at - now).total_seconds())
-            logger.debug(f"Scheduling timeout removal for user {action.user_id} in {delay} seconds")
-            GlobalState.tasks.add_or_refresh_task(
+            logger.debug(
+                "Scheduling timeout removal for user %s in %s seconds", action.user_id, delay
+            )
+            GlobalState.tasks.schedule(
                 action.user_id,
                 PunishmentType.TIMEOUT,
-                client.task(lightbulb.uniformtrigger(seconds=delay), max_invocations=1)(
-                    cls._create_timeout_expiry_task(action_id, guild, action.user_id, no_reason)
-                ),
+                delay,
+                cls._create_timeout_expiry_task(action_id, guild, action.user_id, no_reason),
             )
 
     @staticmethod
@@ -278,7 +349,9 @@ class PunishmentHelper:
                 # Need another refresh after this one
                 next_refresh = now + timedelta(seconds=max_timeout)
                 logger.debug(
-                    f"Scheduling next timeout refresh for user {action.user_id} at {next_refresh}"
+                    "Scheduling next timeout refresh for user %s at %s",
+                    action.user_id,
+                    next_refresh,
                 )
                 await TemporaryActionService.create_or_update_temporary_action(
                     TemporaryActionSchema(
@@ -292,7 +365,9 @@ class PunishmentHelper:
             else:
                 # No further refresh needed
                 logger.debug(
-                    f"No further refreshes needed for user {action.user_id}, expires in {time_until_expiry} seconds"
+                    "No further refreshes needed for user %s, expires in %s seconds",
+                    action.user_id,
+                    time_until_expiry,
                 )
                 await TemporaryActionService.create_or_update_temporary_action(
                     TemporaryActionSchema(
@@ -313,7 +388,7 @@ class PunishmentHelper:
         """Create a timeout expiry task."""
 
         async def timeout_expiry_task() -> None:
-            logger.debug(f"Executing timeout removal for user {user_id}, action {action_id}")
+            logger.debug("Executing timeout removal for user %s, action %s", user_id, action_id)
             try:
                 await GlobalState.bot.get_client().rest.edit_member(
                     guild_id,
@@ -323,7 +398,7 @@ class PunishmentHelper:
                 )
                 await TemporaryActionService.delete_temporary_action(action_id)
                 GlobalState.tasks.remove_task(user_id, PunishmentType.TIMEOUT)
-                logger.debug(f"Completed timeout removal for user {user_id}")
+                logger.debug("Completed timeout removal for user %s", user_id)
             except hikari.NotFoundError:
                 logger.info(f"User {user_id} not found during timeout removal")
                 await TemporaryActionService.delete_temporary_action(action_id)
@@ -279,7 +279,7 @@ class TicketHelper:
                 github = Github(auth=Auth.Token(github_config.token))
                 cls._transcript_github_repo = github.get_repo(github_config.repository)
                 cls._transcript_github_repo_branch = github_config.branch
-                logger.debug(f"Connected to GitHub repo: {github_config.repository}")
+                logger.debug("Connected to GitHub repo: %s", github_config.repository)
             except GithubException as e:
                 logger.error(f"Failed to connect to GitHub repository: {e}")
                 # Continue without GitHub integration, will fall back to Discord upload
@@ -420,8 +420,10 @@ class TicketHelper:
                 )
             )
             logger.debug(
-                f"Created ticket {channel.id} for user {owner.id} "
-                f"in category {ticket_category.category_name}"
+                "Created ticket %s for user %s in category %s",
+                channel.id,
+                owner.id,
+                ticket_category.category_name,
             )
         except Exception as e:
             logger.error(f"Failed to register ticket in database: {e}")
@@ -448,7 +450,7 @@ class TicketHelper:
             # Delete channel and remove from database
             await channel.delete()
             await TicketChannelService.delete_ticket_channel(channel.id)
-            logger.debug(f"Ticket channel {channel.id} closed and deleted")
+            logger.debug("Ticket channel %s closed and deleted", channel.id)
 
         except hikari.ForbiddenError:
             logger.error(f"Bot doesn't have permission to delete channel {channel.id}")
@@ -468,7 +470,7 @@ class TicketHelper:
         # Get ticket information
         ticket_info = await TicketChannelService.get_ticket_channel(channel.id)
         if ticket_info is None:
-            logger.debug(f"No ticket info found for channel {channel.id}")
+            logger.debug("No ticket info found for channel %s", channel.id)
             return None
 
         # Get ticket owner
@@ -476,7 +478,7 @@ class TicketHelper:
 
         ticket_owner = await UserHelper.fetch_user(ticket_info.owner_id)
         if ticket_owner is None:
-            logger.debug(f"Could not fetch owner {ticket_info.owner_id}")
+            logger.debug("Could not fetch owner %s", ticket_info.owner_id)
             return None
 
         # Format file name
@@ -34,7 +34,7 @@ class TimeHelper:
         Args:
             locale: The locale to use for time unit names and formats
         """
-        logger.debug(f"Initializing TimeHelper with locale: {locale}")
+        logger.debug("Initializing TimeHelper with locale: %s", locale)
 
         # Store units directly in the dictionary with their localized names
         self.units: dict[str, tuple[TimeUnitsLocalization.BasicUnit, int]] = {
@@ -51,7 +51,7 @@ class TimeHelper:
         self.sorted_units: list[tuple[str, tuple[TimeUnitsLocalization.BasicUnit, int]]] = sorted(
             self.units.items(), key=lambda x: x[1][1], reverse=True
         )
-        logger.debug(f"Sorted {len(self.sorted_units)} time units for efficient processing")
+        logger.debug("Sorted %s time units for efficient processing", len(self.sorted_units))
 
         # Create a mapping of localized abbreviations to unit names with a single iteration
         self.abbr_to_unit: dict[str, str] = {}
@@ -63,11 +63,28 @@ class TimeHelper:
             # Also add the unit name itself as a mapping
             self.abbr_to_unit[unit_name.lower()] = unit_name
 
-        logger.debug(f"Created abbreviation mapping with {len(self.abbr_to_unit)} entries")
+        logger.debug("Created abbreviation mapping with %s entries", len(self.abbr_to_unit))
 
         # Compile regex pattern for parsing time strings
         self._time_pattern = re.compile(r"(\d+)\s*([a-zA-Z]+)")
 
+    @classmethod
+    @lru_cache(maxsize=32)
+    def for_locale(cls, locale: str | hikari.Locale | None = None) -> "TimeHelper":
+        """
+        Get a shared TimeHelper for the given locale.
+
+        Instances are not modified after initialization, so one per locale is built and reused
+        instead of looking up every unit's localization again on each call.
+
+        Args:
+            locale: The locale to use for time unit names and formats
+
+        Returns:
+            TimeHelper: The helper for the locale
+        """
+        return cls(locale)
+
     @lru_cache(maxsize=128)
     def to_timedelta(self, value: int | float, unit: str) -> datetime.timedelta:
         """
@@ -91,12 +108,12 @@ class TimeHelper:
             datetime.timedelta(seconds=5400)
         """
         unit = unit.lower()
-        logger.debug(f"Converting {value} {unit} to timedelta")
+        logger.debug("Converting %s %s to timedelta", value, unit)
 
         try:
             _, seconds_per_unit = self.units[unit]
             result = datetime.timedelta(seconds=value * seconds_per_unit)
-            logger.debug(f"Converted to {result}")
+            logger.debug("Converted to %s", result)
             return result
         except KeyError:
             logger.error(f"Unknown time unit requested: {unit}")
@@ -124,7 +141,10 @@ class TimeHelper:
             '1 minute 10 seconds'
         """
         logger.debug(
-            f"Converting timedelta {delta} to string (max_units={max_units}, include_seconds={include_seconds})"
+            "Converting timedelta %s to string (max_units=%s, include_seconds=%s)",
+            delta,
+            max_units,
+            include_seconds,
         )
 
         seconds = delta.total_seconds()
@@ -159,7 +179,7 @@ class TimeHelper:
         if is_negative:
             result = f"-{result}"
 
-        logger.debug(f"Formatted timedelta as: '{result}'")
+        logger.debug("Formatted timedelta as: '%s'", result)
         return result
 
     def format_time_remaining(self, seconds: int | float) -> str:
@@ -179,9 +199,9 @@ class TimeHelper:
             >>> helper.format_time_remaining(86465)
             '1 day 5 seconds'
         """
-        logger.debug(f"Formatting {seconds} seconds as human-readable time")
+        logger.debug("Formatting %s seconds as human-readable time", seconds)
         result = self.from_timedelta(datetime.timedelta(seconds=seconds))
-        logger.debug(f"Formatted time: {result}")
+        logger.debug("Formatted time: %s", result)
         return result
 
     def parse_time_string(self, time_string: str) -> datetime.timedelta:
@@ -207,7 +227,7 @@ class TimeHelper:
             >>> helper.parse_time_string("")
             datetime.timedelta(0)
         """
-        logger.debug(f"Parsing time string: '{time_string}'")
+        logger.debug("Parsing time string: '%s'", time_string)
 
         if not time_string:
             logger.debug("Empty time string, returning zero timedelta")
@@ -231,7 +251,12 @@ class TimeHelper:
                     _, seconds_per_unit = self.units[unit_name]
                     unit_seconds = value * seconds_per_unit
                     logger.debug(
-                        f"Parsed {value} {unit_text} as {value} {unit_name} = {unit_seconds} seconds"
+                        "Parsed %s %s as %s %s = %s seconds",
+                        value,
+                        unit_text,
+                        value,
+                        unit_name,
+                        unit_seconds,
                     )
                     total_seconds += unit_seconds
                 else:
@@ -241,5 +266,5 @@ class TimeHelper:
                 continue
 
         result = datetime.timedelta(seconds=total_seconds)
-        logger.debug(f"Parsed time string as {result} ({total_seconds} seconds)")
+        logger.debug("Parsed time string as %s (%s seconds)", result, total_seconds)
         return result
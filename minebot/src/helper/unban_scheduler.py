@@ -0,0 +1,154 @@
+import asyncio
+import heapq
+import time
+from datetime import datetime
+from logging import Logger
+
+import hikari
+from sqlalchemy.exc import SQLAlchemyError
+
+from core import GlobalState
+from database.services import TemporaryActionService
+from debug import get_logger
+from helper.message import MessageHelper
+from model import MessageKeys
+
+logger: Logger = get_logger(__name__)
+
+# (expires_at as a POSIX timestamp, user ID, guild ID, temporary action ID)
+_Entry = tuple[float, int, int, int]
+
+
+class UnbanScheduler:
+    """
+    Lifts temporary bans when they expire from a single background task.
+
+    Pending unbans live in a heap ordered by expiry and one worker sleeps until the earliest is
+    due, instead of registering a scheduler task and closure per ban. Rescheduling or cancelling
+    a user's unban only updates the pending map; heap entries that no longer match it are
+    dropped when they reach the top.
+    """
+
+    _heap: list[_Entry] = []
+    _pending: dict[int, _Entry] = {}
+    _wakeup: asyncio.Event | None = None
+    _worker: asyncio.Task[None] | None = None
+
+    @classmethod
+    def schedule(cls, user_id: int, guild_id: int, expires_at: datetime, action_id: int) -> None:
+        """
+        Schedule a user to be unbanned, replacing any unban already pending for them.
+
+        Args:
+            user_id: The banned user's ID
+            guild_id: The guild the user is banned from
+            expires_at: When the ban expires; past times are lifted right away
+            action_id: ID of the temporary action row deleted once the ban is lifted
+        """
+        entry: _Entry = (expires_at.timestamp(), user_id, guild_id, action_id)
+        cls._pending[user_id] = entry
+        heapq.heappush(cls._heap, entry)
+        logger.debug("Scheduled unban for user %s at %s", user_id, expires_at)
+
+        wakeup = cls._ensure_worker()
+        wakeup.set()
+
+    @classmethod
+    def cancel(cls, user_id: int) -> bool:
+        """
+        Cancel the pending unban for a user.
+
+        Returns:
+            bool: True if an unban was pending, False otherwise
+        """
+        return cls._pending.pop(user_id, None) is not None
+
+    @classmethod
+    def is_scheduled(cls, user_id: int) -> bool:
+        """Check if an unban is pending for the given user."""
+        return user_id in cls._pending
+
+    @classmethod
+    async def stop(cls) -> None:
+        """Stop the worker task and forget every pending unban."""
+        worker, cls._worker = cls._worker, None
+        if worker is not None and not worker.done():
+            worker.cancel()
+            try:
+                await worker
+            except asyncio.CancelledError:
+                pass
+
+        cls._heap.clear()
+        cls._pending.clear()
+        cls._wakeup = None
+
+    @classmethod
+    def _ensure_worker(cls) -> asyncio.Event:
+        """Start the worker task if it is not running and return its wakeup event."""
+        if cls._worker is None or cls._worker.done() or cls._wakeup is None:
+            cls._wakeup = asyncio.Event()
+            cls._worker = asyncio.create_task(cls._run(cls._wakeup), name="unban-scheduler")
+        return cls._wakeup
+
+    @classmethod
+    def _pop_due(cls, now: float) -> list[_Entry]:
+        """Pop every entry that is due and still pending."""
+        due: list[_Entry] = []
+        while cls._heap and cls._heap[0][0] <= now:
+            entry = heapq.heappop(cls._heap)
+            # Entries replaced by a later schedule() or removed by cancel() are stale
+            if cls._pending.get(entry[1]) == entry:
+                del cls._pending[entry[1]]
+                due.append(entry)
+        return due
+
+    @classmethod
+    async def _run(cls, wakeup: asyncio.Event) -> None:
+        """Sleep until the earliest unban is due, lift every due ban, and repeat."""
+        while True:
+            wakeup.clear()
+
+            if due := cls._pop_due(time.time()):
+                # Only Discord and database failures are expected here; anything else, including
+                # cancellation, propagates instead of being swallowed by the loop
+                try:
+                    await cls._lift_bans(due)
+                except (hikari.HikariError, SQLAlchemyError):
+                    logger.exception("Error lifting temporary bans for %s users", len(due))
+                continue
+
+            timeout = cls._heap[0][0] - time.time() if cls._heap else None
+            try:
+                await asyncio.wait_for(wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    @staticmethod
+    async def _lift_bans(due: list[_Entry]) -> None:
+        """Unban the users of the given entries and delete their temporary actions in one go."""
+        rest = GlobalState.bot.get_client().rest
+        reason = MessageHelper(MessageKeys.general.NO_REASON)._decode_plain()
+
+        results: list[None | BaseException] = await asyncio.gather(
+            *(
+                rest.unban_member(guild_id, user_id, reason=reason)
+                for _, user_id, guild_id, _ in due
+            ),
+            return_exceptions=True,
+        )
+
+        finished: list[int] = []
+        for (_, user_id, _, action_id), result in zip(due, results):
+            if isinstance(result, hikari.NotFoundError):
+                logger.info("User %s already unbanned or not found", user_id)
+            elif isinstance(result, BaseException):
+                # The temporary action is kept so the unban is retried on the next start
+                logger.error("Error lifting temporary ban for user %s: %s", user_id, result)
+                continue
+            else:
+                logger.debug("Completed scheduled unban for user %s", user_id)
+            finished.append(action_id)
+
+        if finished:
+            await TemporaryActionService.delete_temporary_actions(finished)
@@ -13,47 +13,57 @@ logger: Logger = get_logger(__name__)
 class UserHelper:
     @staticmethod
     async def fetch_user(user_id: int) -> hikari.User | None:
-        """Fetch a user by their ID."""
-        logger.debug(f"Fetching user with ID: {user_id}")
+        """Fetch a user by their ID, trying the gateway cache before the REST API."""
+        bot = GlobalState.bot.get_bot()
+        if user := bot.cache.get_user(user_id):
+            logger.debug("Found user in cache: %s (ID: %s)", user.username, user.id)
+            return user
+
+        logger.debug("Fetching user with ID: %s", user_id)
 
         try:
-            user = await GlobalState.bot.get_bot().rest.fetch_user(user_id)
-            logger.debug(f"Found user: {user.username} (ID: {user.id})")
+            user = await bot.rest.fetch_user(user_id)
+            logger.debug("Found user: %s (ID: %s)", user.username, user.id)
             return user
 
         except hikari.NotFoundError:
-            logger.debug(f"User with ID {user_id} not found")
+            logger.debug("User with ID %s not found", user_id)
             return None
 
         except hikari.ForbiddenError:
-            logger.debug(f"Permission denied when fetching user {user_id}")
+            logger.debug("Permission denied when fetching user %s", user_id)
             return None
 
         except Exception as e:
-            logger.debug(f"Error fetching user {user_id}: {type(e).__name__}")
+            logger.debug("Error fetching user %s: %s", user_id, type(e).__name__)
             return None
 
     @staticmethod
     async def fetch_member(user: hikari.User | int) -> hikari.Member | None:
-        """Fetch a member from the default guild."""
+        """Fetch a member from the default guild, trying the gateway cache before the REST API."""
         user_id = user.id if isinstance(user, hikari.User) else user
         guild_id = Settings.get(SecretKeys.DEFAULT_GUILD)
 
-        logger.debug(f"Fetching member {user_id} from guild {guild_id}")
+        bot = GlobalState.bot.get_bot()
+        if member := bot.cache.get_member(guild_id, user_id):
+            logger.debug("Found member in cache: %s", user_id)
+            return member
+
+        logger.debug("Fetching member %s from guild %s", user_id, guild_id)
 
         try:
-            member = await GlobalState.bot.get_bot().rest.fetch_member(guild_id, user)
-            logger.debug(f"Found member: {user_id}")
+            member = await bot.rest.fetch_member(guild_id, user)
+            logger.debug("Found member: %s", user_id)
             return member
 
         except hikari.NotFoundError:
-            logger.debug(f"Member {user_id} not found")
+            logger.debug("Member %s not found", user_id)
             return None
 
         except hikari.ForbiddenError:
-            logger.debug(f"Permission denied when fetching member {user_id}")
+            logger.debug("Permission denied when fetching member %s", user_id)
             return None
 
         except Exception as e:
-            logger.debug(f"Error fetching member {user_id}: {type(e).__name__}")
+            logger.debug("Error fetching member %s: %s", user_id, type(e).__name__)
             return None
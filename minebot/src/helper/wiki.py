@@ -1,6 +1,9 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+from itertools import islice
 from logging import Logger
 from pathlib import Path
-from typing import Final
+from typing import Final, NamedTuple
 
 import hikari
 
@@ -14,11 +17,28 @@ from utils import fetch_available_locales, fetch_files_with_extension
 logger: Logger = debugger.get_logger(__name__)
 
 
+class _WikiIndex(NamedTuple):
+    """Autocomplete index of one locale's wiki file names, sorted by lowercased name."""
+
+    lowered_names: list[str]
+    names: list[str]
+    # Sorted suffixes of the lowercased names past their first character, with the position of
+    # the name each belongs to; only built for locales with many files
+    suffixes: list[str] | None = None
+    suffix_positions: list[int] | None = None
+
+
 class WikiHelper:
     # Store both file paths and content in a single structure
     # Format: {locale: {filename: (path, content)}}
     _data: dict[str, dict[str, tuple[Path, str | None]]] = {}
+    # Autocomplete index built alongside the data
+    # Format: {locale: index}
+    _autocomplete_index: dict[str, _WikiIndex] = {}
     MAX_CONTENT_LENGTH: Final[int] = 4000
+    # Locales with at least this many files get a suffix index for substring matches; below it,
+    # scanning the names is cheaper than building and walking the index
+    SUFFIX_INDEX_THRESHOLD: Final[int] = 100
     GUILD_LANGUAGE: hikari.Locale | None = None
 
     @classmethod
@@ -34,13 +54,14 @@ class WikiHelper:
     @classmethod
     def load_wiki_data(cls) -> None:
         """Load wiki data from markdown files for all available locales."""
-        system_data: CommandHelper = CommandHelper(CommandsKeys.WIKI)
+        system_data: CommandHelper = CommandHelper.get(CommandsKeys.WIKI)
 
         if not system_data.command_enabled:
             return
 
         wiki_data_path = Path("configuration/wiki")
         cls._data.clear()  # Clear existing data before reloading
+        cls._autocomplete_index.clear()
 
         for locale in fetch_available_locales():
             locale_str = str(locale)
@@ -67,39 +88,107 @@ class WikiHelper:
                 if valid_files:  # Only add if there are valid files
                     cls._data[locale_str] = valid_files
 
+                    cls._autocomplete_index[locale_str] = cls._build_index(valid_files)
+
             except FileNotFoundError:
                 logger.info(f"No wiki files found for locale: {locale_str}")
 
     @classmethod
-    def get_wiki_files(cls, locale: str) -> dict[str, Path] | None:
-        """Get all wiki files for a specific locale, falling back to guild locale if needed."""
-        # Try with requested locale first
-        if locale in cls._data and cls._data[locale]:
-            return {name: path_content[0] for name, path_content in cls._data[locale].items()}
+    def _build_index(cls, file_names: Iterable[str]) -> _WikiIndex:
+        """Build the autocomplete index for a locale's wiki file names."""
+        entries = sorted((name.lower(), name) for name in file_names)
+        lowered_names = [lowered for lowered, _ in entries]
+        names = [name for _, name in entries]
+
+        if len(names) < cls.SUFFIX_INDEX_THRESHOLD:
+            return _WikiIndex(lowered_names, names)
+
+        suffix_entries = sorted(
+            (lowered[start:], position)
+            for position, lowered in enumerate(lowered_names)
+            for start in range(1, len(lowered))
+        )
+        return _WikiIndex(
+            lowered_names,
+            names,
+            [suffix for suffix, _ in suffix_entries],
+            [position for _, position in suffix_entries],
+        )
 
-        # Fall back to guild locale if user locale has no wiki files
-        guild_locale = str(cls._get_guild_locale())
-        if guild_locale in cls._data and cls._data[guild_locale]:
-            logger.info(
-                f"Falling back to guild locale {guild_locale} for wiki files (requested: {locale})"
+    @classmethod
+    def search_wiki_files(cls, locale: str, query: str, limit: int = 25) -> list[str]:
+        """
+        Find wiki file names containing the query, falling back to guild locale if needed.
+
+        Names starting with the query come first and are found by binary search in the sorted
+        index; the remaining slots are filled with names containing the query elsewhere.
+        """
+        index = cls._autocomplete_index.get(locale) or cls._autocomplete_index.get(
+            str(cls._get_guild_locale())
+        )
+        if index is None:
+            return []
+
+        lowered_names, names = index.lowered_names, index.names
+        query = query.lower()
+
+        # Prefix matches are contiguous in the sorted index
+        start = bisect_left(lowered_names, query)
+        end = start
+        while end < len(lowered_names) and end - start < limit:
+            if not lowered_names[end].startswith(query):
+                break
+            end += 1
+        results = names[start:end]
+
+        if len(results) >= limit:
+            return results
+
+        # Top up with names containing the query past their start; with a suffix index those
+        # are the names owning the contiguous run of suffixes starting with the query
+        if index.suffixes is not None and index.suffix_positions is not None:
+            start = bisect_left(index.suffixes, query)
+            end = start
+            while end < len(index.suffixes) and index.suffixes[end].startswith(query):
+                end += 1
+            positions = sorted(set(index.suffix_positions[start:end]))
+            results.extend(
+                islice(
+                    (
+                        names[position]
+                        for position in positions
+                        if not lowered_names[position].startswith(query)
+                    ),
+                    limit - len(results),
+                )
+            )
+        else:
+            results.extend(
+                islice(
+                    (
+                        name
+                        for lowered, name in zip(lowered_names, names)
+                        if query in lowered and not lowered.startswith(query)
+                    ),
+                    limit - len(results),
+                )
             )
-            return {name: path_content[0] for name, path_content in cls._data[guild_locale].items()}
 
-        return None
+        return results
 
     @classmethod
     def get_wiki_file_content(cls, locale: str, file_name: str) -> str | None:
         """Get the content of a specific wiki file, falling back to guild locale if needed."""
         # Try with requested locale first
-        if locale in cls._data and file_name in cls._data.get(locale, {}):
-            return cls._data[locale][file_name][1]
+        if (entry := cls._data.get(locale, {}).get(file_name)) is not None:
+            return entry[1]
 
         # Fall back to guild locale if content not found in user locale
         guild_locale = str(cls._get_guild_locale())
-        if guild_locale in cls._data and file_name in cls._data.get(guild_locale, {}):
+        if (entry := cls._data.get(guild_locale, {}).get(file_name)) is not None:
             logger.info(
                 f"Falling back to guild locale {guild_locale} for wiki content {file_name} (requested: {locale})"
             )
-            return cls._data[guild_locale][file_name][1]
+            return entry[1]
 
         return None
@@ -99,6 +99,7 @@ class ErrorMessageKeys(Enum):
     CAN_NOT_MODERATE = "error.can_not_moderate"
     USER_ALREADY_TIMED_OUT = "error.user_already_timed_out"
     USER_NOT_TIMED_OUT = "error.user_not_timed_out"
+    CHANNEL_ALREADY_LOCKED = "error.channel_already_locked"
     DURATION_OUT_OF_RANGE = "error.duration_out_of_range"
     MAX_AMOUNT_OF_TICKETS_REACHED = "error.max_amount_of_tickets_reached"
 
@@ -889,6 +889,7 @@ class ErrorLocalization(BaseModel):
     can_not_moderate: DiscordMessage
     user_already_timed_out: DiscordMessage
     user_not_timed_out: DiscordMessage
+    channel_already_locked: DiscordMessage
     duration_out_of_range: DiscordMessage
     max_amount_of_tickets_reached: DiscordMessage
 
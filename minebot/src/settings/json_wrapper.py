@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import logging
 import sys
 from collections.abc import Sequence
@@ -10,6 +9,7 @@ from typing import Any, Final, cast
 
 import hikari
 import lightbulb
+import orjson
 from pydantic import ValidationError
 
 from core import GlobalState
@@ -81,7 +81,7 @@ class Settings:
 
         Raises:
             FileNotFoundError: If the configuration file does not exist at the specified path.
-            json.JSONDecodeError: If the configuration file contains invalid JSON.
+            orjson.JSONDecodeError: If the configuration file contains invalid JSON.
             ValidationError: If the parsed settings do not meet the required validation criteria.
             Exception: For any other unexpected errors during the loading process.
 
@@ -97,16 +97,16 @@ class Settings:
             if not cls._config_path.exists():
                 raise FileNotFoundError(f"Settings file not found at {cls._config_path}")
 
-            with cls._config_path.open("r", encoding="utf-8") as file:
-                data = json.load(file)
-                cls._data = BotSettings(**data)
-                cls._validate_required_settings()
-                logger.info("Settings loaded successfully")
+            data = orjson.loads(cls._config_path.read_bytes())
+            cls._data = BotSettings(**data)
+            cls.invalidate()
+            cls._validate_required_settings()
+            logger.info("Settings loaded successfully")
 
         except FileNotFoundError as e:
             logger.critical(f"Configuration error: {e}")
             sys.exit(1)
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.critical(f"Invalid JSON in settings file: {e}")
             sys.exit(1)
         except ValidationError as e:
@@ -119,6 +119,16 @@ class Settings:
             logger.critical(f"Unexpected error loading settings: {e}")
             sys.exit(1)
 
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Clear the memoized values returned by `get`.
+
+        Settings are parsed once per load and every lookup is memoized, so the memo has to be
+        cleared whenever the data is replaced; `load` does this itself.
+        """
+        cls.get.cache_clear()
+
     @classmethod
     def _validate_required_settings(cls) -> None:
         """
@@ -236,7 +246,7 @@ class Localization:
         Raises:
             FileNotFoundError: If the localization directory does not exist.
             ValueError: If a localization file does not match a valid locale.
-            json.JSONDecodeError: If a localization file contains invalid JSON.
+            orjson.JSONDecodeError: If a localization file contains invalid JSON.
             ValidationError: If a localization file fails validation against the model.
 
         Logs:
@@ -275,20 +285,19 @@ class Localization:
 
                 try:
                     # Read and parse the JSON file
-                    with json_file.open("r", encoding="utf-8") as file:
-                        data = json.load(file)
+                    data = orjson.loads(json_file.read_bytes())
 
-                        # Add locale to the data for validation
-                        data["locale"] = locale_name
+                    # Add locale to the data for validation
+                    data["locale"] = locale_name
 
-                        # Validate and create model instance
-                        loader = LocalizationData(**data)
+                    # Validate and create model instance
+                    loader = LocalizationData(**data)
 
-                        # Store in the data dictionary
-                        cls._data[locale] = loader
-                        logger.debug(f"Loaded localization for {locale_name}")
+                    # Store in the data dictionary
+                    cls._data[locale] = loader
+                    logger.debug("Loaded localization for %s", locale_name)
 
-                except json.JSONDecodeError as e:
+                except orjson.JSONDecodeError as e:
                     logger.error(f"Invalid JSON in localization file {json_file.name}: {e}")
                 except ValidationError as e:
                     logger.error(f"Validation error in localization file {json_file.name}:")
@@ -40,7 +40,7 @@ def fetch_files_with_extension(folder_path: Path, file_extension: str) -> dict[s
         >>> print(files)
         ... {'document': PosixPath('/path/to/folder/document.txt')}
     """
-    logger.debug(f"Scanning folder: {folder_path} for files with extension: .{file_extension}")
+    logger.debug("Scanning folder: %s for files with extension: .%s", folder_path, file_extension)
 
     if not folder_path.exists() or not folder_path.is_dir():
         error_msg = f"The folder path '{folder_path}' does not exist or is not a directory."
@@ -59,7 +59,10 @@ def fetch_files_with_extension(folder_path: Path, file_extension: str) -> dict[s
             if file_path.suffix == f".{file_extension}"
         }
         logger.debug(
-            f"Found {len(file_paths_dict)} files with extension '.{file_extension}' in {folder_path}"
+            "Found %s files with extension '.%s' in %s",
+            len(file_paths_dict),
+            file_extension,
+            folder_path,
         )
         return file_paths_dict
     except Exception as e:
@@ -87,7 +90,7 @@ def fetch_available_locales() -> list[hikari.Locale]:
         ... [<Locale.EN_US: 'en-US'>, <Locale.TR: 'tr'>]
     """
 
-    logger.debug(f"Fetching supported locales from {LOCALIZATION_PATH}")
+    logger.debug("Fetching supported locales from %s", LOCALIZATION_PATH)
 
     if not LOCALIZATION_PATH.exists() or not LOCALIZATION_PATH.is_dir():
         error_msg: str = f"{LOCALIZATION_PATH} does not exist or is not a directory."
@@ -109,7 +112,7 @@ def fetch_available_locales() -> list[hikari.Locale]:
             if locale_name in locale_value_map:
                 supported_locales.append(locale_value_map[locale_name])
 
-        logger.debug(f"Found {len(supported_locales)} supported locales: {supported_locales}")
+        logger.debug("Found %s supported locales: %s", len(supported_locales), supported_locales)
         return supported_locales
 
     except Exception as e:
@@ -41,7 +41,10 @@ def websocket_action(
 
             # Only log at debug level instead of info to reduce noise
             logger.debug(
-                f"WebSocket action '{action_name}' registered: {func.__module__}.{func.__name__}"
+                "WebSocket action '%s' registered: %s.%s",
+                action_name,
+                func.__module__,
+                func.__name__,
             )
         return func
 
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from logging import Logger
 from typing import Awaitable, Callable, Final, TypeVar
@@ -9,8 +10,8 @@ from core import GlobalState
 from database.schemas import PunishmentLogSchema, TemporaryActionSchema
 from database.services import PunishmentLogService, TemporaryActionService, UserService
 from debug import get_logger
-from helper import MessageHelper, PunishmentHelper, TimeHelper, UserHelper
-from model import MessageKeys, PunishmentSource, PunishmentType, SecretKeys
+from helper import PunishmentHelper, TimeHelper, UnbanScheduler, UserHelper
+from model import PunishmentSource, PunishmentType, SecretKeys
 from settings import Settings
 
 from ...action_registry import websocket_action
@@ -20,6 +21,8 @@ logger: Logger = get_logger(__name__)
 
 # Discord's maximum timeout duration (28 days in seconds)
 MAX_TIMEOUT_DURATION: Final[int] = 2419200
+# The same duration as a timedelta, built once for refresh time arithmetic
+MAX_TIMEOUT_DELTA: Final[timedelta] = timedelta(seconds=MAX_TIMEOUT_DURATION)
 T = TypeVar("T")
 
 
@@ -56,7 +59,7 @@ async def log_punishment(
     expires_at: datetime | None = None,
 ) -> None:
     """Create a punishment log entry with consistent parameters."""
-    await PunishmentLogService.create_or_update_punishment_log(
+    await PunishmentLogService.write_punishment_log(
         PunishmentLogSchema(
             user_id=user_id,
             punishment_type=punishment_type,
@@ -69,91 +72,95 @@ async def log_punishment(
     )
 
 
+async def _timeout_expired(user_id: int, action_id: int) -> None:
+    """Task to clean up a timeout once its final period ends."""
+    await TemporaryActionService.delete_temporary_action(action_id)
+    GlobalState.tasks.remove_task(user_id, PunishmentType.TIMEOUT)
+
+
 async def _refresh_timeout_task(
-    client: lightbulb.Client,
-    target_member: hikari.Member,
-    punishment: TemporaryActionSchema,
+    guild_id: int,
+    user_id: int,
+    action_id: int,
+    expires_at: datetime,
     refresh_time: datetime,
     reason: str,
 ) -> None:
-    """Task to refresh a timeout that needs to be extended beyond Discord's maximum duration."""
-    assert punishment.id is not None
-    assert punishment.expires_at is not None
-
-    now = datetime.now(timezone.utc)
+    """
+    Task to refresh a timeout that needs to be extended beyond Discord's maximum duration.
 
+    Only IDs, times and the reason are passed in, so a pending refresh does not keep member
+    objects alive for the up to 28 days it waits.
+    """
     # Check if we still need to keep the timeout active
-    if refresh_time < punishment.expires_at:
-        remaining_seconds = (punishment.expires_at - refresh_time).total_seconds()
+    if refresh_time < expires_at:
+        remaining_seconds = (expires_at - refresh_time).total_seconds()
+        rest = GlobalState.bot.get_client().rest
 
         if remaining_seconds > MAX_TIMEOUT_DURATION:
-            next_refresh = now + timedelta(seconds=MAX_TIMEOUT_DURATION)
-
-            updated_punishment = await TemporaryActionService.create_or_update_temporary_action(
-                TemporaryActionSchema(
-                    id=punishment.id,
-                    user_id=punishment.user_id,
-                    punishment_type=PunishmentType.TIMEOUT,
-                    expires_at=punishment.expires_at,
-                    refresh_at=next_refresh,
-                )
+            next_refresh = refresh_time + MAX_TIMEOUT_DELTA
+
+            # Still exceeds max timeout, so apply max timeout while making sure refresh_at is
+            # properly set, then schedule another refresh; the write and edit are independent
+            await asyncio.gather(
+                TemporaryActionService.create_or_update_temporary_action(
+                    TemporaryActionSchema(
+                        id=action_id,
+                        user_id=user_id,
+                        punishment_type=PunishmentType.TIMEOUT,
+                        expires_at=expires_at,
+                        refresh_at=next_refresh,
+                    )
+                ),
+                rest.edit_member(
+                    guild_id, user_id, communication_disabled_until=next_refresh, reason=reason
+                ),
             )
 
-            await target_member.edit(
-                communication_disabled_until=next_refresh,
-                reason=reason,
-            )
-
-            # Schedule next refresh task
-            @client.task(lightbulb.uniformtrigger(seconds=MAX_TIMEOUT_DURATION), max_invocations=1)
-            async def next_refresh_timeout() -> None:
-                await _refresh_timeout_task(
-                    client, target_member, updated_punishment, next_refresh, reason
-                )
-
-            GlobalState.tasks.add_or_refresh_task(
-                target_member, PunishmentType.TIMEOUT, next_refresh_timeout
+            # Schedule next refresh task for when the applied timeout ends; counting from now
+            # rather than the planned refresh time keeps a late run from letting the timeout lapse
+            GlobalState.tasks.schedule(
+                user_id,
+                PunishmentType.TIMEOUT,
+                (next_refresh - datetime.now(timezone.utc)).total_seconds(),
+                lambda: _refresh_timeout_task(
+                    guild_id, user_id, action_id, expires_at, next_refresh, reason
+                ),
             )
         else:
             # Final timeout period is less than max, set exact expiry time
-            await TemporaryActionService.create_or_update_temporary_action(
-                TemporaryActionSchema(
-                    id=punishment.id,
-                    user_id=punishment.user_id,
-                    punishment_type=PunishmentType.TIMEOUT,
-                    expires_at=punishment.expires_at,
-                    refresh_at=None,
-                )
-            )
-
-            await target_member.edit(
-                communication_disabled_until=punishment.expires_at,
-                reason=reason,
+            await asyncio.gather(
+                TemporaryActionService.create_or_update_temporary_action(
+                    TemporaryActionSchema(
+                        id=action_id,
+                        user_id=user_id,
+                        punishment_type=PunishmentType.TIMEOUT,
+                        expires_at=expires_at,
+                        refresh_at=None,
+                    )
+                ),
+                rest.edit_member(
+                    guild_id, user_id, communication_disabled_until=expires_at, reason=reason
+                ),
             )
 
             # Schedule the final cleanup task
-            delay = int(remaining_seconds)
-
-            @client.task(lightbulb.uniformtrigger(seconds=delay), max_invocations=1)
-            async def timeout_expired() -> None:
-                assert punishment.id is not None
-                await TemporaryActionService.delete_temporary_action(punishment.id)
-                GlobalState.tasks.remove_task(target_member, PunishmentType.TIMEOUT)
-
-            GlobalState.tasks.add_or_refresh_task(
-                target_member, PunishmentType.TIMEOUT, timeout_expired
+            GlobalState.tasks.schedule(
+                user_id,
+                PunishmentType.TIMEOUT,
+                (expires_at - datetime.now(timezone.utc)).total_seconds(),
+                lambda: _timeout_expired(user_id, action_id),
             )
 
 
 async def _handle_extended_timeout(
-    client: lightbulb.Client,
     target_member: hikari.Member,
     now: datetime,
     expires_at: datetime,
     reason: str,
 ) -> None:
     """Handle timeouts longer than Discord's maximum allowable duration."""
-    initial_timeout_end = now + timedelta(seconds=MAX_TIMEOUT_DURATION)
+    initial_timeout_end = now + MAX_TIMEOUT_DELTA
 
     punishment = await TemporaryActionService.create_or_update_temporary_action(
         TemporaryActionSchema(
@@ -163,18 +170,23 @@ async def _handle_extended_timeout(
             refresh_at=initial_timeout_end,
         )
     )
+    assert punishment.id is not None
 
     await target_member.edit(communication_disabled_until=initial_timeout_end, reason=reason)
 
-    @client.task(lightbulb.uniformtrigger(seconds=MAX_TIMEOUT_DURATION), max_invocations=1)
-    async def refresh_timeout() -> None:
-        await _refresh_timeout_task(client, target_member, punishment, initial_timeout_end, reason)
-
-    GlobalState.tasks.add_or_refresh_task(target_member, PunishmentType.TIMEOUT, refresh_timeout)
+    # Capture only the IDs the refresh needs, not the member
+    guild_id, user_id, action_id = target_member.guild_id, target_member.id, punishment.id
+    GlobalState.tasks.schedule(
+        user_id,
+        PunishmentType.TIMEOUT,
+        MAX_TIMEOUT_DURATION,
+        lambda: _refresh_timeout_task(
+            guild_id, user_id, action_id, expires_at, initial_timeout_end, reason
+        ),
+    )
 
 
 async def _apply_timeout(
-    client: lightbulb.Client,
     executor: hikari.User,
     target_member: hikari.Member,
     parsed_duration: timedelta,
@@ -197,7 +209,7 @@ async def _apply_timeout(
 
     # Apply timeout with handling for durations longer than Discord's maximum
     if parsed_duration.total_seconds() > MAX_TIMEOUT_DURATION:
-        await _handle_extended_timeout(client, target_member, now, expires_at, reason)
+        await _handle_extended_timeout(target_member, now, expires_at, reason)
     else:
         # Set timeout for the requested duration
         await target_member.edit(communication_disabled_until=expires_at, reason=reason)
@@ -251,7 +263,7 @@ async def _handle_tempban(
     if not target_member:
         return
 
-    parsed_duration = TimeHelper(hikari.Locale.EN_US).parse_time_string(duration)
+    parsed_duration = TimeHelper.for_locale(hikari.Locale.EN_US).parse_time_string(duration)
     if parsed_duration.total_seconds() < 0:
         return
 
@@ -265,27 +277,11 @@ async def _handle_tempban(
         )
     )
 
-    @client.task(
-        lightbulb.uniformtrigger(seconds=int(parsed_duration.total_seconds())),
-        max_invocations=1,
-    )
-    async def handle_temporary_ban() -> None:
-        try:
-            # Remove the ban when time period completes
-            await target_member.unban(
-                reason=MessageHelper(key=MessageKeys.general.NO_REASON)._decode_plain()
-            )
-
-            # Remove temporary action record from database after completion
-            if temporary_action.id is not None:
-                await TemporaryActionService.delete_temporary_action(temporary_action.id)
-
-            # Remove the task from global state to prevent re-execution
-            GlobalState.tasks.remove_task(target_member, PunishmentType.BAN)
-        except Exception as e:
-            logger.error(f"Error in temporary ban handler: {e}")
-
-    GlobalState.tasks.add_or_refresh_task(target_member, PunishmentType.BAN, handle_temporary_ban)
+    # Queue the automatic unban for when the duration expires
+    if temporary_action.id is not None:
+        UnbanScheduler.schedule(
+            target_member.id, target_member.guild_id, expires_at, temporary_action.id
+        )
 
     await log_punishment(
         user_id=target_member.id,
@@ -348,12 +344,12 @@ async def _handle_timeout(
     if not target_member:
         return
 
-    parsed_duration = TimeHelper(hikari.Locale.EN_US).parse_time_string(duration)
+    parsed_duration = TimeHelper.for_locale(hikari.Locale.EN_US).parse_time_string(duration)
 
     if parsed_duration.total_seconds() < 0:
         return
 
-    await _apply_timeout(client, executor, target_member, parsed_duration, reason)
+    await _apply_timeout(executor, target_member, parsed_duration, reason)
 
 
 async def _handle_untimeout(executor: hikari.User, target: hikari.User, reason: str) -> None:
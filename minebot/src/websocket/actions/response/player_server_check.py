@@ -4,6 +4,7 @@ from core import GlobalState
 from debug import get_logger
 
 from ...action_registry import websocket_action
+from ...manager import WebSocketManager
 from ...schemas.response import PlayerServerCheckSchema
 
 logger: Logger = get_logger(__name__)
@@ -12,7 +13,10 @@ logger: Logger = get_logger(__name__)
 @websocket_action("player-server-check", PlayerServerCheckSchema)
 async def player_server_check(data: PlayerServerCheckSchema) -> None:
     logger.debug(
-        f"Received player status check request: username={data.username}, uuid={data.uuid}, server={data.server}"
+        "Received player status check request: username=%s, uuid=%s, server=%s",
+        data.username,
+        data.uuid,
+        data.server,
     )
 
     # Validate the provided username or UUID
@@ -23,3 +27,6 @@ async def player_server_check(data: PlayerServerCheckSchema) -> None:
             )  # Assign server to username
         if data.uuid:
             GlobalState.minecraft.add_player_server(data.uuid, data.server)  # Assign server to UUID
+
+    # Let the caller waiting for this response continue right away
+    WebSocketManager.notify_response(data.action, data.username, data.uuid)
@@ -4,6 +4,7 @@ from core import GlobalState
 from debug import get_logger
 
 from ...action_registry import websocket_action
+from ...manager import WebSocketManager
 from ...schemas.response import PlayerStatusCheckSchema
 
 logger: Logger = get_logger(__name__)
@@ -12,7 +13,10 @@ logger: Logger = get_logger(__name__)
 @websocket_action("player-status-check", PlayerStatusCheckSchema)
 async def player_status_check(data: PlayerStatusCheckSchema) -> None:
     logger.debug(
-        f"Received player status check request: username={data.username}, uuid={data.uuid}, online={data.online}"
+        "Received player status check request: username=%s, uuid=%s, online=%s",
+        data.username,
+        data.uuid,
+        data.online,
     )
 
     # Validate the provided username or UUID
@@ -20,3 +24,6 @@ async def player_status_check(data: PlayerStatusCheckSchema) -> None:
         GlobalState.minecraft.add_online_player(data.username)  # Assign username to online players
         GlobalState.minecraft.add_online_player(data.uuid)  # Assign UUID to online players
         GlobalState.minecraft.add_player_uuid(data.username, data.uuid)  # Map username to UUID
+
+    # Let the caller waiting for this response continue right away
+    WebSocketManager.notify_response(data.action, data.username, data.uuid)
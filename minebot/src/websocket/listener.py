@@ -1,9 +1,9 @@
 import asyncio
 import inspect
-import json
 from logging import Logger
 from typing import Any, Callable
 
+import orjson
 from pydantic import BaseModel, ValidationError
 from websockets import ServerConnection
 
@@ -50,7 +50,7 @@ async def handle_connection(websocket: ServerConnection) -> None:
         return
 
     # Keep connections at debug level
-    logger.debug(f"WebSocket connection established [id={client_id}]")
+    logger.debug("WebSocket connection established [id=%s]", client_id)
 
     # Set authentication deadline
     auth_deadline = asyncio.create_task(asyncio.sleep(3))
@@ -65,7 +65,7 @@ async def handle_connection(websocket: ServerConnection) -> None:
                 return
 
             try:
-                data: dict[str, Any] = json.loads(message)
+                data: dict[str, Any] = orjson.loads(message)
                 action: Any | None = data.get("action")
 
                 if not action:
@@ -80,7 +80,7 @@ async def handle_connection(websocket: ServerConnection) -> None:
                     continue
 
                 # Use debug level for routine message handling
-                logger.debug(f"Received '{action}' action [client={client_id}]")
+                logger.debug("Received '%s' action [client=%s]", action, client_id)
 
                 action_info: dict[str, Any] | None = action_handlers.get(action)
                 if action_info:
@@ -124,7 +124,7 @@ async def handle_connection(websocket: ServerConnection) -> None:
                 else:
                     logger.warning(f"No handler registered for action: {action}")
 
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 logger.error(f"Received invalid JSON [client={client_id}]: {message[:100]}")
             except Exception as e:
                 logger.error(
@@ -145,4 +145,4 @@ async def handle_connection(websocket: ServerConnection) -> None:
         GlobalState.minecraft.clear_servers()
 
         # Keep connections at debug level, not info
-        logger.debug(f"WebSocket connection closed [id={client_id}]")
+        logger.debug("WebSocket connection closed [id=%s]", client_id)
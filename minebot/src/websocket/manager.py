@@ -1,7 +1,8 @@
-import json
+import asyncio
 from logging import Logger
 from typing import Any
 
+import orjson
 from pydantic import BaseModel
 from websockets import ConnectionClosed
 
@@ -11,6 +12,9 @@ from .listener import authenticated_client
 
 logger: Logger = get_logger(__name__)
 
+# Callers waiting for a response, keyed by the response action and the player identifier
+_response_waiters: dict[tuple[str, str], set[asyncio.Future[None]]] = {}
+
 
 class WebSocketManager:
     @staticmethod
@@ -32,14 +36,16 @@ class WebSocketManager:
         websocket, _ = authenticated_client[client_id]
 
         try:
-            # Convert BaseModel to dict before serializing
+            # Serialize straight to UTF-8 bytes; pydantic's own serializer beats dumping to a
+            # dict for orjson, and sending the bytes as a text frame skips a decode/encode pass
+            message: bytes
             if isinstance(data, BaseModel):
-                message = data.model_dump_json()
+                message = data.__pydantic_serializer__.to_json(data)
             else:
-                message = json.dumps(data)
+                message = orjson.dumps(data)
 
-            await websocket.send(message)
-            logger.debug(f"Message successfully sent to client {client_id}")
+            await websocket.send(message, text=True)
+            logger.debug("Message successfully sent to client %s", client_id)
             return True
         except ConnectionClosed:
             logger.warning(
@@ -49,3 +55,58 @@ class WebSocketManager:
             logger.error(f"Failed to send message to client {client_id}: {str(e)}", exc_info=True)
 
         return False
+
+    @staticmethod
+    async def send_and_wait(
+        data: BaseModel, action: str, identifier: str, response_timeout: float
+    ) -> bool:
+        """
+        Send a request to the authenticated client and wait for its response to be handled.
+
+        The wait ends as soon as the response handler for the action reports the identifier,
+        rather than always sleeping for the whole timeout.
+
+        Args:
+            data: The request to send
+            action: The action of the expected response
+            identifier: The player username or UUID the response is expected for
+            response_timeout: Maximum time to wait for the response, in seconds
+
+        Returns:
+            True if the response arrived in time, False otherwise
+        """
+        key = (action, identifier)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        waiters = _response_waiters.setdefault(key, set())
+        waiters.add(future)
+
+        try:
+            if not await WebSocketManager.send_message(data):
+                return False
+
+            await asyncio.wait_for(future, response_timeout)
+            return True
+        except asyncio.TimeoutError:
+            logger.debug("No %s response for %s within %ss", action, identifier, response_timeout)
+            return False
+        finally:
+            waiters.discard(future)
+            if not waiters and _response_waiters.get(key) is waiters:
+                del _response_waiters[key]
+
+    @staticmethod
+    def notify_response(action: str, *identifiers: str | None) -> None:
+        """
+        Wake the callers waiting for a response of the action about any of the identifiers.
+
+        Args:
+            action: The action of the handled response
+            identifiers: The player usernames or UUIDs the response carried
+        """
+        for identifier in identifiers:
+            if identifier is None:
+                continue
+
+            for future in _response_waiters.get((action, identifier), ()):
+                if not future.done():
+                    future.set_result(None)
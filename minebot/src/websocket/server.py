@@ -67,7 +67,7 @@ class WebSocketServer:
 
             # Check if certificates already exist
             if key_file.exists() and cert_file.exists():
-                logger.debug(f"Using existing SSL certificates in {cert_path}")
+                logger.debug("Using existing SSL certificates in %s", cert_path)
                 return str(cert_file), str(key_file)
 
             logger.debug("Generating new self-signed SSL certificate")
@@ -124,7 +124,7 @@ class WebSocketServer:
             with open(cert_file, "wb") as f:
                 f.write(cert.public_bytes(serialization.Encoding.PEM))
 
-            logger.debug(f"Generated SSL certificates in {cert_path}")
+            logger.debug("Generated SSL certificates in %s", cert_path)
             return str(cert_file), str(key_file)
 
         except ImportError:
@@ -157,7 +157,7 @@ class WebSocketServer:
                 return None
 
             # Create and configure SSL context
-            logger.debug(f"Setting up SSL context with cert: {cert_file}, key: {key_file}")
+            logger.debug("Setting up SSL context with cert: %s, key: %s", cert_file, key_file)
             ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
 
             # Load the certificate